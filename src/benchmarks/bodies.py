@@ -0,0 +1,126 @@
+"""Compares scene updates with rigid bodies as objects and in a `BodyStorage`, and bullets in a `ProjectilePool`.
+
+A scene with the map, a few players and a number of bullets flying across
+it, each looking for a hit every update, is updated once with every body
+keeping its own vectors and once with the scene's body storage, and the
+updates per second are reported for both. The same bullets are then run
+in a `ProjectilePool`, on a scene without the body storage as the game's,
+with a new bullet fired for every one that goes away.
+
+Run from the src directory:
+
+    python -m benchmarks.bodies [--map mario] [--seconds 2] [--bullets 0 100 500 2000]
+"""
+
+import os
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from pygame import Vector2
+
+from engine import Scene, GameObject, Component, Transform, BoxCollider, RigidBody, Tilemap, ProjectilePool
+from connection.map_transfer import MAP_DIR
+from game.consts import MAP_SCALE, PLAYER_SIZE, PLAYER_DRAG, PLAYER_GRAVITY, BULLET_SIZE
+
+
+STEP = 1 / 60
+PLAYERS = 8
+BULLET_SPEED = 1200  # pixels per second, about the speed of a pistol bullet
+
+
+class HitCheck(Component):
+    """Looks for a hit every update like bullets as objects did, but keeps the bullet, so the count stays the same."""
+
+    def update(self, dt: float) -> None:
+        self.parent.get_component(BoxCollider).is_colliding()
+
+
+def build_scene(map_name: str, bullets: int, body_storage: bool, pool: bool = False, seed: int = 0) -> Scene:
+    rng = random.Random(seed)
+    scene = Scene(body_storage=body_storage)
+
+    map_object = GameObject("Map")
+    map_object.add_component(Transform(scale=MAP_SCALE))
+    map_object.add_component(Tilemap(f"{MAP_DIR}/{map_name}.tmx", load_images=False))
+    scene.add(map_object)
+
+    width, height = PLAYER_SIZE
+    for i in range(PLAYERS):
+        body = GameObject(f"Player ({i})")
+        body.add_component(Transform(position=Vector2(200 + i * 100, 100)))
+        body.add_component(BoxCollider(width=width, height=height, offset=(-width / 2, -height)))
+        body.add_component(RigidBody(drag=PLAYER_DRAG, gravity=PLAYER_GRAVITY))
+        scene.add(body)
+
+    if pool:
+        # Set up like GameScene does, and fire again whenever a bullet hits something
+        projectiles = GameObject("Bullets")
+        projectiles.add_component(Transform(scale=2, z_index=2))
+        projectile_pool = projectiles.add_component(ProjectilePool("assets/img/bullet.png", size=(BULLET_SIZE, BULLET_SIZE)))
+        scene.add(projectiles)
+
+        def fire(_=None) -> None:
+            velocity = Vector2(BULLET_SPEED, 0).rotate(rng.uniform(0, 360))
+            projectile_pool.spawn((rng.uniform(0, 1500), rng.uniform(0, 700)), velocity, float("inf"))
+
+        projectile_pool.on_despawn = fire
+        for _ in range(bullets):
+            fire()
+
+        return scene
+
+    # Set up like bullets as objects were, without the sprite and with a bullet that never goes away
+    for i in range(bullets):
+        bullet = GameObject(f"Bullet {i}")
+        bullet.add_component(Transform(position=Vector2(rng.uniform(0, 1500), rng.uniform(0, 700))))
+        bullet.add_component(BoxCollider(width=10, height=10, is_trigger=True))
+        rigid_body = bullet.add_component(RigidBody(gravity=0, drag=0, is_trigger=True, continuous=True))
+        bullet.add_component(HitCheck())
+        scene.add(bullet)
+        rigid_body.add_impulse(Vector2(BULLET_SPEED, 0).rotate(rng.uniform(0, 360)))
+
+    return scene
+
+
+def run(map_name: str, bullets: int, body_storage: bool, seconds: float, pool: bool = False) -> float:
+    """Updates the scene for `seconds` and returns the updates per second."""
+
+    scene = build_scene(map_name, bullets, body_storage, pool)
+
+    updates = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        scene._fixed_update(STEP)
+        scene._update(STEP)
+        updates += 1
+
+    return updates / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scene updates per second with and without body storage, and with a projectile pool.")
+    parser.add_argument("--map", default="mario", help="the map the bodies move on")
+    parser.add_argument("--seconds", type=float, default=2, help="how long to run each case")
+    parser.add_argument("--bullets", type=int, nargs="+", default=[0, 100, 500, 2000], help="the bullet counts to run")
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1280, 720))
+
+    print(f"map={args.map} players={PLAYERS} target={1 / STEP:.0f} updates/s")
+    print(f"{'bullets':>8} {'objects':>10} {'storage':>10} {'speedup':>8} {'pool':>10} {'speedup':>8}")
+    for bullets in args.bullets:
+        objects = run(args.map, bullets, False, args.seconds)
+        storage = run(args.map, bullets, True, args.seconds)
+        pool = run(args.map, bullets, False, args.seconds, pool=True)
+        print(f"{bullets:>8} {objects:>10.0f} {storage:>10.0f} {storage / objects:>7.2f}x {pool:>10.0f} {pool / objects:>7.2f}x")
+
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
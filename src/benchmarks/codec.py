@@ -0,0 +1,474 @@
+"""Measures the packet codec: encoding, decoding, dispatch, garbage and the server's relay path.
+
+Every packet class in the registry is encoded and decoded from a sample
+value, and decoded again through `Packet.from_bytes` to time the dispatch
+on the id byte. Malformed datagrams, made by mutating the samples, are
+decoded to see how fast garbage is turned away and whether anything other
+than a ValueError escapes a decoder. Last, datagrams are fed to a `Server`
+whose socket only records what it sends, to time a relayed packet from
+the bytes arriving to the bytes leaving for every other player.
+
+Times are the best per-operation average over several repeats, in
+nanoseconds. Allocations are the memory blocks an operation leaves alive
+and the peak bytes it allocates on the way.
+
+Run from the src directory:
+
+    python -m benchmarks.codec [--output codec.json]
+    python -m benchmarks.codec --baseline codec.json [--threshold 0.1]
+
+With a baseline, every result is compared with it, and the exit status is
+1 if any time got slower than the threshold allows, or any operation
+leaves a whole block more alive per call.
+"""
+
+import gc
+import sys
+import json
+import timeit
+import random
+import logging
+import argparse
+import platform
+import tracemalloc
+from typing import Any, Callable
+
+from pygame import Vector2
+
+from connection.server import Server
+from connection.cookies import NO_COOKIE, COOKIE_SIZE
+from connection.map_transfer import CHUNK_SIZE
+from connection.packets.packet import PacketMeta
+from connection.packets import (
+    Packet,
+    PacketStatusInPing,
+    PacketStatusOutPong,
+    PacketPlayInJoin,
+    PacketPlayOutWelcome,
+    PacketPlayInDisconnect,
+    PacketPlayInKeepAlive,
+    PacketPlayOutKeepAlive,
+    PacketPlayOutPlayerJoin,
+    PacketPlayOutPlayerMove,
+    PacketPlayInPlayerMove,
+    PacketPlayOutPlayerLeave,
+    PacketPlayInChangeCharacter,
+    PacketPlayOutChangeCharacter,
+    PacketPlayInStartGame,
+    PacketPlayOutStartGame,
+    PacketPlayInAddItem,
+    PacketPlayInItemPickup,
+    PacketPlayOutAddItem,
+    PacketPlayOutItemPickup,
+    PacketPlayInItemDrop,
+    PacketPlayOutItemDrop,
+    PacketPlayInPlayerLook,
+    PacketPlayOutPlayerLook,
+    PacketPlayInShoot,
+    PacketPlayOutShoot,
+    PacketPlayInPlayerState,
+    PacketPlayOutPlayerState,
+    PacketPlayInFireStart,
+    PacketPlayOutFireStart,
+    PacketPlayInFireStop,
+    PacketPlayOutFireStop,
+    PacketPlayOutReliable,
+    PacketPlayInReliableAck,
+    PacketPlayInMapRequest,
+    PacketPlayOutMapChunk,
+    PacketPlayOutDefineSymbol,
+    PacketPlayInSpectate,
+    PacketPlayOutSnapshot,
+    PlayerSnapshot,
+    PacketPlayOutChallenge,
+    PacketPlayOutBundle,
+    PacketPlayOutWorldState,
+    WorldState,
+    WorldPlayer,
+    WorldItem,
+    PacketPlayOutPlayerHit,
+    PacketPlayInReliable,
+    PacketPlayOutReliableAck,
+)
+from connection.packets.play.client.player_die import PacketPlayInPlayerDie
+from connection.packets.play.server.player_die import PacketPlayOutPlayerDie
+
+
+RELAY_PLAYERS = 8  # clients joined to the relay server, one sends and the others receive
+FUZZ_DATAGRAMS = 2000  # malformed datagrams decoded per repeat
+
+POSITION = Vector2(412.5, 230.25)
+VELOCITY = Vector2(-310.0, 42.5)
+ACCELERATION = Vector2(-1700.0, 0.0)
+
+# A typical value of every packet, built the way the game builds it
+SAMPLES: dict[type[Packet], Callable[[], Packet]] = {
+    PacketStatusInPing: lambda: PacketStatusInPing(),
+    PacketStatusOutPong: lambda: PacketStatusOutPong(name="Sala do Italo", port=25565),
+    PacketPlayInJoin: lambda: PacketPlayInJoin(name="italoseara", cookie=bytes(range(COOKIE_SIZE))),
+    PacketPlayOutWelcome: lambda: PacketPlayOutWelcome(True, 421337, "Welcome to the server!"),
+    PacketPlayInDisconnect: lambda: PacketPlayInDisconnect(),
+    PacketPlayInKeepAlive: lambda: PacketPlayInKeepAlive(value=123456),
+    PacketPlayOutKeepAlive: lambda: PacketPlayOutKeepAlive(value=123456),
+    PacketPlayOutPlayerJoin: lambda: PacketPlayOutPlayerJoin(player_id=421337, name=0),
+    PacketPlayOutPlayerMove: lambda: PacketPlayOutPlayerMove(421337, POSITION, ACCELERATION, VELOCITY),
+    PacketPlayInPlayerMove: lambda: PacketPlayInPlayerMove(POSITION, ACCELERATION, VELOCITY),
+    PacketPlayOutPlayerLeave: lambda: PacketPlayOutPlayerLeave(player_id=421337),
+    PacketPlayInChangeCharacter: lambda: PacketPlayInChangeCharacter(character_index=7),
+    PacketPlayOutChangeCharacter: lambda: PacketPlayOutChangeCharacter(player_id=421337, character_index=7),
+    PacketPlayInStartGame: lambda: PacketPlayInStartGame(map_name="mario"),
+    PacketPlayOutStartGame: lambda: PacketPlayOutStartGame(map_name=2, map_digest=bytes(range(32)), map_size=48213),
+    PacketPlayInAddItem: lambda: PacketPlayInAddItem(gun_type=1, position=POSITION),
+    PacketPlayInItemPickup: lambda: PacketPlayInItemPickup(object_id=17),
+    PacketPlayOutAddItem: lambda: PacketPlayOutAddItem(gun_type=1, position=POSITION, object_id=17),
+    PacketPlayOutItemPickup: lambda: PacketPlayOutItemPickup(player_id=421337, gun_type=1, object_id=17),
+    PacketPlayInItemDrop: lambda: PacketPlayInItemDrop(),
+    PacketPlayOutItemDrop: lambda: PacketPlayOutItemDrop(player_id=421337),
+    PacketPlayInPlayerLook: lambda: PacketPlayInPlayerLook(angle=137.5),
+    PacketPlayOutPlayerLook: lambda: PacketPlayOutPlayerLook(player_id=421337, angle=137.5),
+    PacketPlayInShoot: lambda: PacketPlayInShoot(gun_type=1, angle=137.5, position=POSITION),
+    PacketPlayOutShoot: lambda: PacketPlayOutShoot(player_id=421337, gun_type=1, angle=137.5, position=POSITION),
+    PacketPlayInPlayerDie: lambda: PacketPlayInPlayerDie(),
+    PacketPlayOutPlayerDie: lambda: PacketPlayOutPlayerDie(player_id=421337),
+    PacketPlayInPlayerState: lambda: PacketPlayInPlayerState(POSITION, VELOCITY, ACCELERATION, 137.5, True),
+    PacketPlayOutPlayerState: lambda: PacketPlayOutPlayerState(421337, POSITION, VELOCITY, ACCELERATION, 137.5, True),
+    PacketPlayInFireStart: lambda: PacketPlayInFireStart(gun_type=1, seed=987654, start_tick=5120, angle=137.5),
+    PacketPlayOutFireStart: lambda: PacketPlayOutFireStart(421337, gun_type=1, seed=987654, start_tick=5120, angle=137.5),
+    PacketPlayInFireStop: lambda: PacketPlayInFireStop(start_tick=5120, shot_count=12),
+    PacketPlayOutFireStop: lambda: PacketPlayOutFireStop(player_id=421337, start_tick=5120, shot_count=12),
+    PacketPlayOutReliable: lambda: PacketPlayOutReliable(sequence=812, packet=PacketPlayOutPlayerDie(player_id=421337)),
+    PacketPlayInReliableAck: lambda: PacketPlayInReliableAck(sequence=812),
+    PacketPlayInMapRequest: lambda: PacketPlayInMapRequest(digest=bytes(range(32)), offset=CHUNK_SIZE * 3),
+    PacketPlayOutMapChunk: lambda: PacketPlayOutMapChunk(offset=CHUNK_SIZE * 3, chunk=bytes(CHUNK_SIZE)),
+    PacketPlayOutDefineSymbol: lambda: PacketPlayOutDefineSymbol(symbol_id=3, symbol="italoseara"),
+    PacketPlayInSpectate: lambda: PacketPlayInSpectate(name="spectator", cookie=bytes(range(COOKIE_SIZE))),
+    PacketPlayOutSnapshot: lambda: PacketPlayOutSnapshot(tick=5120, players=[
+        PlayerSnapshot(player_id, POSITION, VELOCITY, 137.5, player_id % 2 == 0)
+        for player_id in range(RELAY_PLAYERS)
+    ]),
+    PacketPlayOutChallenge: lambda: PacketPlayOutChallenge(cookie=bytes(range(COOKIE_SIZE))),
+    PacketPlayOutBundle: lambda: PacketPlayOutBundle([
+        PacketPlayOutPlayerState(player_id, POSITION, VELOCITY, ACCELERATION, 137.5, False)
+        for player_id in range(RELAY_PLAYERS - 1)
+    ]),
+    PacketPlayOutWorldState: lambda: PacketPlayOutWorldState.split(WorldState(
+        map_name=2,
+        map_digest=bytes(range(32)),
+        map_size=48213,
+        players=[WorldPlayer(player_id, 0, 3, True, 1, POSITION, 137.5) for player_id in range(RELAY_PLAYERS)],
+        items=[WorldItem(object_id, 1, POSITION) for object_id in range(4)]
+    ))[0],
+    PacketPlayOutPlayerHit: lambda: PacketPlayOutPlayerHit(player_id=421337, shooter_id=73, health=65, angle=137.5),
+    PacketPlayInReliable: lambda: PacketPlayInReliable(sequence=812, packet=PacketPlayInItemPickup(object_id=1337)),
+    PacketPlayOutReliableAck: lambda: PacketPlayOutReliableAck(sequence=812),
+}
+
+# Packets a client sends all game long, and that the server hands on to the others
+RELAYED: dict[str, Callable[[], Packet]] = {
+    "player_state": SAMPLES[PacketPlayInPlayerState],
+    "player_look": SAMPLES[PacketPlayInPlayerLook],
+    "keep_alive": SAMPLES[PacketPlayInKeepAlive],
+}
+
+
+class RecordingSocket:
+    """Stands in for the server's socket: keeps the last datagram sent to each address."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.last: dict[tuple[str, int], bytes] = {}
+
+    def sendto(self, data: bytes, addr: tuple[str, int]) -> int:
+        self.sent += 1
+        self.last[addr] = data
+        return len(data)
+
+    def close(self) -> None:
+        pass
+
+
+def time_ns(operation: Callable[[], Any], number: int, repeat: int) -> float:
+    """The best average time of `operation` over `repeat` runs of `number` calls, in nanoseconds."""
+
+    return min(timeit.repeat(operation, number=number, repeat=repeat)) / number * 1e9
+
+
+def allocations(operation: Callable[[], Any], number: int) -> tuple[float, int]:
+    """Measures what `operation` allocates.
+
+    Returns:
+        tuple[float, int]: The memory blocks left alive per call, with the results
+            kept, and the most bytes a single call had allocated at once.
+    """
+
+    operation()
+    gc.collect()
+    gc.disable()
+    try:
+        results = [None] * number
+        before = sys.getallocatedblocks()
+        for i in range(number):
+            results[i] = operation()
+        blocks = (sys.getallocatedblocks() - before) / number
+        del results
+
+        tracemalloc.start()
+        peak = None
+        for _ in range(min(number, 100)):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operation()
+            call_peak = tracemalloc.get_traced_memory()[1] - current
+            peak = call_peak if peak is None else min(peak, call_peak)
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    return round(blocks, 2), peak
+
+
+def measure_packets(number: int, repeat: int) -> tuple[dict[str, dict], list[str]]:
+    """Encodes, decodes and dispatches the sample of every registered packet.
+
+    Returns:
+        tuple[dict[str, dict], list[str]]: The results by packet name, and the registered packets without a sample.
+    """
+
+    results = {}
+    missing = []
+    for packet_id, packet_class in sorted(PacketMeta.registry.items()):
+        factory = SAMPLES.get(packet_class)
+        if factory is None:
+            missing.append(packet_class.__name__)
+            continue
+
+        data = factory().to_bytes()
+        payload = data[1:]
+
+        encode = lambda: factory().to_bytes()
+        decode = lambda: packet_class.from_bytes(payload)
+        dispatch = lambda: Packet.from_bytes(data)
+
+        encode_blocks, encode_peak = allocations(encode, number)
+        decode_blocks, decode_peak = allocations(decode, number)
+        results[packet_class.__name__] = {
+            "id": packet_id,
+            "size": len(data),
+            "encode_ns": round(time_ns(encode, number, repeat), 1),
+            "decode_ns": round(time_ns(decode, number, repeat), 1),
+            "dispatch_ns": round(time_ns(dispatch, number, repeat), 1),
+            "encode_blocks": encode_blocks,
+            "encode_peak_bytes": encode_peak,
+            "decode_blocks": decode_blocks,
+            "decode_peak_bytes": decode_peak,
+        }
+
+    return results, missing
+
+
+def mutate(data: bytes, rng: random.Random) -> bytes:
+    """A malformed copy of a datagram: cut short, grown, with bytes flipped, or with another packet's id."""
+
+    data = bytearray(data)
+    match rng.randrange(4):
+        case 0:
+            data = data[:rng.randrange(len(data))]
+        case 1:
+            data.extend(rng.randbytes(rng.randint(1, 16)))
+        case 2:
+            for _ in range(rng.randint(1, 4)):
+                if len(data) > 1:
+                    data[rng.randrange(1, len(data))] = rng.randrange(256)
+        case 3:
+            data[0] = rng.choice(list(PacketMeta.registry))
+
+    return bytes(data)
+
+
+def measure_fuzz(number: int, repeat: int, seed: int = 0) -> dict[str, Any]:
+    """Decodes malformed datagrams through `Packet.from_bytes`, like the server's listener does."""
+
+    rng = random.Random(seed)
+    samples = [factory().to_bytes() for factory in SAMPLES.values()]
+    datagrams = [mutate(rng.choice(samples), rng) for _ in range(FUZZ_DATAGRAMS)]
+
+    # Anything but a ValueError is a decoder tripping over its input instead of refusing it
+    outcomes: dict[str, int] = {}
+    for data in datagrams:
+        try:
+            Packet.from_bytes(data)
+            outcome = "decoded"
+        except ValueError:
+            outcome = "rejected"
+        except Exception as e:
+            outcome = type(e).__name__
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def decode_all() -> None:
+        for data in datagrams:
+            try:
+                Packet.from_bytes(data)
+            except Exception:
+                pass
+
+    runs = max(1, number // FUZZ_DATAGRAMS)
+    return {
+        "datagrams": FUZZ_DATAGRAMS,
+        "ns": round(time_ns(decode_all, runs, repeat) / FUZZ_DATAGRAMS, 1),
+        "outcomes": dict(sorted(outcomes.items())),
+    }
+
+
+def relay_server(players: int) -> tuple[Server, RecordingSocket, list[tuple[str, int]]]:
+    """A server that never touches the network, with `players` clients joined the way real ones join."""
+
+    server = Server(name="benchmark", port=0)
+    server.sock.close()
+    server.discovery_server.sock.close()
+
+    sock = RecordingSocket()
+    server.sock = sock
+    server.running = True
+
+    addrs = [("10.0.0.1", 40000 + i) for i in range(players)]
+    for i, addr in enumerate(addrs):
+        server.on_packet_received(PacketPlayInJoin(name=f"player{i}", cookie=NO_COOKIE), addr)
+        challenge = Packet.from_bytes(sock.last[addr])
+        server.on_packet_received(PacketPlayInJoin(name=f"player{i}", cookie=challenge.cookie), addr)
+
+    return server, sock, addrs
+
+
+def measure_relay(number: int, repeat: int) -> dict[str, dict]:
+    """Times a datagram from one client through decoding, handling and the next send tick to the others."""
+
+    results = {}
+    for name, factory in RELAYED.items():
+        server, sock, addrs = relay_server(RELAY_PLAYERS)
+        sender = addrs[0]
+        data = factory().to_bytes()
+
+        # The keep alive is only accepted with the value the server asked for
+        if name == "keep_alive":
+            data = PacketPlayInKeepAlive(value=server.clients[sender].keep_alive_id).to_bytes()
+
+        def relay() -> None:
+            server.on_packet_received(Packet.from_bytes(data), sender)
+            server.send_updates()
+
+        relay()
+        sent_before = sock.sent
+        relay()
+        datagrams_out = sock.sent - sent_before
+        blocks, peak = allocations(relay, number)
+
+        results[name] = {
+            "size": len(data),
+            "datagrams_out": datagrams_out,
+            "ns": round(time_ns(relay, number, repeat), 1),
+            "blocks": blocks,
+            "peak_bytes": peak,
+        }
+        server.running = False
+
+    return results
+
+
+def run(number: int, repeat: int) -> dict[str, Any]:
+    packets, missing = measure_packets(number, repeat)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "number": number,
+        "repeat": repeat,
+        "packets": packets,
+        "missing": missing,
+        "fuzz": measure_fuzz(number, repeat),
+        "relay": measure_relay(number, repeat),
+    }
+
+
+def print_results(results: dict[str, Any]) -> None:
+    print(f"{'packet':<30} {'id':>4} {'size':>5} {'encode':>9} {'decode':>9} {'dispatch':>9} {'enc blk':>8} {'dec blk':>8}")
+    for name, result in results["packets"].items():
+        print(
+            f"{name:<30} {result['id']:>#4x} {result['size']:>5} {result['encode_ns']:>9.0f} {result['decode_ns']:>9.0f} "
+            f"{result['dispatch_ns']:>9.0f} {result['encode_blocks']:>8.2f} {result['decode_blocks']:>8.2f}"
+        )
+
+    fuzz = results["fuzz"]
+    print(f"\nmalformed datagrams: {fuzz['ns']:.0f} ns each, {fuzz['outcomes']}")
+
+    print(f"\n{'relay':<30} {'size':>5} {'out':>5} {'ns':>9} {'blocks':>8} {'peak B':>8}")
+    for name, result in results["relay"].items():
+        print(
+            f"{name:<30} {result['size']:>5} {result['datagrams_out']:>5} {result['ns']:>9.0f} "
+            f"{result['blocks']:>8.2f} {result['peak_bytes']:>8}"
+        )
+
+    for name in results["missing"]:
+        print(f"\nno sample for {name}, add one to SAMPLES")
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Lists every measurement that got worse than the baseline by more than `threshold`."""
+
+    regressions = []
+
+    def check(name: str, metric: str, now: float, before: float) -> None:
+        # Fractions of a block come and go with the dicts and lists the run grows, a whole one per call does not
+        if metric.endswith("blocks"):
+            if now - before >= 1:
+                regressions.append(f"{name} {metric}: {before} -> {now}")
+        elif before and (now - before) / before > threshold:
+            regressions.append(f"{name} {metric}: {before} -> {now} ({(now - before) / before:+.0%})")
+
+    for section, metrics in (
+        ("packets", ("encode_ns", "decode_ns", "dispatch_ns", "encode_blocks", "decode_blocks")),
+        ("relay", ("ns", "blocks")),
+    ):
+        for name, result in results[section].items():
+            previous = baseline.get(section, {}).get(name)
+            if previous is None:
+                continue
+            for metric in metrics:
+                check(name, metric, result[metric], previous[metric])
+
+    check("fuzz", "ns", results["fuzz"]["ns"], baseline.get("fuzz", {}).get("ns", 0))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Packet codec and relay path micro-benchmarks.")
+    parser.add_argument("--number", type=int, default=2000, help="calls per timed repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repeats, the best one counts")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results with this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the slowdown allowed before a time counts as a regression")
+    args = parser.parse_args()
+
+    # Joining the relay server's clients logs warnings that would bury the tables
+    logging.basicConfig(level=logging.ERROR)
+    results = run(args.number, args.repeat)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    failed = bool(results["missing"])
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\n{len(regressions)} regressions over {args.threshold:.0%} against {args.baseline}")
+        for regression in regressions:
+            print(f"  {regression}")
+        failed = failed or bool(regressions)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
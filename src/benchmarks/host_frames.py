@@ -0,0 +1,266 @@
+"""Compares the host's frame times with its server in the same process and in a child process.
+
+The host steps and draws a game scene at 60 frames per second while bots,
+in a process of their own, join its server, start a game and walk around.
+The run is made once with the `Server` in the host's process and once with
+a `ServerProcess`, and the time every frame took is reported for both.
+
+Run from the src directory:
+
+    python -m benchmarks.host_frames [--map mario] [--seconds 10] [--bots 8]
+"""
+
+import os
+import time
+import random
+import socket
+import logging
+import argparse
+import statistics
+import multiprocessing
+from multiprocessing.synchronize import Event
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+from pygame import Vector2
+
+from engine import Scene, GameObject, Transform, BoxCollider, RigidBody, Tilemap
+from connection.server import Server, BUFFER_SIZE
+from connection.server_process import ServerProcess
+from connection.physics import MAX_MOVE_FORCE
+from connection.map_transfer import MAP_DIR
+from connection.cookies import NO_COOKIE
+from connection.packets import (
+    Packet,
+    PacketPlayInJoin,
+    PacketPlayOutWelcome,
+    PacketPlayOutChallenge,
+    PacketPlayInKeepAlive,
+    PacketPlayOutKeepAlive,
+    PacketPlayOutReliable,
+    PacketPlayInReliableAck,
+    PacketPlayOutBundle,
+    PacketPlayInStartGame,
+    PacketPlayInPlayerState,
+    PacketPlayOutPlayerState,
+    PacketPlayInDisconnect,
+)
+from game.consts import MAP_SCALE, PLAYER_SIZE, PLAYER_DRAG, PLAYER_GRAVITY
+
+
+FPS = 60
+SCREEN_SIZE = (1280, 720)
+HOST_PLAYERS = 8  # bodies the host's own scene steps, like the players it draws
+BOT_STATE_RATE = 20  # state packets per second from each bot, as often as a client flushes
+WARM_UP = 2  # seconds the bots get to join and start the game before frames are measured
+
+
+class Bot:
+    """A player with no game around it: joins over UDP and keeps walking left and right."""
+
+    def __init__(self, name: str, server: tuple[str, int], rng: random.Random) -> None:
+        self.name = name
+        self.server = server
+        self.rng = rng
+        self.player_id = None
+        self.position = None
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.send(PacketPlayInJoin(name=name, cookie=NO_COOKIE))
+
+    def send(self, packet: Packet) -> None:
+        try:
+            self.sock.sendto(packet.to_bytes(), self.server)
+        except OSError:
+            pass
+
+    def receive(self) -> None:
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(BUFFER_SIZE)
+            except (BlockingIOError, OSError):
+                return
+
+            try:
+                self.handle(Packet.from_bytes(data))
+            except ValueError:
+                pass
+
+    def handle(self, packet: Packet) -> None:
+        match packet:
+            case challenge if isinstance(challenge, PacketPlayOutChallenge):
+                self.send(PacketPlayInJoin(name=self.name, cookie=challenge.cookie))
+
+            case welcome if isinstance(welcome, PacketPlayOutWelcome):
+                self.player_id = welcome.player_id
+
+            case keep_alive if isinstance(keep_alive, PacketPlayOutKeepAlive):
+                self.send(PacketPlayInKeepAlive(value=keep_alive.value))
+
+            case reliable if isinstance(reliable, PacketPlayOutReliable):
+                self.send(PacketPlayInReliableAck(reliable.sequence))
+                self.handle(reliable.packet)
+
+            case bundle if isinstance(bundle, PacketPlayOutBundle):
+                for inner_packet in bundle.packets:
+                    self.handle(inner_packet)
+
+            case state if isinstance(state, PacketPlayOutPlayerState):
+                # The server corrected us, or relays where it has us
+                if state.player_id == self.player_id and state.position is not None:
+                    self.position = Vector2(state.position)
+
+    def step(self, dt: float) -> None:
+        """Reports the next state, walking from the last position the server gave us."""
+
+        if self.player_id is None:
+            return
+
+        if self.position is None:
+            self.position = Vector2(self.rng.uniform(200, 1000), 200)
+
+        direction = self.rng.choice((-1, 1))
+        velocity = Vector2(direction * 300, 0)
+        self.position += velocity * dt
+
+        self.send(PacketPlayInPlayerState(
+            position=self.position,
+            velocity=velocity,
+            acceleration=Vector2(direction * MAX_MOVE_FORCE, 0),
+            angle=self.rng.uniform(0, 360),
+            firing=False
+        ))
+
+    def close(self) -> None:
+        self.send(PacketPlayInDisconnect())
+        self.sock.close()
+
+
+def run_bots(port: int, bots: int, map_name: str, stop: Event, seed: int) -> None:
+    """The bots' process: joins `bots` players, starts the game and plays until `stop` is set."""
+
+    rng = random.Random(seed)
+    players = [Bot(f"bot{i}", ("127.0.0.1", port), rng) for i in range(bots)]
+
+    started = False
+    dt = 1 / BOT_STATE_RATE
+    while not stop.is_set():
+        for bot in players:
+            bot.receive()
+
+        if not started and players[0].player_id is not None:
+            players[0].send(PacketPlayInStartGame(map_name=map_name))
+            started = True
+
+        for bot in players:
+            bot.step(dt)
+
+        time.sleep(dt)
+
+    for bot in players:
+        bot.close()
+
+
+def build_scene(map_name: str) -> Scene:
+    """The host's own game: the map and a few player bodies falling onto it."""
+
+    scene = Scene()
+    map_object = GameObject("Map")
+    map_object.add_component(Transform(scale=MAP_SCALE))
+    map_object.add_component(Tilemap(f"{MAP_DIR}/{map_name}.tmx"))
+    scene.add(map_object)
+
+    width, height = PLAYER_SIZE
+    for i in range(HOST_PLAYERS):
+        body = GameObject(f"Player ({i})")
+        body.add_component(Transform(position=Vector2(200 + i * 100, 100)))
+        body.add_component(BoxCollider(width=width, height=height, offset=(-width / 2, -height)))
+        body.add_component(RigidBody(drag=PLAYER_DRAG, gravity=PLAYER_GRAVITY))
+        scene.add(body)
+
+    return scene
+
+
+def measure(map_name: str, mode: str, port: int, bots: int, seconds: float, seed: int = 0) -> list[float]:
+    """Runs the host's frame loop with its server in `mode` and returns every frame time in milliseconds."""
+
+    if mode == "process":
+        server = ServerProcess(name="benchmark", port=port)
+    else:
+        server = Server(name="benchmark", port=port)
+    server.start()
+
+    context = multiprocessing.get_context("spawn")
+    stop = context.Event()
+    bot_process = context.Process(target=run_bots, args=(port, bots, map_name, stop, seed), daemon=True)
+    bot_process.start()
+
+    screen = pg.display.set_mode(SCREEN_SIZE)
+    scene = build_scene(map_name)
+    clock = pg.time.Clock()
+
+    frame_times = []
+    try:
+        start = time.perf_counter()
+        last = start
+        while time.perf_counter() - start < WARM_UP + seconds:
+            pg.event.pump()
+            scene._fixed_update(1 / FPS)
+            scene._update(1 / FPS)
+            scene._draw(screen)
+            pg.display.flip()
+            clock.tick(FPS)
+
+            now = time.perf_counter()
+            if now - start >= WARM_UP:
+                frame_times.append((now - last) * 1000)
+            last = now
+    finally:
+        stop.set()
+        bot_process.join(5)
+        server.stop()
+
+    return frame_times
+
+
+def summarize(frame_times: list[float]) -> dict[str, float]:
+    ordered = sorted(frame_times)
+    return {
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.pstdev(ordered),
+        "p95": ordered[int(len(ordered) * 0.95)],
+        "p99": ordered[int(len(ordered) * 0.99)],
+        "max": ordered[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Host frame times with the server in the same process or a child process.")
+    parser.add_argument("--map", default="mario", help="the map the host and the bots play on")
+    parser.add_argument("--seconds", type=float, default=10, help="how long to measure each mode")
+    parser.add_argument("--bots", type=int, default=8, help="the players joining the host's server")
+    parser.add_argument("--port", type=int, default=25565, help="the port the server listens on, and the next one for the second mode")
+    args = parser.parse_args()
+
+    # The bots are not real players, the server's corrections for them would drown the table
+    logging.basicConfig(level=logging.ERROR)
+    pg.init()
+
+    print(f"map={args.map} bots={args.bots} target={1000 / FPS:.2f} ms")
+    print(f"{'server':>8} {'frames':>7} {'mean':>7} {'stdev':>7} {'p95':>7} {'p99':>7} {'max':>7}")
+    # One port per mode, the socket of a stopped server stays busy until its listener times out
+    for offset, mode in enumerate(("thread", "process")):
+        frame_times = measure(args.map, mode, args.port + offset, args.bots, args.seconds)
+        stats = summarize(frame_times)
+        print(
+            f"{mode:>8} {len(frame_times):>7} {stats['mean']:>7.2f} {stats['stdev']:>7.2f} "
+            f"{stats['p95']:>7.2f} {stats['p99']:>7.2f} {stats['max']:>7.2f}"
+        )
+
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
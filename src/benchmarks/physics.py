@@ -0,0 +1,101 @@
+"""Measures how many physics ticks per second the server reaches for a number of players.
+
+Run from the src directory:
+
+    python -m benchmarks.physics [--map mario] [--seconds 2] [--players 1 8 16 32 64]
+
+Before measuring, it checks that a player who falls off the map can respawn.
+"""
+
+import time
+import random
+import argparse
+
+from pygame import Vector2
+
+from engine import Transform
+
+from connection.map_transfer import MAP_DIR
+from connection.physics import PlayerPhysics, PHYSICS_STEP, MAX_MOVE_FORCE
+from game.consts import FALL_LIMIT
+
+
+def run(map_name: str, players: int, seconds: float, seed: int = 0) -> float:
+    """Steps a game of `players` players, walking and jumping at random, for `seconds`.
+
+    Returns:
+        float: The physics ticks simulated per second of wall time.
+    """
+
+    rng = random.Random(seed)
+    physics = PlayerPhysics()
+    physics.load_map(f"{MAP_DIR}/{map_name}.tmx")
+
+    spawns = physics.spawn_points or [Vector2(0, 0)]
+    for player_id in range(players):
+        spawn = spawns[player_id % len(spawns)]
+        physics.report(player_id, spawn + Vector2(rng.uniform(-40, 40), 0), Vector2(), Vector2())
+
+    ticks = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        # Change about one player's input per tick, like clients reporting
+        player_id = rng.randrange(players)
+        state = physics.state(player_id)
+        if state is not None:
+            position, velocity = state
+            if rng.random() < 0.2:
+                velocity.y = -700
+            physics.report(player_id, position, velocity, Vector2(rng.choice((-1, 0, 1)) * MAX_MOVE_FORCE, 0))
+
+        physics.step(PHYSICS_STEP)
+        ticks += 1
+
+    return ticks / (time.perf_counter() - start)
+
+
+def check_fall_recovery(map_name: str) -> None:
+    """Drops a player off the map and checks that its report from a spawn point is accepted afterwards.
+
+    Raises:
+        AssertionError: If the body never falls past the kill line or the respawn is refused.
+    """
+
+    physics = PlayerPhysics()
+    physics.load_map(f"{MAP_DIR}/{map_name}.tmx")
+
+    spawn = physics.spawn_points[0] if physics.spawn_points else Vector2(0, 0)
+    assert physics.report(0, spawn, Vector2(), Vector2()), "the first report at a spawn point was refused"
+
+    # Far to the side of the map, where there is no ground to land on
+    physics._bodies[0].get_component(Transform).position = Vector2(spawn.x + 100_000, spawn.y)
+    for _ in range(int(10 / PHYSICS_STEP)):
+        physics.step(PHYSICS_STEP)
+        if physics.state(0) is None:
+            break
+    else:
+        raise AssertionError(f"the body never fell past y={FALL_LIMIT}")
+
+    assert physics.report(0, spawn, Vector2(), Vector2()), "the report from a spawn point after the fall was refused"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Server physics ticks per second versus player count.")
+    parser.add_argument("--map", default="mario", help="the map to simulate on")
+    parser.add_argument("--seconds", type=float, default=2, help="how long to run each player count")
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 8, 16, 32, 64], help="the player counts to run")
+    args = parser.parse_args()
+
+    check_fall_recovery(args.map)
+    print("fall recovery: ok")
+
+    target = 1 / PHYSICS_STEP
+    print(f"map={args.map} target={target:.0f} ticks/s")
+    print(f"{'players':>8} {'ticks/s':>10} {'headroom':>9}")
+    for players in args.players:
+        rate = run(args.map, players, args.seconds)
+        print(f"{players:>8} {rate:>10.0f} {rate / target:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
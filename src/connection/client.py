@@ -6,7 +6,6 @@ import logging
 from pygame.math import Vector2
 from dataclasses import dataclass
 
-from connection.packets.play.client.player_die import PacketPlayInPlayerDie
 from connection.packets.play.server.player_die import PacketPlayOutPlayerDie
 from engine import Game
 from connection.server import DISCOVERY_PORT
@@ -21,7 +20,6 @@ from connection.packets import (
     PacketPlayOutKeepAlive,
     PacketPlayOutPlayerJoin,
     PacketPlayOutPlayerLeave,
-    PacketPlayInPlayerMove,
     PacketPlayOutPlayerMove,
     PacketPlayInChangeCharacter,
     PacketPlayOutChangeCharacter,
@@ -33,14 +31,38 @@ from connection.packets import (
     PacketPlayOutAddItem,
     PacketPlayInItemDrop,
     PacketPlayOutItemDrop,
-    PacketPlayInPlayerLook,
     PacketPlayOutPlayerLook,
     PacketPlayInShoot,
-    PacketPlayOutShoot
+    PacketPlayOutShoot,
+    PacketPlayInPlayerState,
+    PacketPlayOutPlayerState,
+    PacketPlayInFireStart,
+    PacketPlayOutFireStart,
+    PacketPlayInFireStop,
+    PacketPlayOutFireStop,
+    PacketPlayOutReliable,
+    PacketPlayInReliableAck,
+    PacketPlayInMapRequest,
+    PacketPlayOutMapChunk,
+    PacketPlayOutDefineSymbol,
+    PacketPlayOutChallenge,
+    PacketPlayOutBundle,
+    PacketPlayOutWorldState,
+    PacketPlayOutPlayerHit,
+    PacketPlayInReliable,
+    PacketPlayOutReliableAck,
+    WorldState
 )
+from connection.reliable import ReliableChannel
+from connection.symbols import SymbolTable, UnknownSymbolError
+from connection.map_transfer import MapDownload, find_map
+from connection.cookies import NO_COOKIE
+from connection.loopback import LoopbackTransport
 
 
 TIMEOUT = 2  # seconds
+STATE_RATE = 20  # player state packets per second
+MAP_STALL_TIMEOUT = 3  # seconds without a map chunk before the transfer is resumed
 
 
 @dataclass(unsafe_hash=True)
@@ -62,7 +84,31 @@ class Client:
 
     last_keep_alive: float
 
-    def __init__(self, name: str, server_ip: str, server_port: int, buffer_size: int = 1024) -> None:
+    _state_lock: threading.Lock
+    _pending_move: tuple[Vector2, Vector2, Vector2] | None
+    _pending_look: float | None
+    _firing: bool
+    _firing_changed: bool
+
+    player_id: int | None
+    reliable: ReliableChannel
+    outgoing: ReliableChannel
+    map_download: MapDownload | None
+    symbols: SymbolTable
+    loopback: LoopbackTransport | None
+
+    _awaiting_symbols: list[Packet]
+    _world_fragments: list[bytes]
+    _pending_world: WorldState | None
+
+    def __init__(
+        self,
+        name: str,
+        server_ip: str,
+        server_port: int,
+        buffer_size: int = 1024,
+        loopback: LoopbackTransport | None = None
+    ) -> None:
         """Initializes the client with the specified IP address and port.
 
         Args:
@@ -70,17 +116,36 @@ class Client:
             server_ip (str): The IP address of the server to connect to.
             server_port (int): The port number of the server to connect to.
             buffer_size (int): The size of the buffer for receiving data.
+            loopback (LoopbackTransport | None): Talks to a server in the same process through this
+                transport instead of the network, for the hosting player. Defaults to None.
         """
 
         self.name = name
         self.address = (server_ip, server_port)
         self.buffer_size = buffer_size
+        self.loopback = loopback
 
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.running = False
 
         self.last_keep_alive = time.time()
 
+        self._state_lock = threading.Lock()
+        self._pending_move = None
+        self._pending_look = None
+        self._firing = False
+        self._firing_changed = False
+
+        self.player_id = None
+        self.reliable = ReliableChannel()
+        self.outgoing = ReliableChannel(lambda sequence, packet: self.send(PacketPlayInReliable(sequence, packet)))
+        self.map_download = None
+        self.symbols = SymbolTable()
+
+        self._awaiting_symbols = []
+        self._world_fragments = []
+        self._pending_world = None
+
     @staticmethod
     def search() -> set[ServerData]:
         """Searches for available servers and returns a set of ServerData objects."""
@@ -131,9 +196,20 @@ class Client:
 
         logging.info(f"[Client] Received packet: {packet}")
 
+        try:
+            self._handle_packet(packet)
+        except UnknownSymbolError as e:
+            # Handled again once the define symbol packet for it arrives
+            logging.info(f"[Client] Waiting for symbol {e} before handling {packet}.")
+            self._awaiting_symbols.append(packet)
+
+    def _handle_packet(self, packet: Packet) -> None:
         match packet:
             case welcome if isinstance(welcome, PacketPlayOutWelcome):
                 if welcome.is_welcome:
+                    self.player_id = welcome.player_id
+                    self.symbols = SymbolTable()
+
                     from game.scenes.lobby import LobbyScene
                     
                     Game.instance().clear_scenes()
@@ -143,6 +219,16 @@ class Client:
                     logging.info(f"[Client] Connection failed: {welcome.message}")
                     self.stop()
 
+            case challenge if isinstance(challenge, PacketPlayOutChallenge):
+                self.join(cookie=challenge.cookie)
+
+            case define_symbol if isinstance(define_symbol, PacketPlayOutDefineSymbol):
+                self.symbols.define(define_symbol.symbol_id, define_symbol.symbol)
+
+                awaiting, self._awaiting_symbols = self._awaiting_symbols, []
+                for awaiting_packet in awaiting:
+                    self.on_packet_received(awaiting_packet)
+
             case keep_alive if isinstance(keep_alive, PacketPlayOutKeepAlive):
                 response_packet = PacketPlayInKeepAlive(value=keep_alive.value)
                 self.send(response_packet)
@@ -152,8 +238,9 @@ class Client:
                 current_scene = Game.instance().current_scene
 
                 if hasattr(current_scene, 'add_player'):
-                    current_scene.add_player(player_join.player_id, player_join.name)
-                    logging.info(f"[Client] Player {player_join.name} with ID {player_join.player_id} joined the lobby.")
+                    name = self.symbols.resolve(player_join.name)
+                    current_scene.add_player(player_join.player_id, name)
+                    logging.info(f"[Client] Player {name} with ID {player_join.player_id} joined the lobby.")
 
             case player_leave if isinstance(player_leave, PacketPlayOutPlayerLeave):
                 current_scene = Game.instance().current_scene
@@ -180,18 +267,56 @@ class Client:
                         character_index=change_character.character_index
                     )
 
+            case bundle if isinstance(bundle, PacketPlayOutBundle):
+                for inner_packet in bundle.packets:
+                    self.on_packet_received(inner_packet)
+
+            case reliable if isinstance(reliable, PacketPlayOutReliable):
+                self.send(PacketPlayInReliableAck(reliable.sequence))
+                for inner_packet in self.reliable.receive(reliable.sequence, reliable.packet):
+                    self.on_packet_received(inner_packet)
+
+            case reliable_ack if isinstance(reliable_ack, PacketPlayOutReliableAck):
+                self.outgoing.ack(reliable_ack.sequence)
+
             case start_game if isinstance(start_game, PacketPlayOutStartGame):
-                current_scene = Game.instance().current_scene
-                if hasattr(current_scene, 'start_game'):
-                    current_scene.start_game(map_name=start_game.map_name)
+                map_name = self.symbols.resolve(start_game.map_name)
+                self._load_map(map_name, start_game.map_digest, start_game.map_size)
+
+            case world_state if isinstance(world_state, PacketPlayOutWorldState):
+                if world_state.fragment == 0:
+                    self._world_fragments = []
+                self._world_fragments.append(world_state.payload)
+
+                if len(self._world_fragments) == world_state.fragment_count:
+                    data, self._world_fragments = b"".join(self._world_fragments), []
+                    self._apply_world_state(WorldState.from_bytes(data))
+
+            case map_chunk if isinstance(map_chunk, PacketPlayOutMapChunk):
+                download = self.map_download
+                if download is None:
+                    return
+
+                download.write(map_chunk.offset, map_chunk.chunk)
+                if download.complete:
+                    self.map_download = None
+                    try:
+                        map_path = download.finish()
+                    except ValueError as e:
+                        logging.error(f"[Client] {e}")
+                        return
+
+                    logging.info(f"[Client] Map '{download.map_name}' downloaded to {map_path}.")
+                    self._start_game_on_map(download.map_name, map_path)
 
             case item if isinstance(item, PacketPlayOutAddItem):
                 current_scene = Game.instance().current_scene
                 if hasattr(current_scene, 'add_gun_item'):
                     current_scene.add_gun_item(
-                        gun_type=item.gun_type,
+                        gun_type=self.symbols.resolve(item.gun_type),
                         x=int(item.position_x),
-                        y=int(item.position_y)
+                        y=int(item.position_y),
+                        object_id=item.object_id
                     )
 
             case item_pickup if isinstance(item_pickup, PacketPlayOutItemPickup):
@@ -199,7 +324,7 @@ class Client:
                 if hasattr(current_scene, 'pickup_item'):
                     current_scene.pickup_item(
                         player_id=item_pickup.player_id,
-                        gun_type=item_pickup.gun_type,
+                        gun_type=self.symbols.resolve(item_pickup.gun_type),
                         object_id=item_pickup.object_id
                     )
 
@@ -221,11 +346,62 @@ class Client:
                 if hasattr(current_scene, 'shoot'):
                     current_scene.shoot(
                         player_id=shoot.player_id,
-                        gun_type=shoot.gun_type,
+                        gun_type=self.symbols.resolve(shoot.gun_type),
                         angle=shoot.angle,
                         position=shoot.position
                     )
 
+            case player_state if isinstance(player_state, PacketPlayOutPlayerState):
+                current_scene = Game.instance().current_scene
+                if player_state.has_move and hasattr(current_scene, 'move_player'):
+                    current_scene.move_player(
+                        player_state.player_id,
+                        player_state.position,
+                        player_state.acceleration,
+                        player_state.velocity
+                    )
+
+                if player_state.has_look and hasattr(current_scene, 'player_look'):
+                    current_scene.player_look(
+                        player_id=player_state.player_id,
+                        angle=player_state.angle
+                    )
+
+                if hasattr(current_scene, 'player_firing'):
+                    current_scene.player_firing(
+                        player_id=player_state.player_id,
+                        firing=player_state.firing
+                    )
+
+            case fire_start if isinstance(fire_start, PacketPlayOutFireStart):
+                current_scene = Game.instance().current_scene
+                if hasattr(current_scene, 'fire_start'):
+                    current_scene.fire_start(
+                        player_id=fire_start.player_id,
+                        gun_type=self.symbols.resolve(fire_start.gun_type),
+                        seed=fire_start.seed,
+                        start_tick=fire_start.start_tick,
+                        angle=fire_start.angle
+                    )
+
+            case fire_stop if isinstance(fire_stop, PacketPlayOutFireStop):
+                current_scene = Game.instance().current_scene
+                if hasattr(current_scene, 'fire_stop'):
+                    current_scene.fire_stop(
+                        player_id=fire_stop.player_id,
+                        start_tick=fire_stop.start_tick,
+                        shot_count=fire_stop.shot_count
+                    )
+
+            case player_hit if isinstance(player_hit, PacketPlayOutPlayerHit):
+                current_scene = Game.instance().current_scene
+                if hasattr(current_scene, 'player_hit'):
+                    current_scene.player_hit(
+                        player_id=player_hit.player_id,
+                        health=player_hit.health,
+                        angle=player_hit.angle
+                    )
+
             case die if isinstance(die, PacketPlayOutPlayerDie):
                 current_scene = Game.instance().current_scene
                 if hasattr(current_scene, 'player_die'):
@@ -241,11 +417,13 @@ class Client:
         if self.running:
             return
         
-        self.sock.connect(self.address)
+        if self.loopback is None:
+            self.sock.connect(self.address)
         self.running = True
 
         threading.Thread(target=self._listen_for_packets, daemon=True).start()
         threading.Thread(target=self._wait_for_keep_alive, daemon=True).start()
+        threading.Thread(target=self._send_state_loop, daemon=True).start()
         logging.info(f"[Client] Client started and connected to {self.address}.")
 
         self.join()
@@ -270,14 +448,84 @@ class Client:
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before starting the game.")
 
-        self.send(PacketPlayInStartGame(map_name=map_name))
+        self.send(PacketPlayInStartGame(map_name=self.symbols.encode(map_name)))
         logging.info(f"[Client] Requesting to start game on map '{map_name}'.")
 
+    def _load_map(self, map_name: str, digest: bytes, size: int) -> None:
+        """Starts the game on a map, downloading it first if there is no local copy."""
+
+        map_path = find_map(map_name, digest)
+        if map_path:
+            self._start_game_on_map(map_name, map_path)
+        else:
+            self.map_download = MapDownload(map_name, digest, size)
+            self.send(PacketPlayInMapRequest(digest, self.map_download.offset))
+            threading.Thread(target=self._watch_map_download, daemon=True).start()
+            logging.info(f"[Client] Downloading map '{map_name}' from offset {self.map_download.offset}.")
+
+    def _start_game_on_map(self, map_name: str, map_path: str) -> None:
+        current_scene = Game.instance().current_scene
+        if hasattr(current_scene, 'start_game'):
+            current_scene.start_game(map_name=map_name, map_path=map_path)
+
+        # The rest of the world state of a late join can only be applied once the game scene exists
+        if self._pending_world is not None:
+            world, self._pending_world = self._pending_world, None
+            self._apply_game_state(world)
+
+    def _apply_world_state(self, world: WorldState) -> None:
+        """Brings a client that just joined up to date with the rest of the room.
+
+        The roster and the characters are applied to the lobby right away. If a
+        game is in progress, the client then starts it on the same map and the
+        guns, deaths and items are applied on top.
+        """
+
+        current_scene = Game.instance().current_scene
+        for player in world.players:
+            if player.player_id == self.player_id:
+                continue
+
+            if hasattr(current_scene, 'add_player'):
+                current_scene.add_player(player.player_id, self.symbols.resolve(player.name))
+            if hasattr(current_scene, 'change_character'):
+                current_scene.change_character(player_id=player.player_id, character_index=player.character_index)
+
+        logging.info(f"[Client] Received the world state: {len(world.players)} players, {len(world.items)} items.")
+
+        if world.map_name is not None:
+            self._pending_world = world
+            self._load_map(self.symbols.resolve(world.map_name), world.map_digest, world.map_size)
+
+    def _apply_game_state(self, world: WorldState) -> None:
+        current_scene = Game.instance().current_scene
+
+        for player in world.players:
+            if player.player_id == self.player_id:
+                continue
+
+            if player.position is not None and hasattr(current_scene, 'move_player'):
+                current_scene.move_player(player.player_id, player.position, Vector2(0, 0), Vector2(0, 0))
+                current_scene.player_look(player_id=player.player_id, angle=player.angle)
+            if player.gun_type is not None and hasattr(current_scene, 'give_item'):
+                current_scene.give_item(self.symbols.resolve(player.gun_type), player.player_id)
+            if not player.alive and hasattr(current_scene, 'player_die'):
+                current_scene.player_die(player.player_id)
+
+        if hasattr(current_scene, 'add_gun_item'):
+            for item in world.items:
+                current_scene.add_gun_item(
+                    gun_type=self.symbols.resolve(item.gun_type),
+                    x=int(item.position.x),
+                    y=int(item.position.y),
+                    object_id=item.object_id
+                )
+
     def spawn_item(self, gun_type: str, x, y) -> None:
         """Sends a request to spawn an item at the specified position.
 
         Args:
-            item_id (str): The ID of the item to spawn.
+            gun_type (str): The type of gun the item is.
             x (int): The x-coordinate of the item's position.
             y (int): The y-coordinate of the item's position.
         """
@@ -285,23 +533,21 @@ class Client:
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before spawning items.")
 
-        self.send(PacketPlayInAddItem(gun_type=gun_type, position=Vector2(x, y)))
+        self.send(PacketPlayInAddItem(gun_type=self.symbols.encode(gun_type), position=Vector2(x, y)))
         logging.info(f"[Client] Requesting to spawn item '{gun_type}' at ({x}, {y}).")
 
-    def pickup_item(self, gun_type: str, object_id: int) -> None:
-        """Sends a request to pick up an item.
+    def pickup_item(self, object_id: int) -> None:
+        """Sends a claim for an item. The server confirms it to everyone if the claim wins.
 
         Args:
-            player_id (int): The ID of the player picking up the item.
-            gun_type (str): The type of the gun being picked up.
             object_id (int): The ID of the object being picked up.
         """
 
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before destroying items.")
 
-        self.send(PacketPlayInItemPickup(gun_type=gun_type, object_id=object_id))
-        logging.info(f"[Client] Requesting to pick up item '{gun_type}' with object ID {object_id}.")
+        self.send_reliable(PacketPlayInItemPickup(object_id=object_id))
+        logging.info(f"[Client] Requesting to pick up item with object ID {object_id}.")
 
     def drop_item(self) -> None:
         """Sends a request to drop the current item."""
@@ -309,21 +555,9 @@ class Client:
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before dropping items.")
 
-        self.send(PacketPlayInItemDrop())
+        self.send_reliable(PacketPlayInItemDrop())
         logging.info("[Client] Requesting to drop the current item.")
 
-    def kill_player(self) -> None:
-        """Sends a request to kill a player.
-
-        Args:
-            player_id (int): The ID of the player to kill.
-        """
-
-        if not self.running:
-            raise RuntimeError("Client is not running. Start the client before killing players.")
-        logging.info(f"[Client] Requesting to kill player.")
-        self.send(PacketPlayInPlayerDie())
-
     def change_character(self, index: int) -> None:
         """Changes the character of the local player.
 
@@ -337,7 +571,7 @@ class Client:
         self.send(PacketPlayInChangeCharacter(index))
 
     def look(self, angle: float) -> None:
-        """Sends a player look packet to the server.
+        """Queues the player's look angle for the next state packet.
 
         Args:
             angle (float): The new angle of the player.
@@ -346,10 +580,11 @@ class Client:
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before looking.")
 
-        self.send(PacketPlayInPlayerLook(angle=angle))
+        with self._state_lock:
+            self._pending_look = angle
 
     def move(self, position: Vector2, acceleration: Vector2, velocity: Vector2) -> None:
-        """Sends a player move packet to the server.
+        """Queues the player's movement for the next state packet.
 
         Args:
             position (Vector2): The new position of the player.
@@ -359,12 +594,49 @@ class Client:
 
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before moving.")
-        
-        self.send(PacketPlayInPlayerMove(
-            position=position,
-            acceleration=acceleration,
-            velocity=velocity
-        ))
+
+        with self._state_lock:
+            self._pending_move = (position.copy(), acceleration.copy(), velocity.copy())
+
+    def set_firing(self, firing: bool) -> None:
+        """Queues the trigger state for the next state packet.
+
+        Args:
+            firing (bool): Whether the trigger is held.
+        """
+
+        if not self.running:
+            raise RuntimeError("Client is not running. Start the client before firing.")
+
+        with self._state_lock:
+            if firing != self._firing:
+                self._firing = firing
+                self._firing_changed = True
+
+    def flush_state(self) -> None:
+        """Sends everything queued by `move`, `look` and `set_firing` as one state packet."""
+
+        with self._state_lock:
+            if self._pending_move is None and self._pending_look is None and not self._firing_changed:
+                return
+
+            position = acceleration = velocity = None
+            if self._pending_move is not None:
+                position, acceleration, velocity = self._pending_move
+
+            packet = PacketPlayInPlayerState(
+                position=position,
+                velocity=velocity,
+                acceleration=acceleration,
+                angle=self._pending_look,
+                firing=self._firing
+            )
+
+            self._pending_move = None
+            self._pending_look = None
+            self._firing_changed = False
+
+        self.send(packet)
 
     def shoot(self, gun_type: str, angle: float, position: Vector2) -> None:
         """Sends a shoot packet to the server.
@@ -378,15 +650,47 @@ class Client:
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before shooting.")
 
-        self.send(PacketPlayInShoot(gun_type=gun_type, angle=angle, position=position))
+        self.send(PacketPlayInShoot(gun_type=self.symbols.encode(gun_type), angle=angle, position=position))
 
-    def join(self) -> None:
-        """Sends a join request to the server with the client's name."""
+    def fire_start(self, gun_type: str, seed: int, start_tick: int, angle: float) -> None:
+        """Sends the start of an automatic burst to the server.
+
+        Args:
+            gun_type (str): The type of gun being fired.
+            seed (int): The seed every client uses to reproduce the burst spread.
+            start_tick (int): The tick at which the burst started, identifying it.
+            angle (float): The look angle when the trigger was pressed.
+        """
+
+        if not self.running:
+            raise RuntimeError("Client is not running. Start the client before shooting.")
+
+        self.send(PacketPlayInFireStart(gun_type=self.symbols.encode(gun_type), seed=seed, start_tick=start_tick, angle=angle))
+
+    def fire_stop(self, start_tick: int, shot_count: int) -> None:
+        """Sends the end of an automatic burst to the server.
+
+        Args:
+            start_tick (int): The tick the burst was started with.
+            shot_count (int): The number of shots fired during the burst.
+        """
+
+        if not self.running:
+            raise RuntimeError("Client is not running. Start the client before shooting.")
+
+        self.send(PacketPlayInFireStop(start_tick=start_tick, shot_count=shot_count))
+
+    def join(self, cookie: bytes = NO_COOKIE) -> None:
+        """Sends a join request to the server with the client's name.
+
+        Args:
+            cookie (bytes): The cookie from the server's challenge. The first request goes without one.
+        """
 
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before joining.")
 
-        self.send(PacketPlayInJoin(name=self.name))
+        self.send(PacketPlayInJoin(name=self.name, cookie=cookie))
 
     def disconnect(self) -> None:
         """Sends a disconnect request to the server."""
@@ -407,10 +711,26 @@ class Client:
         if not self.running:
             raise RuntimeError("Client is not running. Start the client before sending packets.")
 
+        if self.loopback is not None:
+            self.loopback.send_to_server(packet)
+            return
+
         data = packet.to_bytes()
         self.sock.sendto(data, self.address)
         logging.info(f"[Client] Sent packet: {packet}")
 
+    def send_reliable(self, packet: Packet) -> None:
+        """Sends a packet to the server, resending it until the server acknowledges it.
+
+        Args:
+            packet (Packet): The packet to send.
+        """
+
+        if self.loopback is not None:
+            self.send(packet)
+        else:
+            self.outgoing.send(packet)
+
     def _wait_for_keep_alive(self) -> None:
         """Waits for keep-alive packets from the server and handles them."""
 
@@ -426,9 +746,39 @@ class Client:
 
             time.sleep(1)
 
+    def _send_state_loop(self) -> None:
+        """Flushes the queued player state and resends unacknowledged reliable packets at a fixed rate."""
+
+        interval = 1 / STATE_RATE
+        while self.running:
+            try:
+                self.flush_state()
+                self.outgoing.resend()
+            except (socket.error, RuntimeError) as e:
+                if not self.running:
+                    break
+                logging.error(f"[Client] Error sending player state: {e}")
+
+            time.sleep(interval)
+
+    def _watch_map_download(self) -> None:
+        """Resumes the map transfer from where it stopped if no chunk arrives for a while."""
+
+        while self.running and (download := self.map_download) is not None:
+            if time.time() - download.last_progress > MAP_STALL_TIMEOUT:
+                logging.warning(f"[Client] Map transfer stalled. Resuming from offset {download.offset}.")
+                download.last_progress = time.time()
+                self.send(PacketPlayInMapRequest(download.digest, download.offset))
+
+            time.sleep(1)
+
     def _listen_for_packets(self) -> None:
         """Listens for incoming packets from the server and handles them."""
 
+        if self.loopback is not None:
+            self._listen_for_loopback_packets()
+            return
+
         while self.running:                
             try:
                 data, _ = self.sock.recvfrom(self.buffer_size)
@@ -450,5 +800,18 @@ class Client:
                 else:
                     logging.error(f"[Client] Error receiving packet: {e}")
 
+    def _listen_for_loopback_packets(self) -> None:
+        """Handles the packets the server in the same process hands over, until the client stops."""
+
+        while self.running:
+            packet = self.loopback.receive_on_client(timeout=1)
+            if packet is None:
+                continue
+
+            try:
+                self.on_packet_received(packet)
+            except Exception as e:
+                logging.error(f"[Client] Error handling loopback packet {packet}: {e}")
+
     def __repr__(self) -> str:
         return f"<Client name='{self.name}' address={self.address}>"
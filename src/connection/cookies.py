@@ -0,0 +1,68 @@
+import os
+import hmac
+import time
+import hashlib
+
+
+COOKIE_SIZE = 16  # bytes
+NO_COOKIE = bytes(COOKIE_SIZE)  # sent in the first join, before the server has issued a cookie
+
+
+class HandshakeCookies:
+    """Stateless challenge cookies for the join handshake.
+
+    A cookie is an HMAC of the client's address and the current time window,
+    keyed with a secret that never leaves the server. Nothing is stored when
+    a cookie is issued: the server recomputes it when it comes back, so a flood
+    of spoofed joins costs one hash each and no memory. Cookies from the
+    current and the previous window are accepted, so a cookie issued right
+    before a window ends is still good.
+    """
+
+    window: float = 10.0  # seconds a cookie stays valid for, at least
+
+    _secret: bytes
+
+    def __init__(self, secret: bytes | None = None) -> None:
+        """Initializes the issuer.
+
+        Args:
+            secret (bytes | None): The HMAC key. A random one is generated if None.
+        """
+
+        self._secret = secret or os.urandom(32)
+
+    def issue(self, addr: tuple[str, int]) -> bytes:
+        """Returns the cookie for an address in the current time window."""
+
+        return self._cookie(addr, self._current_window())
+
+    def verify(self, addr: tuple[str, int], cookie: bytes) -> bool:
+        """Checks a cookie echoed back by an address.
+
+        Args:
+            addr (tuple[str, int]): The address the cookie came from.
+            cookie (bytes): The cookie to check.
+
+        Returns:
+            bool: Whether the cookie was issued to this address in the current or previous window.
+        """
+
+        if len(cookie) != COOKIE_SIZE or cookie == NO_COOKIE:
+            return False
+
+        window = self._current_window()
+        return any(
+            hmac.compare_digest(cookie, self._cookie(addr, w))
+            for w in (window, window - 1)
+        )
+
+    def _current_window(self) -> int:
+        return int(time.time() // self.window)
+
+    def _cookie(self, addr: tuple[str, int], window: int) -> bytes:
+        message = f"{addr[0]}:{addr[1]}:{window}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).digest()[:COOKIE_SIZE]
+
+    def __repr__(self) -> str:
+        return f"<HandshakeCookies window={self.window}>"
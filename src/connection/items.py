@@ -0,0 +1,82 @@
+import threading
+from dataclasses import dataclass
+
+from pygame import Vector2
+
+
+MAX_ITEM_ID = 0xFFFFFFFF  # item ids are sent as uint32
+
+
+@dataclass
+class ItemData:
+    id: int
+    gun_type: str
+    position: Vector2
+
+
+class ItemRegistry:
+    """The server's table of the items lying on the ground.
+
+    The server is the only one that gives out item ids, so every client refers
+    to an item by the same number. A pickup is a single dictionary pop under a
+    lock: the first claim for an item takes it out of the table and any claim
+    that arrives after that, from the same player or another, finds nothing.
+    """
+
+    _lock: threading.Lock
+    _items: dict[int, ItemData]
+    _next_id: int
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._items = {}
+        self._next_id = 0
+
+    @property
+    def items(self) -> list[ItemData]:
+        """The items currently on the ground."""
+
+        with self._lock:
+            return list(self._items.values())
+
+    def spawn(self, gun_type: str, position: Vector2) -> ItemData:
+        """Adds an item to the ground with a new id.
+
+        Args:
+            gun_type (str): The type of gun the item is.
+            position (Vector2): Where the item is.
+
+        Returns:
+            ItemData: The item added.
+        """
+
+        with self._lock:
+            item = ItemData(self._next_id, gun_type, position)
+            self._items[item.id] = item
+            self._next_id = (self._next_id + 1) % (MAX_ITEM_ID + 1)
+            return item
+
+    def claim(self, item_id: int) -> ItemData | None:
+        """Takes an item off the ground.
+
+        Args:
+            item_id (int): The id of the item to take.
+
+        Returns:
+            ItemData | None: The item, or None if it does not exist or was already taken.
+        """
+
+        with self._lock:
+            return self._items.pop(item_id, None)
+
+    def clear(self) -> None:
+        """Removes every item, keeping the ids counting up so old ones are never reused."""
+
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"<ItemRegistry items={len(self._items)}>"
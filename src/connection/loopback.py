@@ -0,0 +1,61 @@
+import queue
+
+from connection.packets import Packet
+
+
+LOOPBACK_ADDRESS = ("loopback", 0)  # the address the server knows the hosting player's client by
+
+
+class LoopbackTransport:
+    """Hands packets between the hosting player's client and the server in the same process.
+
+    Packets cross as objects through two in-memory queues, one per direction:
+    nothing is serialized, no socket is involved, and nothing is ever lost or
+    reordered, so the server also skips the reliable channel for this client.
+    Since both ends share the same objects, neither may change a packet after
+    sending it, nor keep references into one it received.
+    """
+
+    open: bool
+
+    _to_server: queue.SimpleQueue[Packet]
+    _to_client: queue.SimpleQueue[Packet]
+
+    def __init__(self) -> None:
+        self.open = True
+
+        self._to_server = queue.SimpleQueue()
+        self._to_client = queue.SimpleQueue()
+
+    def send_to_server(self, packet: Packet) -> None:
+        if self.open:
+            self._to_server.put(packet)
+
+    def send_to_client(self, packet: Packet) -> None:
+        if self.open:
+            self._to_client.put(packet)
+
+    def receive_on_server(self, timeout: float) -> Packet | None:
+        """Waits up to `timeout` seconds for a packet from the client, None if none came."""
+
+        return self._receive(self._to_server, timeout)
+
+    def receive_on_client(self, timeout: float) -> Packet | None:
+        """Waits up to `timeout` seconds for a packet from the server, None if none came."""
+
+        return self._receive(self._to_client, timeout)
+
+    def close(self) -> None:
+        """Stops both directions. Packets sent after this are dropped."""
+
+        self.open = False
+
+    @staticmethod
+    def _receive(source: queue.SimpleQueue[Packet], timeout: float) -> Packet | None:
+        try:
+            return source.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __repr__(self) -> str:
+        return f"<LoopbackTransport open={self.open} to_server={self._to_server.qsize()} to_client={self._to_client.qsize()}>"
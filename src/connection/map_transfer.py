@@ -0,0 +1,126 @@
+import os
+import time
+import hashlib
+
+
+MAP_DIR = "assets/maps"
+MAP_CACHE_DIR = "assets/map_cache"  # next to assets/maps so the tileset paths in the .tmx still resolve
+CHUNK_SIZE = 900  # bytes of map data per chunk, keeps every datagram under BUFFER_SIZE
+
+
+def map_digest(data: bytes) -> bytes:
+    """Returns the SHA-256 digest identifying a map's contents."""
+
+    return hashlib.sha256(data).digest()
+
+
+def list_maps() -> list[str]:
+    """Returns the names of the maps shipped with the game, the only ones a game can be started on."""
+
+    return sorted(name.removesuffix(".tmx") for name in os.listdir(MAP_DIR) if name.endswith(".tmx"))
+
+
+def cached_map_path(digest: bytes) -> str:
+    """Returns where the map with the given digest is stored in the client cache."""
+
+    return os.path.join(MAP_CACHE_DIR, f"{digest.hex()}.tmx")
+
+
+def find_map(map_name: str, digest: bytes) -> str | None:
+    """Looks for a local copy of a map with the given contents.
+
+    Args:
+        map_name (str): The name of the map, used to check the maps shipped with the game.
+        digest (bytes): The SHA-256 digest of the map contents.
+
+    Returns:
+        str | None: The path to the map file, or None if it has to be downloaded.
+    """
+
+    path = cached_map_path(digest)
+    if os.path.isfile(path):
+        return path
+
+    path = os.path.join(MAP_DIR, f"{os.path.basename(map_name)}.tmx")
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            if map_digest(f.read()) == digest:
+                return path
+
+    return None
+
+
+class MapDownload:
+    """A map being received in chunks and written to the client cache.
+
+    Chunks are appended to a `.part` file, so a transfer that is interrupted
+    resumes from `offset` instead of starting over.
+    """
+
+    map_name: str
+    digest: bytes
+    size: int
+    offset: int
+    last_progress: float
+
+    def __init__(self, map_name: str, digest: bytes, size: int) -> None:
+        self.map_name = map_name
+        self.digest = digest
+        self.size = size
+
+        os.makedirs(MAP_CACHE_DIR, exist_ok=True)
+        self.offset = os.path.getsize(self.part_path) if os.path.isfile(self.part_path) else 0
+        if self.offset > self.size:
+            os.remove(self.part_path)
+            self.offset = 0
+
+        self.last_progress = time.time()
+
+    @property
+    def part_path(self) -> str:
+        return cached_map_path(self.digest) + ".part"
+
+    @property
+    def complete(self) -> bool:
+        return self.offset >= self.size
+
+    def write(self, offset: int, chunk: bytes) -> None:
+        """Appends a chunk if it is the next one expected, ignoring duplicates.
+
+        Args:
+            offset (int): The position of the chunk in the map file.
+            chunk (bytes): The chunk contents.
+        """
+
+        if offset != self.offset:
+            return
+
+        with open(self.part_path, "ab") as f:
+            f.write(chunk)
+
+        self.offset += len(chunk)
+        self.last_progress = time.time()
+
+    def finish(self) -> str:
+        """Verifies the downloaded map and moves it into the cache.
+
+        Returns:
+            str: The path to the cached map.
+
+        Raises:
+            ValueError: If the downloaded contents do not match the digest.
+        """
+
+        with open(self.part_path, "rb") as f:
+            data = f.read()
+
+        if map_digest(data) != self.digest:
+            os.remove(self.part_path)
+            raise ValueError(f"Downloaded map '{self.map_name}' does not match its digest")
+
+        path = cached_map_path(self.digest)
+        os.replace(self.part_path, path)
+        return path
+
+    def __repr__(self) -> str:
+        return f"<MapDownload map_name='{self.map_name}' offset={self.offset} size={self.size}>"
@@ -15,6 +15,13 @@ from .play.client.add_item import PacketPlayInAddItem
 from .play.client.item_drop import PacketPlayInItemDrop
 from .play.client.player_look import PacketPlayInPlayerLook
 from .play.client.shoot import PacketPlayInShoot
+from .play.client.player_state import PacketPlayInPlayerState
+from .play.client.fire_start import PacketPlayInFireStart
+from .play.client.fire_stop import PacketPlayInFireStop
+from .play.client.reliable_ack import PacketPlayInReliableAck
+from .play.client.map_request import PacketPlayInMapRequest
+from .play.client.spectate import PacketPlayInSpectate
+from .play.client.reliable import PacketPlayInReliable
 
 from .play.server.welcome import PacketPlayOutWelcome
 from .play.server.keep_alive import PacketPlayOutKeepAlive
@@ -27,4 +34,16 @@ from .play.server.item_pickup import PacketPlayOutItemPickup
 from .play.server.add_item import PacketPlayOutAddItem
 from .play.server.item_drop import PacketPlayOutItemDrop
 from .play.server.player_look import PacketPlayOutPlayerLook
-from .play.server.shoot import PacketPlayOutShoot
\ No newline at end of file
+from .play.server.shoot import PacketPlayOutShoot
+from .play.server.player_state import PacketPlayOutPlayerState
+from .play.server.fire_start import PacketPlayOutFireStart
+from .play.server.fire_stop import PacketPlayOutFireStop
+from .play.server.reliable import PacketPlayOutReliable
+from .play.server.map_chunk import PacketPlayOutMapChunk
+from .play.server.define_symbol import PacketPlayOutDefineSymbol
+from .play.server.snapshot import PacketPlayOutSnapshot, PlayerSnapshot
+from .play.server.challenge import PacketPlayOutChallenge
+from .play.server.bundle import PacketPlayOutBundle
+from .play.server.world_state import PacketPlayOutWorldState, WorldState, WorldPlayer, WorldItem
+from .play.server.player_hit import PacketPlayOutPlayerHit
+from .play.server.reliable_ack import PacketPlayOutReliableAck
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from connection.util import from_uint16, to_uint16, from_uint32, to_uint32
+from connection.packets import Packet
+
+
+class PacketPlayInFireStop(Packet):
+    """Fire stop packet for the play state.
+
+    Ends the burst identified by `start_tick` after exactly `shot_count` shots.
+    """
+
+    id = 0x1F
+
+    start_tick: int
+    shot_count: int
+
+    def __init__(self, start_tick: int, shot_count: int) -> None:
+        self.start_tick = start_tick
+        self.shot_count = shot_count
+
+        data = bytearray()
+        data.extend(to_uint32(self.start_tick))
+        data.extend(to_uint16(self.shot_count))
+        super().__init__(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayInFireStop:
+        """Create a fire stop packet from bytes."""
+
+        start_tick = from_uint32(data[0:4])
+        shot_count = from_uint16(data[4:6])
+
+        return cls(start_tick, shot_count)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayInFireStop start_tick={self.start_tick} shot_count={self.shot_count}>"
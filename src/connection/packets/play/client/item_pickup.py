@@ -1,36 +1,32 @@
 from __future__ import annotations
 
-from connection.util import from_uint32, to_uint32, from_uint8, to_uint8
+from connection.util import from_uint32, to_uint32
 from connection.packets import Packet
 
 
 class PacketPlayInItemPickup(Packet):
-    """Item pickup packet for the play state."""
+    """Item pickup packet for the play state.
+
+    Only a claim: the player gets the gun once the server confirms the pickup
+    with an item pickup packet of its own.
+    """
 
     id = 0x10
 
-    gun_type: str
     object_id: int
 
-    def __init__(self, gun_type: str, object_id: int) -> None:
-        self.gun_type = gun_type
+    def __init__(self, object_id: int) -> None:
         self.object_id = object_id
 
-        data = bytearray()
-        data.extend(to_uint8(len(self.gun_type)))
-        data.extend(self.gun_type.encode())
-        data.extend(to_uint32(self.object_id))
-        super().__init__(data)
+        super().__init__(to_uint32(self.object_id))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> PacketPlayInItemPickup:
         """Create a item pickup  packet from bytes."""
 
-        gun_type_length = from_uint8(data[0:1])
-        gun_type = data[1:1 + gun_type_length].decode()
-        object_id = from_uint32(data[1 + gun_type_length:5 + gun_type_length])
+        object_id = from_uint32(data[0:4])
 
-        return cls(gun_type, object_id)
+        return cls(object_id)
 
     def __repr__(self) -> str:
-        return f"<PacketPlayInItemPickup gun_type={self.gun_type} object_id={self.object_id}>"
\ No newline at end of file
+        return f"<PacketPlayInItemPickup object_id={self.object_id}>"
@@ -1,29 +1,41 @@
 from __future__ import annotations
+
+from connection.cookies import COOKIE_SIZE, NO_COOKIE
 from connection.packets import Packet
 
 
 class PacketPlayInJoin(Packet):
-    """Join packet for the play state."""
+    """Join packet for the play state.
+
+    The first join carries an empty cookie and is answered with a challenge.
+    The join is only accepted once it echoes the cookie from that challenge.
+    """
 
     id = 0x02
 
     name: str
+    cookie: bytes
+
+    def __init__(self, name: str, cookie: bytes = NO_COOKIE) -> None:
+        if len(cookie) != COOKIE_SIZE:
+            raise ValueError(f"Cookie must be {COOKIE_SIZE} bytes long in PacketPlayInJoin")
 
-    def __init__(self, name: str) -> None:
         self.name = name
+        self.cookie = cookie
 
-        super().__init__(data=name.encode())
+        super().__init__(data=cookie + name.encode())
 
     @classmethod
     def from_bytes(cls, data: bytes) -> PacketPlayInJoin:
         """Create a join packet from bytes."""
 
-        name = data.decode()
+        cookie = bytes(data[:COOKIE_SIZE])
+        name = data[COOKIE_SIZE:].decode()
 
         if not name:
             raise ValueError("Name cannot be empty in PacketPlayInJoin data")
 
-        return cls(name)
+        return cls(name, cookie)
 
     def __repr__(self) -> str:
-        return f"<PacketPlayInJoin name='{self.name}'>"
\ No newline at end of file
+        return f"<PacketPlayInJoin name='{self.name}' cookie={self.cookie.hex()[:8]}>"
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from connection.util import from_uint32, to_uint32
+from connection.packets import Packet
+
+
+class PacketPlayInMapRequest(Packet):
+    """Map request packet for the play state.
+
+    Asks the server for the map with the given SHA-256 digest, starting at
+    `offset` so an interrupted transfer can be resumed.
+    """
+
+    id = 0x23
+
+    digest: bytes
+    offset: int
+
+    def __init__(self, digest: bytes, offset: int = 0) -> None:
+        if len(digest) != 32:
+            raise ValueError("Map digest must be 32 bytes long in PacketPlayInMapRequest")
+
+        self.digest = digest
+        self.offset = offset
+
+        super().__init__(self.digest + to_uint32(self.offset))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayInMapRequest:
+        """Create a map request packet from bytes."""
+
+        digest = data[0:32]
+        offset = from_uint32(data[32:36])
+
+        return cls(digest, offset)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayInMapRequest digest={self.digest.hex()[:12]} offset={self.offset}>"
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from pygame.math import Vector2
+
+from connection.util import from_float, to_float, from_int16, to_int16, from_uint8, to_uint8
+from connection.packets import Packet
+
+
+class PacketPlayInPlayerState(Packet):
+    """Coalesced player state packet for the play state.
+
+    Carries everything the player changed during one client tick (movement, look angle and
+    trigger state) so a single datagram replaces separate move and look packets.
+    """
+
+    id = 0x1B
+
+    HAS_MOVE = 0x01
+    HAS_LOOK = 0x02
+    FIRING = 0x04
+
+    position: Vector2 | None
+    velocity: Vector2 | None
+    acceleration: Vector2 | None
+    angle: float | None
+    firing: bool
+
+    def __init__(
+        self,
+        position: Vector2 | None = None,
+        velocity: Vector2 | None = None,
+        acceleration: Vector2 | None = None,
+        angle: float | None = None,
+        firing: bool = False
+    ) -> None:
+        """Initialize the player state packet.
+
+        Args:
+            position (Vector2 | None, optional): The player's position, if it should be sent. Defaults to None.
+            velocity (Vector2 | None, optional): The player's velocity. Required with position. Defaults to None.
+            acceleration (Vector2 | None, optional): The player's input acceleration. Required with position. Defaults to None.
+            angle (float | None, optional): The look angle in degrees, if it should be sent. Defaults to None.
+            firing (bool, optional): Whether the trigger is held. Defaults to False.
+        """
+
+        self.position = position
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.angle = angle
+        self.firing = firing
+
+        flags = 0
+        data = bytearray()
+
+        if position is not None:
+            flags |= self.HAS_MOVE
+            data.extend(to_float(position.x))
+            data.extend(to_float(position.y))
+            data.extend(to_int16(velocity.x))
+            data.extend(to_int16(velocity.y))
+            data.extend(to_int16(acceleration.x))
+            data.extend(to_int16(acceleration.y))
+
+        if angle is not None:
+            flags |= self.HAS_LOOK
+            data.extend(to_int16(round(angle * 100)))  # centidegrees
+
+        if firing:
+            flags |= self.FIRING
+
+        super().__init__(to_uint8(flags) + data)
+
+    @property
+    def has_move(self) -> bool:
+        """Whether the packet carries movement."""
+
+        return self.position is not None
+
+    @property
+    def has_look(self) -> bool:
+        """Whether the packet carries a look angle."""
+
+        return self.angle is not None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayInPlayerState:
+        """Create a player state packet from bytes."""
+
+        if len(data) < 1:
+            raise ValueError("Invalid data length for PacketPlayInPlayerState")
+
+        flags = from_uint8(data[0:1])
+        offset = 1
+
+        position = velocity = acceleration = angle = None
+        if flags & cls.HAS_MOVE:
+            position = Vector2(from_float(data[offset:offset + 4]), from_float(data[offset + 4:offset + 8]))
+            velocity = Vector2(from_int16(data[offset + 8:offset + 10]), from_int16(data[offset + 10:offset + 12]))
+            acceleration = Vector2(from_int16(data[offset + 12:offset + 14]), from_int16(data[offset + 14:offset + 16]))
+            offset += 16
+
+        if flags & cls.HAS_LOOK:
+            angle = from_int16(data[offset:offset + 2]) / 100
+            offset += 2
+
+        return cls(position, velocity, acceleration, angle, bool(flags & cls.FIRING))
+
+    def __repr__(self) -> str:
+        return (
+            f"<PacketPlayInPlayerState "
+            f"position={self.position} "
+            f"velocity={self.velocity} "
+            f"angle={self.angle} "
+            f"firing={self.firing}>"
+        )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from connection.cookies import COOKIE_SIZE, NO_COOKIE
+from connection.packets import Packet
+
+
+class PacketPlayInSpectate(Packet):
+    """Spectate packet for the play state.
+
+    Subscribes the sender to the snapshot stream without taking a player slot.
+    Spectators send it again every few seconds to keep the subscription alive.
+    Like a join, it must echo the cookie from a challenge to be accepted.
+    """
+
+    id = 0x26
+
+    name: str
+    cookie: bytes
+
+    def __init__(self, name: str, cookie: bytes = NO_COOKIE) -> None:
+        if len(cookie) != COOKIE_SIZE:
+            raise ValueError(f"Cookie must be {COOKIE_SIZE} bytes long in PacketPlayInSpectate")
+
+        self.name = name
+        self.cookie = cookie
+
+        super().__init__(data=cookie + name.encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayInSpectate:
+        """Create a spectate packet from bytes."""
+
+        cookie = bytes(data[:COOKIE_SIZE])
+        name = data[COOKIE_SIZE:].decode()
+
+        return cls(name, cookie)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayInSpectate name='{self.name}' cookie={self.cookie.hex()[:8]}>"
@@ -1,4 +1,6 @@
 from __future__ import annotations
+
+from connection.util import from_symbol, to_symbol
 from connection.packets import Packet
 
 
@@ -7,20 +9,20 @@ class PacketPlayInStartGame(Packet):
 
     id = 0x0D
 
-    map_name: str
+    map_name: int | str
 
-    def __init__(self, map_name: str) -> None:
+    def __init__(self, map_name: int | str) -> None:
         self.map_name = map_name
         
-        super().__init__(data=map_name.encode())
+        super().__init__(data=to_symbol(map_name))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> PacketPlayInStartGame:
         """Create a start game packet from bytes."""
 
-        map_name = data.decode()
+        map_name, _ = from_symbol(data)
 
-        if not map_name:
+        if map_name == "":
             raise ValueError("Map name cannot be empty in PacketPlayInStartGame data")
 
         return cls(map_name)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pygame import Vector2
 
-from connection.util import from_float, to_float, from_uint8, to_uint8
+from connection.util import from_float, to_float, from_symbol, to_symbol, from_uint32, to_uint32
 from connection.packets import Packet
 
 
@@ -11,18 +11,20 @@ class PacketPlayOutAddItem(Packet):
 
     id = 0x11
 
-    gun_type: str
+    gun_type: int | str
+    object_id: int
 
-    def __init__(self, gun_type: str, position: Vector2) -> None:
+    def __init__(self, gun_type: int | str, position: Vector2, object_id: int) -> None:
         self.gun_type = gun_type
+        self.object_id = object_id
         self.position_x = position.x
         self.position_y = position.y
 
         data = bytearray()
-        data.extend(to_uint8(len(gun_type)))
-        data.extend(self.gun_type.encode())
+        data.extend(to_symbol(self.gun_type))
         data.extend(to_float(self.position_x))
         data.extend(to_float(self.position_y))
+        data.extend(to_uint32(self.object_id))
 
         super().__init__(data=data)
 
@@ -30,12 +32,12 @@ class PacketPlayOutAddItem(Packet):
     def from_bytes(cls, data: bytes) -> PacketPlayOutAddItem:
         """Create an item packet from bytes."""
 
-        len_gun_type = from_uint8(data[0:1])
-        gun_type = data[1:1 + len_gun_type].decode()
-        position_x = from_float(data[1 + len_gun_type:5 + len_gun_type])
-        position_y = from_float(data[5 + len_gun_type:9 + len_gun_type])
+        gun_type, offset = from_symbol(data)
+        position_x = from_float(data[offset:offset + 4])
+        position_y = from_float(data[offset + 4:offset + 8])
+        object_id = from_uint32(data[offset + 8:offset + 12])
 
-        return cls(gun_type, Vector2(position_x, position_y))
+        return cls(gun_type, Vector2(position_x, position_y), object_id)
 
     def __repr__(self) -> str:
-        return f"<PacketPlayOutItem gun_type={self.gun_type}>"
\ No newline at end of file
+        return f"<PacketPlayOutItem gun_type={self.gun_type} object_id={self.object_id}>"
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from connection.util import from_uint8, to_uint8, from_uint16, to_uint16
+from connection.packets import Packet
+
+
+class PacketPlayOutBundle(Packet):
+    """Bundle packet for the play state.
+
+    Carries several packets in one datagram. Each one is prefixed with its
+    length and is handled by the client as if it had arrived on its own.
+    """
+
+    id = 0x29
+
+    packets: list[Packet]
+
+    def __init__(self, packets: list[Packet]) -> None:
+        if len(packets) > 0xFF:
+            raise ValueError("Too many packets in PacketPlayOutBundle")
+
+        self.packets = packets
+
+        data = bytearray(to_uint8(len(self.packets)))
+        for packet in self.packets:
+            packet_data = packet.to_bytes()
+            data.extend(to_uint16(len(packet_data)))
+            data.extend(packet_data)
+
+        super().__init__(bytes(data))
+
+    @staticmethod
+    def size_of(packet: Packet) -> int:
+        """Returns how many bytes a packet takes up inside a bundle."""
+
+        return 2 + 1 + len(packet.data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutBundle:
+        """Create a bundle packet from bytes."""
+
+        if len(data) < 1:
+            raise ValueError("Invalid data length for PacketPlayOutBundle")
+
+        count = from_uint8(data[0:1])
+        offset = 1
+
+        packets = []
+        for _ in range(count):
+            length = from_uint16(data[offset:offset + 2])
+            offset += 2
+
+            if offset + length > len(data):
+                raise ValueError("Truncated packet in PacketPlayOutBundle")
+
+            packets.append(Packet.from_bytes(data[offset:offset + length]))
+            offset += length
+
+        return cls(packets)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutBundle packets={self.packets}>"
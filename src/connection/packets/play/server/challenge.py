@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from connection.cookies import COOKIE_SIZE
+from connection.packets import Packet
+
+
+class PacketPlayOutChallenge(Packet):
+    """Challenge packet for the play state.
+
+    Answers a join or spectate without a valid cookie. The client sends the
+    same request again with this cookie.
+    """
+
+    id = 0x28
+
+    cookie: bytes
+
+    def __init__(self, cookie: bytes) -> None:
+        if len(cookie) != COOKIE_SIZE:
+            raise ValueError(f"Cookie must be {COOKIE_SIZE} bytes long in PacketPlayOutChallenge")
+
+        self.cookie = cookie
+
+        super().__init__(self.cookie)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutChallenge:
+        """Create a challenge packet from bytes."""
+
+        return cls(bytes(data[:COOKIE_SIZE]))
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutChallenge cookie={self.cookie.hex()[:8]}>"
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from connection.util import from_uint8, to_uint8
+from connection.packets import Packet
+
+
+class PacketPlayOutDefineSymbol(Packet):
+    """Define symbol packet for the play state.
+
+    Adds a string to the client's symbol table. Always sent through the reliable
+    channel, so later reliable packets can refer to the new id right away.
+    """
+
+    id = 0x25
+
+    symbol_id: int
+    symbol: str
+
+    def __init__(self, symbol_id: int, symbol: str) -> None:
+        self.symbol_id = symbol_id
+        self.symbol = symbol
+
+        super().__init__(to_uint8(self.symbol_id) + self.symbol.encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutDefineSymbol:
+        """Create a define symbol packet from bytes."""
+
+        symbol_id = from_uint8(data[0:1])
+        symbol = data[1:].decode()
+
+        return cls(symbol_id, symbol)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutDefineSymbol symbol_id={self.symbol_id} symbol='{self.symbol}'>"
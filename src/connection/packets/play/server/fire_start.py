@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from connection.util import from_symbol, to_symbol, from_uint32, to_uint32, from_float, to_float
+from connection.packets import Packet
+
+
+class PacketPlayOutFireStart(Packet):
+    """Fire start packet for the play state."""
+
+    id = 0x1E
+
+    player_id: int
+    gun_type: int | str
+    seed: int
+    start_tick: int
+    angle: float
+
+    def __init__(self, player_id: int, gun_type: int | str, seed: int, start_tick: int, angle: float) -> None:
+        self.player_id = player_id
+        self.gun_type = gun_type
+        self.seed = seed
+        self.start_tick = start_tick
+        self.angle = angle
+
+        data = bytearray()
+        data.extend(to_uint32(self.player_id))
+        data.extend(to_symbol(self.gun_type))
+        data.extend(to_uint32(self.seed))
+        data.extend(to_uint32(self.start_tick))
+        data.extend(to_float(self.angle))
+        super().__init__(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutFireStart:
+        """Create a fire start packet from bytes."""
+
+        player_id = from_uint32(data[0:4])
+        gun_type, offset = from_symbol(data[4:])
+        offset += 4
+        seed = from_uint32(data[offset:offset + 4])
+        start_tick = from_uint32(data[offset + 4:offset + 8])
+        angle = from_float(data[offset + 8:offset + 12])
+
+        return cls(player_id, gun_type, seed, start_tick, angle)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutFireStart player_id={self.player_id} gun_type={self.gun_type} seed={self.seed} start_tick={self.start_tick} angle={self.angle}>"
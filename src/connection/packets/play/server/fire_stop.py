@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from connection.util import from_uint16, to_uint16, from_uint32, to_uint32
+from connection.packets import Packet
+
+
+class PacketPlayOutFireStop(Packet):
+    """Fire stop packet for the play state."""
+
+    id = 0x20
+
+    player_id: int
+    start_tick: int
+    shot_count: int
+
+    def __init__(self, player_id: int, start_tick: int, shot_count: int) -> None:
+        self.player_id = player_id
+        self.start_tick = start_tick
+        self.shot_count = shot_count
+
+        data = bytearray()
+        data.extend(to_uint32(self.player_id))
+        data.extend(to_uint32(self.start_tick))
+        data.extend(to_uint16(self.shot_count))
+        super().__init__(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutFireStop:
+        """Create a fire stop packet from bytes."""
+
+        player_id = from_uint32(data[0:4])
+        start_tick = from_uint32(data[4:8])
+        shot_count = from_uint16(data[8:10])
+
+        return cls(player_id, start_tick, shot_count)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutFireStop player_id={self.player_id} start_tick={self.start_tick} shot_count={self.shot_count}>"
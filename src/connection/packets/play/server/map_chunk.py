@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from connection.util import from_uint32, to_uint32
+from connection.packets import Packet
+
+
+class PacketPlayOutMapChunk(Packet):
+    """Map chunk packet for the play state."""
+
+    id = 0x24
+
+    offset: int
+    chunk: bytes
+
+    def __init__(self, offset: int, chunk: bytes) -> None:
+        self.offset = offset
+        self.chunk = chunk
+
+        super().__init__(to_uint32(self.offset) + self.chunk)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutMapChunk:
+        """Create a map chunk packet from bytes."""
+
+        offset = from_uint32(data[0:4])
+        chunk = bytes(data[4:])
+
+        return cls(offset, chunk)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutMapChunk offset={self.offset} size={len(self.chunk)}>"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from connection.util import from_uint32, to_uint32, from_uint8, to_uint8, from_int16, to_int16
+from connection.packets import Packet
+
+
+class PacketPlayOutPlayerHit(Packet):
+    """Player hit packet for the play state.
+
+    Sent when the server's simulation finds a bullet hitting a player. The
+    health is the player's new total, not the damage taken, so a lost hit
+    packet is corrected by the next one.
+    """
+
+    id = 0x2B
+
+    player_id: int
+    shooter_id: int
+    health: int
+    angle: float
+
+    def __init__(self, player_id: int, shooter_id: int, health: int, angle: float) -> None:
+        """Initialize the player hit packet.
+
+        Args:
+            player_id (int): The ID of the player who was hit.
+            shooter_id (int): The ID of the player who fired the bullet.
+            health (int): The health the player has left.
+            angle (float): The direction the bullet was flying in, in degrees.
+        """
+
+        self.player_id = player_id
+        self.shooter_id = shooter_id
+        self.health = health
+        self.angle = angle
+
+        data = bytearray()
+        data.extend(to_uint32(self.player_id))
+        data.extend(to_uint32(self.shooter_id))
+        data.extend(to_uint8(self.health))
+        data.extend(to_int16(round(self.angle * 100)))  # centidegrees
+        super().__init__(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutPlayerHit:
+        """Create a player hit packet from bytes."""
+
+        if len(data) < 11:
+            raise ValueError("Invalid data length for PacketPlayOutPlayerHit")
+
+        player_id = from_uint32(data[0:4])
+        shooter_id = from_uint32(data[4:8])
+        health = from_uint8(data[8:9])
+        angle = from_int16(data[9:11]) / 100
+
+        return cls(player_id, shooter_id, health, angle)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutPlayerHit player_id={self.player_id} shooter_id={self.shooter_id} health={self.health}>"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from connection.util import from_uint32, to_uint32
+from connection.util import from_uint32, to_uint32, from_symbol, to_symbol
 from connection.packets import Packet
 
 
@@ -10,15 +10,15 @@ class PacketPlayOutPlayerJoin(Packet):
     id = 0x07
 
     player_id: int
-    name: str
+    name: int | str
 
-    def __init__(self, player_id: int, name: str) -> None:
+    def __init__(self, player_id: int, name: int | str) -> None:
         self.player_id = player_id
         self.name = name
 
         super().__init__(
             to_uint32(self.player_id) +
-            name.encode()
+            to_symbol(name)
         )
 
     @classmethod
@@ -26,7 +26,7 @@ class PacketPlayOutPlayerJoin(Packet):
         """Create a join packet from bytes."""
 
         player_id = from_uint32(data[:4])
-        name = data[4:].decode()
+        name, _ = from_symbol(data[4:])
 
         return cls(player_id, name)
 
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from connection.util import from_uint16, to_uint16
+from connection.packets import Packet
+
+
+class PacketPlayOutReliable(Packet):
+    """Reliable envelope packet for the play state.
+
+    Wraps another packet with a sequence number. The client answers every
+    envelope with a reliable ack and handles the wrapped packets in order.
+    """
+
+    id = 0x21
+
+    sequence: int
+    packet: Packet
+
+    def __init__(self, sequence: int, packet: Packet) -> None:
+        self.sequence = sequence
+        self.packet = packet
+
+        data = bytearray()
+        data.extend(to_uint16(self.sequence))
+        data.extend(self.packet.to_bytes())
+        super().__init__(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutReliable:
+        """Create a reliable envelope packet from bytes."""
+
+        sequence = from_uint16(data[0:2])
+        packet = Packet.from_bytes(data[2:])
+
+        return cls(sequence, packet)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutReliable sequence={self.sequence} packet={self.packet}>"
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from connection.util import from_uint16, to_uint16
+from connection.packets import Packet
+
+
+class PacketPlayOutReliableAck(Packet):
+    """Reliable ack packet for the play state, sent by the server."""
+
+    id = 0x2D
+
+    sequence: int
+
+    def __init__(self, sequence: int) -> None:
+        self.sequence = sequence
+
+        super().__init__(to_uint16(self.sequence))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutReliableAck:
+        """Create a reliable ack packet from bytes."""
+
+        sequence = from_uint16(data[0:2])
+
+        return cls(sequence)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutReliableAck sequence={self.sequence}>"
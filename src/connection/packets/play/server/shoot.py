@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pygame.math import Vector2
-from connection.util import from_uint8, to_uint8, from_float, to_float, from_uint32, to_uint32
+from connection.util import from_symbol, to_symbol, from_float, to_float, from_uint32, to_uint32
 from connection.packets import Packet
 
 
@@ -11,11 +11,11 @@ class PacketPlayOutShoot(Packet):
     id = 0x18
 
     player_id: int
-    gun_type: str
+    gun_type: int | str
     angle: float
     position: Vector2
 
-    def __init__(self, player_id: int, gun_type: str, angle: float, position: Vector2) -> None:
+    def __init__(self, player_id: int, gun_type: int | str, angle: float, position: Vector2) -> None:
         self.player_id = player_id
         self.gun_type = gun_type
         self.angle = angle
@@ -23,8 +23,7 @@ class PacketPlayOutShoot(Packet):
 
         data = bytearray()
         data.extend(to_uint32(self.player_id))
-        data.extend(to_uint8(len(self.gun_type)))
-        data.extend(self.gun_type.encode())
+        data.extend(to_symbol(self.gun_type))
         data.extend(to_float(self.angle))
         data.extend(to_float(self.position.x))
         data.extend(to_float(self.position.y))
@@ -35,11 +34,11 @@ class PacketPlayOutShoot(Packet):
         """Create a shoot packet from bytes."""
 
         player_id = from_uint32(data[0:4])
-        gun_type_length = from_uint8(data[4:5])
-        gun_type = data[5:5 + gun_type_length].decode()
-        angle = from_float(data[5 + gun_type_length:9 + gun_type_length])
-        position_x = from_float(data[9 + gun_type_length:13 + gun_type_length])
-        position_y = from_float(data[13 + gun_type_length:17 + gun_type_length])
+        gun_type, offset = from_symbol(data[4:])
+        offset += 4
+        angle = from_float(data[offset:offset + 4])
+        position_x = from_float(data[offset + 4:offset + 8])
+        position_y = from_float(data[offset + 8:offset + 12])
         position = Vector2(position_x, position_y)
 
         return cls(player_id, gun_type, angle, position)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pygame.math import Vector2
+
+from connection.util import from_float, to_float, from_int16, to_int16, from_uint8, to_uint8, from_uint32, to_uint32
+from connection.packets import Packet
+
+
+@dataclass
+class PlayerSnapshot:
+    player_id: int
+    position: Vector2
+    velocity: Vector2
+    angle: float
+    firing: bool
+
+
+class PacketPlayOutSnapshot(Packet):
+    """Snapshot packet for the play state.
+
+    The state of every player at one server tick, sent to spectators at a lower
+    rate than the player stream. It is encoded once per tick and the same bytes
+    go to every spectator.
+    """
+
+    id = 0x27
+
+    FIRING = 0x01
+
+    ENTRY_SIZE = 4 + 1 + 8 + 4 + 2
+
+    tick: int
+    players: list[PlayerSnapshot]
+
+    def __init__(self, tick: int, players: list[PlayerSnapshot]) -> None:
+        self.tick = tick
+        self.players = players
+
+        data = bytearray()
+        data.extend(to_uint32(self.tick))
+        data.extend(to_uint8(len(self.players)))
+        for player in self.players:
+            data.extend(to_uint32(player.player_id))
+            data.extend(to_uint8(self.FIRING if player.firing else 0))
+            data.extend(to_float(player.position.x))
+            data.extend(to_float(player.position.y))
+            data.extend(to_int16(round(player.velocity.x)))
+            data.extend(to_int16(round(player.velocity.y)))
+            data.extend(to_int16(round(player.angle * 100)))
+        super().__init__(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutSnapshot:
+        """Create a snapshot packet from bytes."""
+
+        if len(data) < 5:
+            raise ValueError("Data must contain at least 5 bytes")
+
+        tick = from_uint32(data[0:4])
+        count = from_uint8(data[4:5])
+        if len(data) < 5 + count * cls.ENTRY_SIZE:
+            raise ValueError(f"Data is too short for {count} players")
+
+        players = []
+        offset = 5
+        for _ in range(count):
+            players.append(PlayerSnapshot(
+                player_id=from_uint32(data[offset:offset + 4]),
+                firing=bool(data[offset + 4] & cls.FIRING),
+                position=Vector2(
+                    from_float(data[offset + 5:offset + 9]),
+                    from_float(data[offset + 9:offset + 13])
+                ),
+                velocity=Vector2(
+                    from_int16(data[offset + 13:offset + 15]),
+                    from_int16(data[offset + 15:offset + 17])
+                ),
+                angle=from_int16(data[offset + 17:offset + 19]) / 100
+            ))
+            offset += cls.ENTRY_SIZE
+
+        return cls(tick, players)
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutSnapshot tick={self.tick} players={len(self.players)}>"
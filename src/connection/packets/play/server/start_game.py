@@ -1,4 +1,6 @@
 from __future__ import annotations
+
+from connection.util import from_uint32, to_uint32, from_symbol, to_symbol
 from connection.packets import Packet
 
 
@@ -7,23 +9,32 @@ class PacketPlayOutStartGame(Packet):
 
     id = 0x0E
 
-    map_name: str
+    map_name: int | str
+    map_digest: bytes
+    map_size: int
+
+    def __init__(self, map_name: int | str, map_digest: bytes, map_size: int) -> None:
+        if len(map_digest) != 32:
+            raise ValueError("Map digest must be 32 bytes long in PacketPlayOutStartGame")
 
-    def __init__(self, map_name: str) -> None:
         self.map_name = map_name
+        self.map_digest = map_digest
+        self.map_size = map_size
 
-        super().__init__(data=map_name.encode())
+        super().__init__(data=map_digest + to_uint32(map_size) + to_symbol(map_name))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> PacketPlayOutStartGame:
         """Create a start game packet from bytes."""
 
-        map_name = data.decode()
+        map_digest = data[0:32]
+        map_size = from_uint32(data[32:36])
+        map_name, _ = from_symbol(data[36:])
 
-        if not map_name:
+        if map_name == "":
             raise ValueError("Map name cannot be empty in PacketPlayOutStartGame data")
 
-        return cls(map_name)
+        return cls(map_name, map_digest, map_size)
 
     def __repr__(self) -> str:
-        return f"<PacketPlayOutStartGame map_name='{self.map_name}'>"
\ No newline at end of file
+        return f"<PacketPlayOutStartGame map_name='{self.map_name}' map_digest={self.map_digest.hex()[:12]} map_size={self.map_size}>"
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pygame.math import Vector2
+
+from connection.util import (
+    from_float, to_float,
+    from_int16, to_int16,
+    from_uint8, to_uint8,
+    from_uint16, to_uint16,
+    from_uint32, to_uint32,
+    from_symbol, to_symbol
+)
+from connection.packets import Packet
+
+
+FRAGMENT_SIZE = 900  # bytes of world state per fragment, keeps every datagram under BUFFER_SIZE
+
+
+@dataclass
+class WorldPlayer:
+    player_id: int
+    name: int | str
+    character_index: int = 0
+    alive: bool = True
+    gun_type: int | str | None = None
+    position: Vector2 | None = None
+    angle: float = 0.0
+
+
+@dataclass
+class WorldItem:
+    object_id: int
+    gun_type: int | str
+    position: Vector2
+
+
+@dataclass
+class WorldState:
+    """Everything a player joining late needs to see the same world as the others."""
+
+    ALIVE = 0x01
+    HAS_GUN = 0x02
+    HAS_POSITION = 0x04
+
+    map_name: int | str | None = None
+    map_digest: bytes = bytes(32)
+    map_size: int = 0
+    players: list[WorldPlayer] = field(default_factory=list)
+    items: list[WorldItem] = field(default_factory=list)
+
+    def to_bytes(self) -> bytes:
+        data = bytearray()
+
+        # The map is only sent once a game has started, an empty name means the lobby
+        data.extend(to_symbol(self.map_name if self.map_name is not None else ""))
+        if self.map_name is not None:
+            data.extend(self.map_digest)
+            data.extend(to_uint32(self.map_size))
+
+        data.extend(to_uint8(len(self.players)))
+        for player in self.players:
+            flags = self.ALIVE if player.alive else 0
+            if player.gun_type is not None:
+                flags |= self.HAS_GUN
+            if player.position is not None:
+                flags |= self.HAS_POSITION
+
+            data.extend(to_uint32(player.player_id))
+            data.extend(to_symbol(player.name))
+            data.extend(to_uint8(player.character_index))
+            data.extend(to_uint8(flags))
+            if player.gun_type is not None:
+                data.extend(to_symbol(player.gun_type))
+            if player.position is not None:
+                data.extend(to_float(player.position.x))
+                data.extend(to_float(player.position.y))
+                data.extend(to_int16(round(player.angle * 100)))
+
+        data.extend(to_uint16(len(self.items)))
+        for item in self.items:
+            data.extend(to_uint32(item.object_id))
+            data.extend(to_symbol(item.gun_type))
+            data.extend(to_float(item.position.x))
+            data.extend(to_float(item.position.y))
+
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> WorldState:
+        state = cls()
+
+        map_name, offset = from_symbol(data)
+        if map_name != "":
+            state.map_name = map_name
+            state.map_digest = bytes(data[offset:offset + 32])
+            state.map_size = from_uint32(data[offset + 32:offset + 36])
+            offset += 36
+
+        count = from_uint8(data[offset:offset + 1])
+        offset += 1
+        for _ in range(count):
+            player_id = from_uint32(data[offset:offset + 4])
+            name, consumed = from_symbol(data[offset + 4:])
+            offset += 4 + consumed
+
+            player = WorldPlayer(player_id, name, character_index=from_uint8(data[offset:offset + 1]))
+            flags = from_uint8(data[offset + 1:offset + 2])
+            offset += 2
+
+            player.alive = bool(flags & cls.ALIVE)
+            if flags & cls.HAS_GUN:
+                player.gun_type, consumed = from_symbol(data[offset:])
+                offset += consumed
+            if flags & cls.HAS_POSITION:
+                player.position = Vector2(from_float(data[offset:offset + 4]), from_float(data[offset + 4:offset + 8]))
+                player.angle = from_int16(data[offset + 8:offset + 10]) / 100
+                offset += 10
+
+            state.players.append(player)
+
+        count = from_uint16(data[offset:offset + 2])
+        offset += 2
+        for _ in range(count):
+            object_id = from_uint32(data[offset:offset + 4])
+            gun_type, consumed = from_symbol(data[offset + 4:])
+            offset += 4 + consumed
+
+            position = Vector2(from_float(data[offset:offset + 4]), from_float(data[offset + 4:offset + 8]))
+            offset += 8
+
+            state.items.append(WorldItem(object_id, gun_type, position))
+
+        return state
+
+
+class PacketPlayOutWorldState(Packet):
+    """World state packet for the play state.
+
+    One fragment of an encoded `WorldState`. The fragments are sent over the
+    reliable channel, so they arrive complete and in order, and the client
+    decodes the state once the last one is in.
+    """
+
+    id = 0x2A
+
+    fragment: int
+    fragment_count: int
+    payload: bytes
+
+    def __init__(self, fragment: int, fragment_count: int, payload: bytes) -> None:
+        self.fragment = fragment
+        self.fragment_count = fragment_count
+        self.payload = payload
+
+        super().__init__(to_uint8(fragment) + to_uint8(fragment_count) + payload)
+
+    @classmethod
+    def split(cls, state: WorldState) -> list[PacketPlayOutWorldState]:
+        """Encodes a world state into as many fragments as it needs."""
+
+        data = state.to_bytes()
+        chunks = [data[offset:offset + FRAGMENT_SIZE] for offset in range(0, len(data), FRAGMENT_SIZE)]
+        if len(chunks) > 0xFF:
+            raise ValueError("World state is too large for PacketPlayOutWorldState")
+
+        return [cls(index, len(chunks), chunk) for index, chunk in enumerate(chunks)]
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PacketPlayOutWorldState:
+        """Create a world state packet from bytes."""
+
+        if len(data) < 2:
+            raise ValueError("Invalid data length for PacketPlayOutWorldState")
+
+        return cls(from_uint8(data[0:1]), from_uint8(data[1:2]), bytes(data[2:]))
+
+    def __repr__(self) -> str:
+        return f"<PacketPlayOutWorldState fragment={self.fragment + 1}/{self.fragment_count} size={len(self.payload)}>"
@@ -0,0 +1,191 @@
+import threading
+
+import pytmx
+from pygame import Vector2
+
+from engine import Scene, GameObject, Transform, BoxCollider, RigidBody, Tilemap
+from game.consts import MAP_SCALE, PLAYER_SIZE, PLAYER_DRAG, PLAYER_GRAVITY, FALL_LIMIT
+
+
+PHYSICS_STEP = 1 / 60  # seconds per fixed physics step
+MAX_CATCH_UP = 0.25  # seconds of steps run at most in one go after a stall
+
+RECONCILE_DISTANCE = 96  # pixels a reported position may be away from the simulated one
+MAX_MOVE_FORCE = 1700  # the walking force of PlayerController
+MAX_HORIZONTAL_SPEED = 1500  # pixels per second, running plus a boost and a knockback
+MAX_RISE_SPEED = 1000  # pixels per second, a jump plus a knockback
+
+
+class PlayerPhysics:
+    """Moves every player on the server with the engine's own rigid bodies.
+
+    The map colliders and the player bodies live in a scene that is never
+    drawn, built from the same `Tilemap`, `BoxCollider` and `RigidBody` the
+    clients use, so a step here moves a body as it moves on the client that
+    owns it. Between two reports a body keeps walking with the last input it
+    reported. A report is accepted as the player's new state when it is
+    plausible: not faster than a player can move and close to where the
+    simulation has the body. A player only has no body at the start of a
+    round, after dying or after falling off the map, and its first report
+    then has to be at a spawn point; if it is not, the body is placed at the
+    nearest one. Anything
+    else is refused and the server's state stays authoritative.
+    """
+
+    scene: Scene | None
+    spawn_points: list[Vector2]
+
+    _lock: threading.Lock
+    _bodies: dict[int, GameObject]
+    _inputs: dict[int, Vector2]
+
+    def __init__(self) -> None:
+        self.scene = None
+        self.spawn_points = []
+
+        self._lock = threading.Lock()
+        self._bodies = {}
+        self._inputs = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a map is loaded. Without one nothing is simulated and every report is accepted."""
+
+        return self.scene is not None
+
+    def load_map(self, path: str) -> None:
+        """Builds a headless scene with the colliders of a map and no players.
+
+        Args:
+            path (str): The path to the .tmx file.
+        """
+
+        scene = Scene(body_storage=True)
+        map_object = GameObject("Map")
+        map_object.add_component(Transform(scale=MAP_SCALE))
+        tilemap = map_object.add_component(Tilemap(path, load_images=False))
+        scene.add(map_object)
+
+        spawn_points = []
+        try:
+            for spawn in tilemap.data.get_layer_by_name("Spawn"):
+                spawn: pytmx.TiledObject
+
+                if spawn.name == "PlayerSpawnPoint":
+                    spawn_points.append(tilemap.get_position(spawn.x, spawn.y))
+        except ValueError:
+            pass
+
+        with self._lock:
+            self.scene = scene
+            self._bodies.clear()
+            self._inputs.clear()
+            self.spawn_points = spawn_points
+
+    def unload(self) -> None:
+        """Drops the map and every player."""
+
+        with self._lock:
+            self.scene = None
+            self._bodies.clear()
+            self._inputs.clear()
+            self.spawn_points = []
+
+    def remove_player(self, player_id: int) -> None:
+        """Takes a player's body out of the simulation."""
+
+        with self._lock:
+            body = self._bodies.pop(player_id, None)
+            self._inputs.pop(player_id, None)
+            if body is not None and self.scene is not None:
+                self.scene.remove(body)
+
+    def report(self, player_id: int, position: Vector2, velocity: Vector2, acceleration: Vector2) -> bool:
+        """Checks the state a client reported for its player and takes it if it is plausible.
+
+        Args:
+            player_id (int): The ID of the player.
+            position (Vector2): The reported position.
+            velocity (Vector2): The reported velocity.
+            acceleration (Vector2): The reported input acceleration.
+
+        Returns:
+            bool: Whether the report was accepted. If not, `state` has the position to correct the client to.
+        """
+
+        with self._lock:
+            if self.scene is None:
+                return True
+
+            # Only a round start, a death or a fall leaves a player without a body, so only then may it snap to a spawn point
+            body = self._bodies.get(player_id)
+            if body is None:
+                spawn = min(self.spawn_points, key=position.distance_to, default=position)
+                body = self._add_body(player_id, spawn)
+
+            if abs(velocity.x) > MAX_HORIZONTAL_SPEED or velocity.y < -MAX_RISE_SPEED:
+                return False
+
+            simulated = body.get_component(Transform).position
+            if simulated.distance_to(position) > RECONCILE_DISTANCE:
+                return False
+
+            body.get_component(Transform).position = Vector2(position)
+            body.get_component(RigidBody).velocity = Vector2(velocity)
+            self._inputs[player_id] = Vector2(
+                max(-MAX_MOVE_FORCE, min(MAX_MOVE_FORCE, acceleration.x)),
+                0
+            )
+            return True
+
+    def step(self, dt: float) -> None:
+        """Advances every body by one fixed step.
+
+        Args:
+            dt (float): The length of the step, in seconds.
+        """
+
+        with self._lock:
+            if self.scene is None:
+                return
+
+            for player_id, body in self._bodies.items():
+                body.get_component(RigidBody).add_force(self._inputs[player_id])
+
+            self.scene._fixed_update(dt)
+
+            # The client puts a fallen player back at a spawn point, so the body goes and its next report places it again
+            for player_id, body in list(self._bodies.items()):
+                if body.get_component(Transform).y > FALL_LIMIT:
+                    del self._bodies[player_id]
+                    del self._inputs[player_id]
+                    self.scene.remove(body)
+
+    def state(self, player_id: int) -> tuple[Vector2, Vector2] | None:
+        """Returns the simulated position and velocity of a player, or None if it has no body."""
+
+        with self._lock:
+            body = self._bodies.get(player_id)
+            if body is None:
+                return None
+
+            return body.get_component(Transform).position.copy(), body.get_component(RigidBody).velocity.copy()
+
+    def _add_body(self, player_id: int, position: Vector2) -> GameObject:
+        width, height = PLAYER_SIZE
+
+        body = GameObject(f"Player ({player_id})")
+        body.add_component(Transform(position=Vector2(position)))
+        body.add_component(BoxCollider(width=width, height=height, offset=(-width / 2, -height)))
+        body.add_component(RigidBody(drag=PLAYER_DRAG, gravity=PLAYER_GRAVITY))
+        self.scene.add(body)
+
+        self._bodies[player_id] = body
+        self._inputs[player_id] = Vector2(0, 0)
+        return body
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def __repr__(self) -> str:
+        return f"<PlayerPhysics loaded={self.loaded} players={len(self._bodies)}>"
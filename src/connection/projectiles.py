@@ -0,0 +1,342 @@
+import math
+import random
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pytmx
+from pygame import Vector2
+
+from engine.core.spatial_hash import segment_box_times
+from game.ballistics import muzzle_position, burst_spread, hitscan_range
+from game.consts import GUN_ATTRIBUTES, MAP_SCALE, PLAYER_SIZE, BULLET_SIZE
+
+
+@dataclass
+class Hit:
+    player_id: int
+    shooter_id: int
+    damage: int
+    angle: float
+
+
+def map_colliders(path: str, scale: float = MAP_SCALE) -> np.ndarray:
+    """Reads the solid colliders of a map as world space boxes.
+
+    The map is parsed without loading any tileset image, so this works on a
+    server without a display. The boxes are placed the way `Tilemap` places
+    its colliders for a map centered on the origin.
+
+    Args:
+        path (str): The path to the .tmx file.
+        scale (float): How much the map is scaled up in the game.
+
+    Returns:
+        np.ndarray: One `(min x, min y, max x, max y)` row per collider.
+    """
+
+    data = pytmx.TiledMap(path)
+    offset_x = data.width * data.tilewidth * scale / 2
+    offset_y = data.height * data.tileheight * scale / 2
+
+    try:
+        layer = data.get_layer_by_name("Collider")
+    except ValueError:
+        return np.empty((0, 4))
+
+    boxes = [
+        (
+            obj.x * scale - offset_x,
+            obj.y * scale - offset_y,
+            (obj.x + obj.width) * scale - offset_x,
+            (obj.y + obj.height) * scale - offset_y
+        )
+        for obj in layer
+        if obj.width and obj.height and not obj.properties.get("is_trigger", False)
+    ]
+
+    return np.array(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+def player_boxes(players: dict[int, Vector2], grow: float) -> tuple[np.ndarray, np.ndarray]:
+    """Builds the world space box of every player.
+
+    Args:
+        players (dict[int, Vector2]): The position of every player, at the bottom center of its box.
+        grow (float): How far each box grows up and left, for a shot with a size hanging from its top left.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The player IDs and one `(min x, min y, max x, max y)` row per player.
+    """
+
+    ids = np.fromiter(players.keys(), dtype=np.int64, count=len(players))
+    positions = np.array([(p.x, p.y) for p in players.values()], dtype=np.float64)
+
+    width, height = PLAYER_SIZE
+    boxes = np.column_stack((
+        positions[:, 0] - width / 2 - grow,
+        positions[:, 1] - height - grow,
+        positions[:, 0] + width / 2,
+        positions[:, 1]
+    ))
+
+    return ids, boxes
+
+
+class BurstReplay:
+    """An automatic burst replayed on the server from its seed, like `BurstController` does on the clients."""
+
+    gun_type: str
+    start_tick: int
+
+    _rng: random.Random
+    _fire_rate: float
+    _spread: float
+    _start_time: float
+    _shots: int
+    _shot_limit: int | None
+
+    def __init__(self, gun_type: str, seed: int, start_tick: int, now: float) -> None:
+        self.gun_type = gun_type
+        self.start_tick = start_tick
+
+        self._rng = random.Random(seed)
+        self._fire_rate = GUN_ATTRIBUTES[gun_type]["fire_rate"]
+        self._spread = GUN_ATTRIBUTES[gun_type]["spread"]
+        self._start_time = now
+        self._shots = 0
+        self._shot_limit = None
+
+    @property
+    def finished(self) -> bool:
+        return self._shot_limit is not None and self._shots >= self._shot_limit
+
+    def stop(self, shot_count: int | None = None) -> None:
+        """Ends the burst once `shot_count` shots have been fired, or right away if None."""
+
+        if shot_count is None:
+            shot_count = self._shots
+            if self._shot_limit is not None:
+                shot_count = min(shot_count, self._shot_limit)
+
+        self._shot_limit = shot_count
+
+    def due(self, now: float, look_angle: float) -> list[float]:
+        """Returns the angles of the shots that are due by now."""
+
+        due = int((now - self._start_time) / self._fire_rate) + 1
+        if self._shot_limit is not None:
+            due = self._shot_limit
+
+        angles = []
+        while self._shots < due:
+            angles.append(look_angle + burst_spread(self._rng, self._spread))
+            self._shots += 1
+
+        return angles
+
+
+class ProjectileSimulation:
+    """Every live bullet of a game, simulated on the server.
+
+    Bullets are kept as rows of NumPy arrays instead of objects. Each step
+    moves all of them at once and tests the segment each one covers against
+    every player box and every map collider in one batch, so a bullet is never
+    skipped over a thin target, however fast it is. A bullet stops at the
+    first thing it reaches: a player is hit only if no wall is in the way.
+
+    A shot of a hitscan gun is no bullet: it is kept as a ray until the next
+    step, which tests it the same way over the gun's whole range at once.
+    """
+
+    _lock: threading.Lock
+    _count: int
+    _position: np.ndarray
+    _velocity: np.ndarray
+    _lifetime: np.ndarray
+    _damage: np.ndarray
+    _owner: np.ndarray
+    _walls: np.ndarray
+    _rays: list[tuple[int, int, float, tuple[float, float], tuple[float, float]]]
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._lock = threading.Lock()
+        self._count = 0
+        self._position = np.zeros((capacity, 2))
+        self._velocity = np.zeros((capacity, 2))
+        self._lifetime = np.zeros(capacity)
+        self._damage = np.zeros(capacity, dtype=np.int32)
+        self._owner = np.zeros(capacity, dtype=np.int64)
+        self._walls = np.empty((0, 4))
+        self._rays = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def load_map(self, path: str) -> None:
+        """Uses the colliders of a map as walls and removes every bullet."""
+
+        walls = map_colliders(path)
+        with self._lock:
+            self._walls = walls
+            self._count = 0
+            self._rays.clear()
+
+    def spawn(self, owner: int, gun_type: str, angle: float, position: Vector2) -> None:
+        """Adds a bullet fired by a player, or the ray of a hitscan shot.
+
+        Args:
+            owner (int): The ID of the player who fired, who cannot be hit by it.
+            gun_type (str): The gun the bullet was fired with.
+            angle (float): The direction of the bullet in degrees.
+            position (Vector2): Where the bullet was fired from.
+        """
+
+        attributes = GUN_ATTRIBUTES[gun_type]
+        radians = math.radians(angle)
+
+        if attributes["hitscan"]:
+            reach = hitscan_range(attributes)
+            with self._lock:
+                self._rays.append((
+                    owner,
+                    attributes["damage"],
+                    angle,
+                    (position.x, position.y),
+                    (reach * math.cos(radians), reach * math.sin(radians))
+                ))
+            return
+
+        with self._lock:
+            if self._count == len(self._owner):
+                self._grow()
+
+            index = self._count
+            self._position[index] = (position.x, position.y)
+            self._velocity[index] = (
+                attributes["bullet_speed"] * math.cos(radians),
+                attributes["bullet_speed"] * math.sin(radians)
+            )
+            self._lifetime[index] = attributes["bullet_lifetime"]
+            self._damage[index] = attributes["damage"]
+            self._owner[index] = owner
+            self._count += 1
+
+    def spawn_burst_shots(self, owner: int, burst: BurstReplay, position: Vector2, look_angle: float, now: float) -> None:
+        """Adds the shots of a replayed burst that are due by now."""
+
+        for angle in burst.due(now, look_angle):
+            self.spawn(owner, burst.gun_type, angle, muzzle_position(position.x, position.y, angle))
+
+    def step(self, dt: float, players: dict[int, Vector2]) -> list[Hit]:
+        """Moves every bullet and resolves what it hits.
+
+        Args:
+            dt (float): The time to advance, in seconds.
+            players (dict[int, Vector2]): The position of every player that can be hit.
+
+        Returns:
+            list[Hit]: The hits in this step, at most one per bullet and per ray.
+        """
+
+        with self._lock:
+            hits = self._cast_rays(players)
+
+            count = self._count
+            if count == 0:
+                return hits
+
+            start = self._position[:count]
+            delta = self._velocity[:count] * dt
+            owner = self._owner[:count]
+
+            wall_time = np.full(count, np.inf)
+            if len(self._walls):
+                wall_time = segment_box_times(start, delta, self._walls).min(axis=1)
+
+            hit_mask = np.zeros(count, dtype=bool)
+            if players:
+                # The bullet collider hangs from its top left corner, so the player box grows up and left by its size
+                ids, boxes = player_boxes(players, BULLET_SIZE)
+
+                times = segment_box_times(start, delta, boxes)
+                times[owner[:, None] == ids[None, :]] = np.inf
+
+                victim = times.argmin(axis=1)
+                player_time = times[np.arange(count), victim]
+                hit_mask = player_time < wall_time
+
+                for index in np.flatnonzero(hit_mask):
+                    velocity = self._velocity[index]
+                    hits.append(Hit(
+                        player_id=int(ids[victim[index]]),
+                        shooter_id=int(owner[index]),
+                        damage=int(self._damage[index]),
+                        angle=math.degrees(math.atan2(velocity[1], velocity[0]))
+                    ))
+
+            self._position[:count] += delta
+            self._lifetime[:count] -= dt
+
+            alive = ~hit_mask & (wall_time > 1) & (self._lifetime[:count] > 0)
+            kept = int(alive.sum())
+            if kept < count:
+                for array in (self._position, self._velocity, self._lifetime, self._damage, self._owner):
+                    array[:kept] = array[:count][alive]
+                self._count = kept
+
+            return hits
+
+    def clear(self) -> None:
+        """Removes every bullet."""
+
+        with self._lock:
+            self._count = 0
+            self._rays.clear()
+
+    def _cast_rays(self, players: dict[int, Vector2]) -> list[Hit]:
+        """Resolves the hitscan shots fired since the last step, at most one hit each."""
+
+        if not self._rays:
+            return []
+
+        rays, self._rays = self._rays, []
+        owner = np.array([ray[0] for ray in rays], dtype=np.int64)
+        start = np.array([ray[3] for ray in rays], dtype=np.float64)
+        delta = np.array([ray[4] for ray in rays], dtype=np.float64)
+
+        if not players:
+            return []
+
+        wall_time = np.full(len(rays), np.inf)
+        if len(self._walls):
+            wall_time = segment_box_times(start, delta, self._walls).min(axis=1)
+
+        # A ray is a point, the player boxes stay as they are
+        ids, boxes = player_boxes(players, 0)
+        times = segment_box_times(start, delta, boxes)
+        times[owner[:, None] == ids[None, :]] = np.inf
+
+        victim = times.argmin(axis=1)
+        player_time = times[np.arange(len(rays)), victim]
+
+        return [
+            Hit(
+                player_id=int(ids[victim[index]]),
+                shooter_id=rays[index][0],
+                damage=rays[index][1],
+                angle=rays[index][2]
+            )
+            for index in np.flatnonzero(player_time < wall_time)
+        ]
+
+    def _grow(self) -> None:
+        capacity = len(self._owner) * 2
+        self._position = np.resize(self._position, (capacity, 2))
+        self._velocity = np.resize(self._velocity, (capacity, 2))
+        self._lifetime = np.resize(self._lifetime, capacity)
+        self._damage = np.resize(self._damage, capacity)
+        self._owner = np.resize(self._owner, capacity)
+
+    def __repr__(self) -> str:
+        return f"<ProjectileSimulation bullets={self._count} walls={len(self._walls)}>"
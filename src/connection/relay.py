@@ -0,0 +1,208 @@
+import sys
+import time
+import socket
+import logging
+import threading
+from typing import override
+from dataclasses import dataclass
+
+from connection.server import BaseUDPServer, BUFFER_SIZE, SPECTATOR_TIMEOUT
+from connection.packets import (
+    Packet,
+    PacketPlayInSpectate,
+    PacketPlayInDisconnect,
+    PacketPlayOutWelcome,
+    PacketPlayOutPlayerJoin,
+    PacketPlayOutPlayerLeave,
+    PacketPlayOutSnapshot,
+    PacketPlayOutChallenge
+)
+from connection.cookies import HandshakeCookies, NO_COOKIE
+
+
+RENEW_INTERVAL = SPECTATOR_TIMEOUT / 3  # seconds between spectate packets sent upstream
+
+
+@dataclass
+class ViewerData:
+    ip: str
+    port: int
+    last_active: float
+
+
+class SpectatorRelay(BaseUDPServer):
+    """Re-broadcasts a server's spectator stream to more viewers.
+
+    The relay subscribes upstream as a single spectator and speaks the same
+    spectate protocol downstream, so viewers connect to it exactly as they
+    would to the server, and relays can be chained. Datagrams from upstream
+    are forwarded as they are, without being decoded. Only the welcome and
+    roster packets are kept, to greet viewers that join later.
+    """
+
+    name: str
+    upstream: tuple[str, int]
+    viewers: dict[tuple[str, int], ViewerData]
+    cookies: HandshakeCookies
+
+    _upstream_sock: socket.socket
+    _upstream_cookie: bytes
+    _welcome: bytes | None
+    _roster: dict[int, bytes]
+
+    def __init__(self, name: str, upstream_ip: str, upstream_port: int, port: int, buffer_size: int = BUFFER_SIZE) -> None:
+        """Initializes the relay.
+
+        Args:
+            name (str): The spectator name the relay uses upstream.
+            upstream_ip (str): The IP address of the server or relay to subscribe to.
+            upstream_port (int): The port of the server or relay to subscribe to.
+            port (int): The port viewers connect to.
+            buffer_size (int): The size of the buffer for receiving data.
+        """
+
+        super().__init__(port, buffer_size)
+        self.name = name
+        self.upstream = (upstream_ip, upstream_port)
+        self.viewers = {}
+        self.cookies = HandshakeCookies()
+
+        self._upstream_cookie = NO_COOKIE
+        self._upstream_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._upstream_sock.settimeout(2)
+        self._welcome = None
+        self._roster = {}
+
+    @override
+    def start(self) -> None:
+        if self.running:
+            return
+
+        super().start()
+        threading.Thread(target=self._renew_subscription_loop, daemon=True).start()
+        threading.Thread(target=self._forward_upstream_loop, daemon=True).start()
+
+    @override
+    def stop(self) -> None:
+        if not self.running:
+            return
+
+        self._upstream_sock.sendto(PacketPlayInDisconnect().to_bytes(), self.upstream)
+        super().stop()
+        self._upstream_sock.close()
+
+    @override
+    def on_packet_received(self, packet: Packet, addr: tuple[str, int]) -> None:
+        match packet:
+            case spectate if isinstance(spectate, PacketPlayInSpectate):
+                if addr in self.viewers:
+                    self.viewers[addr].last_active = time.time()
+                    return
+
+                if not self.cookies.verify(addr, spectate.cookie):
+                    self.send(PacketPlayOutChallenge(self.cookies.issue(addr)), addr)
+                    return
+
+                self.viewers[addr] = ViewerData(ip=addr[0], port=addr[1], last_active=time.time())
+                logging.info(f"[SpectatorRelay] Viewer {addr[0]}:{addr[1]} joined with name: {spectate.name}")
+
+                for data in [self._welcome, *self._roster.values()]:
+                    if data:
+                        self.sock.sendto(data, addr)
+
+            case disconnect if isinstance(disconnect, PacketPlayInDisconnect):
+                self.viewers.pop(addr, None)
+
+            case _:
+                logging.warning(f"[SpectatorRelay] Unhandled packet type: {type(packet).__name__}")
+
+    def _renew_subscription_loop(self) -> None:
+        while self.running:
+            try:
+                self._subscribe()
+            except OSError as e:
+                logging.error(f"[SpectatorRelay] Error subscribing to {self.upstream}: {e}")
+
+            now = time.time()
+            for addr, viewer in list(self.viewers.items()):
+                if now - viewer.last_active > SPECTATOR_TIMEOUT:
+                    self.viewers.pop(addr, None)
+
+            time.sleep(RENEW_INTERVAL)
+
+    def _subscribe(self) -> None:
+        spectate_packet = PacketPlayInSpectate(self.name, self._upstream_cookie)
+        self._upstream_sock.sendto(spectate_packet.to_bytes(), self.upstream)
+
+    def _forward_upstream_loop(self) -> None:
+        while self.running:
+            try:
+                data, addr = self._upstream_sock.recvfrom(self.buffer_size)
+            except socket.timeout:
+                continue
+            except OSError:
+                if not self.running:
+                    break
+                continue
+
+            if addr != self.upstream or not data:
+                continue
+
+            if data[0] == PacketPlayOutChallenge.id:
+                try:
+                    self._upstream_cookie = PacketPlayOutChallenge.from_bytes(data[1:]).cookie
+                except ValueError as e:
+                    logging.warning(f"[SpectatorRelay] Malformed challenge from {addr[0]}:{addr[1]}: {e}")
+                    continue
+
+                self._subscribe()
+                continue
+
+            # Snapshots are the hot path, forward them without decoding
+            if data[0] != PacketPlayOutSnapshot.id:
+                self._remember(data)
+
+            for viewer in list(self.viewers):
+                self.sock.sendto(data, viewer)
+
+    def _remember(self, data: bytes) -> None:
+        """Keeps the packets a viewer joining later needs to make sense of the snapshots."""
+
+        try:
+            packet = Packet.from_bytes(data)
+        except ValueError:
+            return
+
+        match packet:
+            case welcome if isinstance(welcome, PacketPlayOutWelcome):
+                self._welcome = data
+            case player_join if isinstance(player_join, PacketPlayOutPlayerJoin):
+                self._roster[player_join.player_id] = data
+            case player_leave if isinstance(player_leave, PacketPlayOutPlayerLeave):
+                self._roster.pop(player_leave.player_id, None)
+
+    def __repr__(self) -> str:
+        return f"<SpectatorRelay upstream={self.upstream} port={self.port} viewers={len(self.viewers)} running={self.running}>"
+
+
+def main() -> None:
+    """Runs a relay from the command line: python -m connection.relay <server ip> <server port> <relay port>"""
+
+    logging.basicConfig(level=logging.INFO)
+
+    if len(sys.argv) != 4:
+        print("Usage: python -m connection.relay <server ip> <server port> <relay port>")
+        sys.exit(1)
+
+    relay = SpectatorRelay("relay", sys.argv[1], int(sys.argv[2]), int(sys.argv[3]))
+    relay.start()
+
+    try:
+        while relay.running:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        relay.stop()
+
+
+if __name__ == "__main__":
+    main()
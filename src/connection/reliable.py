@@ -0,0 +1,137 @@
+import time
+import threading
+from typing import Callable
+
+from connection.packets import Packet
+
+
+SEQUENCE_MODULO = 0x10000  # sequence numbers are sent as uint16
+
+
+class ReliableChannel:
+    """Ordered, acknowledged delivery of packets to one peer over UDP.
+
+    Every packet sent through the channel gets a sequence number and is resent
+    until the peer acknowledges it. At most `window` packets are in flight at
+    once, the rest wait in a queue. On the receiving end packets are handed out
+    in sequence order: duplicates are dropped and anything that arrives ahead of
+    a gap is held back until the gap is filled.
+    """
+
+    resend_interval: float = 0.25  # seconds before an unacknowledged packet is sent again
+    window: int = 64  # maximum number of unacknowledged packets in flight
+
+    _transmit: Callable[[int, Packet], None] | None
+    _lock: threading.Lock
+    _next_send: int
+    _queue: list[tuple[int, Packet]]
+    _in_flight: dict[int, tuple[Packet, float]]
+    _next_receive: int
+    _received: dict[int, Packet]
+
+    def __init__(self, transmit: Callable[[int, Packet], None] | None = None) -> None:
+        """Initializes the channel.
+
+        Args:
+            transmit (Callable[[int, Packet], None] | None): Sends one packet with its sequence number
+                to the peer. Only needed on the sending end.
+        """
+
+        self._transmit = transmit
+        self._lock = threading.Lock()
+
+        self._next_send = 0
+        self._queue = []
+        self._in_flight = {}
+
+        self._next_receive = 0
+        self._received = {}
+
+    @property
+    def pending(self) -> int:
+        """The number of packets not yet acknowledged by the peer."""
+
+        with self._lock:
+            return len(self._queue) + len(self._in_flight)
+
+    @property
+    def unacknowledged(self) -> list[Packet]:
+        """The packets queued or in flight that the peer has not acknowledged yet."""
+
+        with self._lock:
+            return [packet for _, packet in self._queue] + [packet for packet, _ in self._in_flight.values()]
+
+    def send(self, packet: Packet) -> None:
+        """Queues a packet for reliable delivery.
+
+        Args:
+            packet (Packet): The packet to deliver.
+        """
+
+        if self._transmit is None:
+            raise RuntimeError("ReliableChannel has no transmit function, it can only receive.")
+
+        with self._lock:
+            self._queue.append((self._next_send, packet))
+            self._next_send = (self._next_send + 1) % SEQUENCE_MODULO
+
+        self.resend()
+
+    def ack(self, sequence: int) -> None:
+        """Marks a packet as delivered.
+
+        Args:
+            sequence (int): The sequence number acknowledged by the peer.
+        """
+
+        with self._lock:
+            self._in_flight.pop(sequence, None)
+
+        self.resend()
+
+    def resend(self) -> None:
+        """Sends queued packets that fit in the window and resends the ones that timed out."""
+
+        now = time.time()
+        outgoing = []
+
+        with self._lock:
+            while self._queue and len(self._in_flight) < self.window:
+                sequence, packet = self._queue.pop(0)
+                self._in_flight[sequence] = (packet, 0.0)
+
+            for sequence, (packet, sent_at) in self._in_flight.items():
+                if now - sent_at >= self.resend_interval:
+                    self._in_flight[sequence] = (packet, now)
+                    outgoing.append((sequence, packet))
+
+        for sequence, packet in outgoing:
+            self._transmit(sequence, packet)
+
+    def receive(self, sequence: int, packet: Packet) -> list[Packet]:
+        """Accepts a packet from the peer.
+
+        The caller must acknowledge `sequence` whatever this returns, since the
+        peer keeps resending until it sees the ack.
+
+        Args:
+            sequence (int): The sequence number the packet was sent with.
+            packet (Packet): The packet that was received.
+
+        Returns:
+            list[Packet]: The packets that can now be handled, in sequence order.
+        """
+
+        with self._lock:
+            ahead = (sequence - self._next_receive) % SEQUENCE_MODULO
+            if ahead >= SEQUENCE_MODULO // 2:
+                return []  # already delivered
+
+            self._received[sequence] = packet
+
+            ready = []
+            while self._next_receive in self._received:
+                ready.append(self._received.pop(self._next_receive))
+                self._next_receive = (self._next_receive + 1) % SEQUENCE_MODULO
+
+            return ready
@@ -0,0 +1,142 @@
+import threading
+from typing import Callable, Hashable
+from dataclasses import dataclass
+
+from pygame import Vector2
+
+from connection.packets import Packet, PacketPlayOutBundle
+
+
+SEND_BUDGET = 1000  # bytes per client per tick, keeps every bundle under the client's receive buffer
+BUNDLE_OVERHEAD = 2  # packet id and packet count of a bundle
+NEARBY_DISTANCE = 300  # pixels, updates this close to a client gain priority up to twice as fast
+
+IMPORTANCE_STATE = 1.0
+IMPORTANCE_LOOK = 0.5
+IMPORTANCE_SHOT = 4.0
+
+
+@dataclass
+class PendingUpdate:
+    packet: Packet
+    importance: float
+    position: Vector2 | None
+    priority: float = 0.0
+
+
+class UpdateScheduler:
+    """Decides which updates a client gets each tick, within a byte budget.
+
+    Every pending update gains priority each tick it waits, faster the more
+    important it is and the closer it happened to the client. The updates
+    with the most priority are sent first, and whatever does not fit in the
+    budget waits for the next tick, still gaining priority, so nothing starves.
+    State updates are queued under a key: a newer update for the same key
+    replaces the pending one but keeps its priority, since it is the entity
+    that has been waiting, not the packet.
+    """
+
+    budget: int
+
+    _lock: threading.Lock
+    _pending: dict[Hashable, PendingUpdate]
+    _next_event: int
+
+    def __init__(self, budget: int = SEND_BUDGET) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            budget (int): The maximum number of bytes sent to the client per tick.
+        """
+
+        self.budget = budget
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._next_event = 0
+
+    @property
+    def pending(self) -> int:
+        """The number of updates waiting to be sent."""
+
+        with self._lock:
+            return len(self._pending)
+
+    def queue(
+        self,
+        packet: Packet,
+        importance: float,
+        position: Vector2 | None = None,
+        key: Hashable | None = None,
+        merge: Callable[[Packet, Packet], Packet] | None = None
+    ) -> None:
+        """Queues an update for the client.
+
+        Args:
+            packet (Packet): The update to send.
+            importance (float): How fast the update gains priority.
+            position (Vector2 | None): Where the update happened, if it has a position.
+            key (Hashable | None): Identifies the state the update replaces. Events have no key and are never replaced.
+            merge (Callable[[Packet, Packet], Packet] | None): Combines the pending packet with the new one,
+                for updates that only carry part of the state. The new packet replaces the old one if None.
+        """
+
+        with self._lock:
+            if key is None:
+                key = ("event", self._next_event)
+                self._next_event += 1
+
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = PendingUpdate(packet, importance, position)
+                return
+
+            pending.packet = merge(pending.packet, packet) if merge else packet
+            pending.importance = importance
+            pending.position = position
+
+    def take(self, viewer: Vector2 | None = None) -> list[Packet]:
+        """Advances a tick and takes the updates to send in it.
+
+        Args:
+            viewer (Vector2 | None): The client's position, if it has one.
+
+        Returns:
+            list[Packet]: The updates that fit in the budget, highest priority first.
+        """
+
+        with self._lock:
+            for pending in self._pending.values():
+                closeness = 1.0
+                if viewer is not None and pending.position is not None:
+                    closeness += NEARBY_DISTANCE / (NEARBY_DISTANCE + viewer.distance_to(pending.position))
+                pending.priority += pending.importance * closeness
+
+            ranked = sorted(self._pending.items(), key=lambda item: item[1].priority, reverse=True)
+
+            taken = []
+            space = self.budget - BUNDLE_OVERHEAD
+            for key, pending in ranked:
+                size = PacketPlayOutBundle.size_of(pending.packet)
+
+                # An update bigger than the whole budget goes out alone, or it would never be sent
+                if size > space and taken:
+                    continue
+
+                taken.append(pending.packet)
+                space -= size
+                del self._pending[key]
+
+                if space <= 0 or len(taken) == 0xFF:
+                    break
+
+            return taken
+
+    def clear(self) -> None:
+        """Drops every pending update."""
+
+        with self._lock:
+            self._pending.clear()
+
+    def __repr__(self) -> str:
+        return f"<UpdateScheduler budget={self.budget} pending={len(self._pending)}>"
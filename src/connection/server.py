@@ -3,9 +3,9 @@ import socket
 import random
 import logging
 import threading
-from typing import override
+from typing import override, Callable
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pygame import Vector2
 
@@ -35,13 +35,50 @@ from connection.packets import (
     PacketPlayInPlayerLook,
     PacketPlayOutPlayerLook,
     PacketPlayInShoot,
-    PacketPlayOutShoot
+    PacketPlayOutShoot,
+    PacketPlayInPlayerState,
+    PacketPlayOutPlayerState,
+    PacketPlayInFireStart,
+    PacketPlayOutFireStart,
+    PacketPlayInFireStop,
+    PacketPlayOutFireStop,
+    PacketPlayOutReliable,
+    PacketPlayInReliableAck,
+    PacketPlayInReliable,
+    PacketPlayOutReliableAck,
+    PacketPlayInMapRequest,
+    PacketPlayOutMapChunk,
+    PacketPlayOutDefineSymbol,
+    PacketPlayInSpectate,
+    PacketPlayOutSnapshot,
+    PlayerSnapshot,
+    PacketPlayOutChallenge,
+    PacketPlayOutBundle,
+    PacketPlayOutWorldState,
+    WorldState,
+    WorldPlayer,
+    WorldItem,
+    PacketPlayOutPlayerHit
 )
-from connection.packets.play.client.player_die import PacketPlayInPlayerDie
+from connection.reliable import ReliableChannel
+from connection.symbols import SymbolTable, UnknownSymbolError
+from connection.cookies import HandshakeCookies
+from connection.items import ItemRegistry
+from connection.projectiles import ProjectileSimulation, BurstReplay, Hit
+from connection.physics import PlayerPhysics, PHYSICS_STEP, MAX_CATCH_UP
+from connection.loopback import LoopbackTransport, LOOPBACK_ADDRESS
+from connection.scheduler import UpdateScheduler, IMPORTANCE_STATE, IMPORTANCE_LOOK, IMPORTANCE_SHOT
+from connection.map_transfer import MAP_DIR, CHUNK_SIZE, map_digest, list_maps
 from connection.packets.play.server.player_die import PacketPlayOutPlayerDie
+from game.consts import GUN_ATTRIBUTES, MAX_HEALTH
 
 DISCOVERY_PORT = 1337  # Fixed port for discovery server
 BUFFER_SIZE = 1024  # bytes
+SNAPSHOT_RATE = 10  # spectator snapshots per second
+SPECTATOR_TIMEOUT = 10  # seconds without a spectate packet before a spectator is dropped
+SEND_RATE = 20  # scheduled update ticks per second
+SIMULATION_RATE = 60  # player physics and bullet simulation steps per second
+FIRE_RATE_SLACK = 0.5  # how much of a gun's fire rate a shot may arrive early by, as jitter bunches them up
 
 class BaseUDPServer(ABC):
     port: int
@@ -128,32 +165,119 @@ class ClientData:
     last_active: float = time.time()
     keep_alive_id: int = 0
     missed_keep_alive: int = 0
+    reliable: ReliableChannel | None = None
+    incoming: ReliableChannel = field(default_factory=ReliableChannel)
+    position: Vector2 | None = None
+    velocity: Vector2 | None = None
+    angle: float = 0.0
+    firing: bool = False
+    character_index: int = 0
+    alive: bool = True
+    gun_type: str | None = None
+    health: int = MAX_HEALTH
+    burst: BurstReplay | None = None
+    last_shot: float = 0.0
+    updates: UpdateScheduler = field(default_factory=UpdateScheduler)
+
+@dataclass
+class SpectatorData:
+    name: str
+    ip: str
+    port: int
+    last_active: float = 0.0
 
 class Server(BaseUDPServer):
     name: str
     clients: dict[tuple[str, int], ClientData]
     discovery_server: DiscoveryServer
+    maps: dict[bytes, bytes]
+    map_name: str | None
+    map_digest: bytes | None
+    items: ItemRegistry
+    projectiles: ProjectileSimulation
+    physics: PlayerPhysics
+    symbols: SymbolTable
+    spectators: dict[tuple[str, int], SpectatorData]
+    cookies: HandshakeCookies
+    loopback: LoopbackTransport | None
 
     _keep_alive_thread: threading.Thread
+    _resend_thread: threading.Thread
+    _snapshot_thread: threading.Thread
+    _send_thread: threading.Thread
+    _simulation_thread: threading.Thread
+    _tick: int
 
     def __init__(self, name: str, port: int, buffer_size: int = BUFFER_SIZE) -> None:
         super().__init__(port, buffer_size)
         self.name = name
         self.clients = {}
+        self.maps = {}
+        self.map_name = None
+        self.map_digest = None
+        self.items = ItemRegistry()
+        self.projectiles = ProjectileSimulation()
+        self.physics = PlayerPhysics()
+        self.symbols = SymbolTable()
+        self.spectators = {}
+        self.cookies = HandshakeCookies()
+        self.loopback = None
         self.discovery_server = DiscoveryServer(name=self.name, port=self.port)
         self._keep_alive_thread = threading.Thread(target=self._send_keep_alive_loop, daemon=True)
+        self._resend_thread = threading.Thread(target=self._resend_reliable_loop, daemon=True)
+        self._snapshot_thread = threading.Thread(target=self._send_snapshot_loop, daemon=True)
+        self._send_thread = threading.Thread(target=self._send_updates_loop, daemon=True)
+        self._simulation_thread = threading.Thread(target=self._simulate_loop, daemon=True)
+        self._tick = 0
 
     @override
     def start(self) -> None:
         super().start()
         self.discovery_server.start()
         self._keep_alive_thread.start()
+        self._resend_thread.start()
+        self._snapshot_thread.start()
+        self._send_thread.start()
+        self._simulation_thread.start()
 
     @override
     def stop(self) -> None:
         super().stop()
         self.discovery_server.stop()
+        if self.loopback:
+            self.loopback.close()
         self.clients.clear()
+        self.spectators.clear()
+
+    def attach_loopback(self) -> LoopbackTransport:
+        """Opens an in-process connection for the hosting player's client.
+
+        The client on the other end of the transport is known to the server by
+        `LOOPBACK_ADDRESS` and is otherwise treated like any other client.
+
+        Returns:
+            LoopbackTransport: The transport to give to the client.
+        """
+
+        if not self.running:
+            raise RuntimeError("Server is not running.")
+
+        if self.loopback is None:
+            self.loopback = LoopbackTransport()
+            threading.Thread(target=self._listen_loopback_loop, daemon=True).start()
+
+        return self.loopback
+
+    def _listen_loopback_loop(self):
+        while self.running and self.loopback.open:
+            packet = self.loopback.receive_on_server(timeout=1)
+            if packet is None:
+                continue
+
+            try:
+                self.on_packet_received(packet, LOOPBACK_ADDRESS)
+            except Exception as e:
+                logging.error(f"[Server] Error while handling a loopback packet: {e}")
 
     def _send_keep_alive_loop(self):
         while self.running:
@@ -171,52 +295,171 @@ class Server(BaseUDPServer):
                 self.send(packet, addr)
             time.sleep(5)
 
+    def _resend_reliable_loop(self):
+        while self.running:
+            for client in list(self.clients.values()):
+                if client.reliable:
+                    client.reliable.resend()
+            time.sleep(0.05)
+
+    def _send_updates_loop(self):
+        while self.running:
+            time.sleep(1 / SEND_RATE)
+            self.send_updates()
+
+    def send_updates(self) -> None:
+        """Sends every client the updates scheduled for it since the last tick."""
+
+        for addr, client in list(self.clients.items()):
+            packets = client.updates.take(client.position)
+            if not packets:
+                continue
+
+            if addr == LOOPBACK_ADDRESS:
+                for packet in packets:
+                    self.loopback.send_to_client(packet)
+                continue
+
+            # A lone update is sent as it is, the bundle would only add bytes
+            packet = packets[0] if len(packets) == 1 else PacketPlayOutBundle(packets)
+            try:
+                self.sock.sendto(packet.to_bytes(), addr)
+            except OSError as e:
+                if not self.running:
+                    return
+                logging.warning(f"[Server] Could not send updates to {addr[0]}:{addr[1]}: {e}")
+
+    def _simulate_loop(self):
+        last_step = time.time()
+        physics_time = 0.0
+        while self.running:
+            time.sleep(1 / SIMULATION_RATE)
+
+            now = time.time()
+            dt, last_step = now - last_step, now
+
+            # Physics runs in fixed steps, whatever the loop's timing was
+            physics_time = min(physics_time + dt, MAX_CATCH_UP)
+            while physics_time >= PHYSICS_STEP:
+                self.physics.step(PHYSICS_STEP)
+                physics_time -= PHYSICS_STEP
+
+            targets = {}
+            for client in list(self.clients.values()):
+                if client.alive and (state := self.physics.state(client.id)):
+                    client.position, client.velocity = state
+
+                if not client.alive or client.position is None:
+                    client.burst = None
+                    continue
+
+                targets[client.id] = client.position
+                if client.burst is not None:
+                    self.projectiles.spawn_burst_shots(client.id, client.burst, client.position, client.angle, now)
+                    client.last_shot = now
+                    if client.burst.finished:
+                        client.burst = None
+
+            for hit in self.projectiles.step(dt, targets):
+                try:
+                    self.apply_hit(hit)
+                except (OSError, RuntimeError) as e:
+                    if not self.running:
+                        break
+                    logging.error(f"[Server] Error applying hit {hit}: {e}")
+
+    def _send_snapshot_loop(self):
+        while self.running:
+            time.sleep(1 / SNAPSHOT_RATE)
+            self._tick += 1
+
+            now = time.time()
+            for addr, spectator in list(self.spectators.items()):
+                if now - spectator.last_active > SPECTATOR_TIMEOUT:
+                    logging.info(f"[Server] Spectator {addr[0]}:{addr[1]} timed out.")
+                    self.spectators.pop(addr, None)
+
+            if not self.spectators:
+                continue
+
+            snapshot = PacketPlayOutSnapshot(self._tick, [
+                PlayerSnapshot(
+                    player_id=client.id,
+                    position=client.position,
+                    velocity=client.velocity or Vector2(0, 0),
+                    angle=client.angle,
+                    firing=client.firing
+                )
+                for client in list(self.clients.values())
+                if client.position is not None
+            ])
+
+            # Encoded once, every spectator gets the same bytes
+            self.send_to_spectators(snapshot.to_bytes())
+
     @override
     def on_packet_received(self, packet: Packet, addr: tuple[str, int]) -> None:
         logging.info(f"[Server] Received packet from {addr[0]}:{addr[1]}: {packet}")
         match packet:
             case join if isinstance(join, PacketPlayInJoin):
-                from engine import Game
-                from game.scenes.lobby import LobbyScene
-                from game.scenes.host import HostMenu
+                # Nothing is allocated for an address until it proves it can receive from us
+                if addr not in self.clients and not self.cookies.verify(addr, join.cookie):
+                    self.send(PacketPlayOutChallenge(self.cookies.issue(addr)), addr)
+                    return
 
                 if addr not in self.clients:
-                    if not isinstance(Game.instance().current_scene, (LobbyScene, HostMenu)):
-                        logging.info(f"[Server] Client {addr[0]}:{addr[1]} tried to join while not in lobby. Ignoring.")
-                        welcome_packet = PacketPlayOutWelcome(False, 0, "Game already started.")
-                        self.send(welcome_packet, addr)
-                        return
-
                     client_id = random.randint(1, 1_000_000)
 
                     # Ensure the 1 in a million chance of duplicate client IDs is handled
                     while any(client.id == client_id for client in self.clients.values()):
                         client_id = random.randint(1, 1_000_000)
-                    
+
+                    # Interned before the client is added, it is defined with the rest of the table below
+                    self.intern(join.name)
+
                     self.clients[addr] = ClientData(
                         id=client_id,
                         name=join.name,
                         ip=addr[0],
-                        port=addr[1]
+                        port=addr[1],
+                        reliable=ReliableChannel(
+                            lambda sequence, packet, addr=addr: self.send(PacketPlayOutReliable(sequence, packet), addr)
+                        )
                     )
 
                     logging.info(f"[Server] Client {addr[0]}:{addr[1]} joined with name: {join.name}")
                     welcome_packet = PacketPlayOutWelcome(True, client_id, "Welcome to the server!")
-                    self.send(welcome_packet, addr)
+                    self.send_reliable(welcome_packet, addr)
+
+                    # One packet per symbol, after the welcome on the same channel, so the table never outgrows a datagram
+                    for symbol_id, symbol in self.symbols.definitions:
+                        self.send_reliable(PacketPlayOutDefineSymbol(symbol_id, symbol), addr)
 
+                    # The others may not have the define symbol packet for the name yet
                     player_join_packet = PacketPlayOutPlayerJoin(player_id=client_id, name=join.name)
                     self.broadcast(player_join_packet, exclude=addr)
+                    self.send_to_spectators(player_join_packet.to_bytes())
 
-                    for client_addr, client_data in self.clients.items():
-                        if client_addr != addr:
-                            player_join_packet = PacketPlayOutPlayerJoin(player_id=client_data.id, name=client_data.name)
-                            self.send(player_join_packet, addr)
+                    # Joining late or reconnecting, the client still starts from the same world as everyone else
+                    self.send_world_state(addr)
                 else:
                     logging.info(f"[Server] Client {addr[0]}:{addr[1]} already connected.")
                     welcome_packet = PacketPlayOutWelcome(False, 0, "You are already connected.")
                     self.send(welcome_packet, addr)
 
+            case spectate if isinstance(spectate, PacketPlayInSpectate):
+                if addr not in self.spectators and not self.cookies.verify(addr, spectate.cookie):
+                    self.send(PacketPlayOutChallenge(self.cookies.issue(addr)), addr)
+                    return
+
+                self.add_spectator(spectate.name, addr)
+                return
+
             case disconnect if isinstance(disconnect, PacketPlayInDisconnect):
+                if self.spectators.pop(addr, None):
+                    logging.info(f"[Server] Spectator {addr[0]}:{addr[1]} left.")
+                    return
+
                 self.remove_client(addr)
 
         if addr not in self.clients:
@@ -235,16 +478,25 @@ class Server(BaseUDPServer):
 
             case player_move if isinstance(player_move, PacketPlayInPlayerMove):
                 client = self.clients.get(addr)
+                position, velocity, acceleration = self.accept_move(
+                    client, addr,
+                    player_move.position,
+                    player_move.velocity,
+                    player_move.acceleration
+                )
+
                 move_packet = PacketPlayOutPlayerMove(
                     player_id=client.id,
-                    position=player_move.position,
-                    acceleration=player_move.acceleration,
-                    velocity=player_move.velocity
+                    position=position,
+                    acceleration=acceleration,
+                    velocity=velocity
                 )
-                self.broadcast(move_packet, exclude=addr)
+                self.schedule(move_packet, IMPORTANCE_STATE, client.position, key=("move", client.id), exclude=addr)
 
             case change_character if isinstance(change_character, PacketPlayInChangeCharacter):
                 client = self.clients.get(addr)
+                client.character_index = change_character.character_index
+
                 change_packet = PacketPlayOutChangeCharacter(
                     player_id=client.id, 
                     character_index=change_character.character_index
@@ -254,59 +506,207 @@ class Server(BaseUDPServer):
             case start_game if isinstance(start_game, PacketPlayInStartGame):
                 client = self.clients.get(addr)
                 
-                start_game_packet = PacketPlayOutStartGame(map_name=start_game.map_name)
-                self.broadcast(start_game_packet, exclude=addr)
+                try:
+                    map_name = self.symbols.resolve(start_game.map_name)
+                    if map_name not in list_maps():
+                        raise FileNotFoundError(f"No map named {map_name!r} in {MAP_DIR}")
+
+                    with open(f"{MAP_DIR}/{map_name}.tmx", "rb") as f:
+                        map_data = f.read()
+                except (OSError, UnknownSymbolError) as e:
+                    logging.error(f"[Server] Could not load map {start_game.map_name!r}: {e}")
+                    return
+
+                digest = map_digest(map_data)
+                self.maps[digest] = map_data
+
+                self.map_name = map_name
+                self.map_digest = digest
+                self.items.clear()
+                self.projectiles.load_map(f"{MAP_DIR}/{map_name}.tmx")
+                self.physics.load_map(f"{MAP_DIR}/{map_name}.tmx")
+                for client_data in self.clients.values():
+                    client_data.alive = True
+                    client_data.gun_type = None
+                    client_data.health = MAX_HEALTH
+                    client_data.burst = None
+
+                # Sent after the define symbol packets on the same reliable channel, so the id is safe to use
+                start_game_packet = PacketPlayOutStartGame(
+                    map_name=self.intern(map_name),
+                    map_digest=digest,
+                    map_size=len(map_data)
+                )
+                self.broadcast_reliable(start_game_packet, exclude=addr)
 
             case item if isinstance(item, PacketPlayInAddItem):
-                client = self.clients.get(addr)
+                gun_type = self.symbols.resolve(item.gun_type)
+                if gun_type not in GUN_ATTRIBUTES:
+                    logging.warning(f"[Server] Client {addr[0]}:{addr[1]} tried to spawn unknown gun '{gun_type}'.")
+                    return
 
-                item_packet = PacketPlayOutAddItem(
-                    gun_type=item.gun_type,
-                    position= Vector2(item.position_x, item.position_y)
-                )
-                self.broadcast(item_packet, exclude=addr)
+                spawned = self.items.spawn(gun_type, Vector2(item.position_x, item.position_y))
+
+                # The spawner gets it back too, the id is only known once the server gave it out
+                self.broadcast_reliable(PacketPlayOutAddItem(
+                    gun_type=self.intern(gun_type),
+                    position=spawned.position,
+                    object_id=spawned.id
+                ))
 
             case item_pickup if isinstance(item_pickup, PacketPlayInItemPickup):
                 client = self.clients.get(addr)
-
-                pickup_packet = PacketPlayOutItemPickup(
+                if client.gun_type is not None:
+                    logging.info(f"[Server] Client {addr[0]}:{addr[1]} already holds a gun, pickup of {item_pickup.object_id} rejected.")
+                    return
+
+                # First claim wins, a second one for the same item finds nothing
+                claimed = self.items.claim(item_pickup.object_id)
+                if claimed is None:
+                    logging.info(f"[Server] Item {item_pickup.object_id} is already gone, pickup by {addr[0]}:{addr[1]} rejected.")
+                    return
+
+                client.gun_type = claimed.gun_type
+                self.broadcast_reliable(PacketPlayOutItemPickup(
                     player_id=client.id,
-                    gun_type=item_pickup.gun_type,
-                    object_id=item_pickup.object_id
-                )
-                self.broadcast(pickup_packet, exclude=addr)
+                    gun_type=self.intern(claimed.gun_type),
+                    object_id=claimed.id
+                ))
 
             case item_drop if isinstance(item_drop, PacketPlayInItemDrop):
                 client = self.clients.get(addr)
+                client.gun_type = None
 
                 drop_packet = PacketPlayOutItemDrop(player_id=client.id)
-                self.broadcast(drop_packet, exclude=addr)
+                self.broadcast_reliable(drop_packet, exclude=addr)
 
             case player_look if isinstance(player_look, PacketPlayInPlayerLook):
                 client = self.clients.get(addr)
+                client.angle = player_look.angle
 
                 look_packet = PacketPlayOutPlayerLook(
                     player_id=client.id,
                     angle=player_look.angle
                 )
-                self.broadcast(look_packet, exclude=addr)
+                self.schedule(look_packet, IMPORTANCE_LOOK, client.position, key=("look", client.id), exclude=addr)
 
             case shoot if isinstance(shoot, PacketPlayInShoot):
                 client = self.clients.get(addr)
+                gun_type = self.symbols.resolve(shoot.gun_type)
+                if not self.can_fire(client, gun_type):
+                    logging.warning(f"[Server] Rejected a shot with {gun_type!r} from {client.name}.")
+                    return
+
+                self.projectiles.spawn(client.id, gun_type, shoot.angle, shoot.position)
 
                 shoot_packet = PacketPlayOutShoot(
                     player_id=client.id,
-                    gun_type=shoot.gun_type,
+                    gun_type=self.relay_symbol(shoot.gun_type),
                     angle=shoot.angle,
                     position=shoot.position
                 )
-                self.broadcast(shoot_packet, exclude=addr)
+                self.schedule(shoot_packet, IMPORTANCE_SHOT, shoot.position, exclude=addr)
 
-            case player_die if isinstance(player_die, PacketPlayInPlayerDie):
+            case player_state if isinstance(player_state, PacketPlayInPlayerState):
                 client = self.clients.get(addr)
+                position, velocity, acceleration = None, None, None
+                if player_state.has_move:
+                    position, velocity, acceleration = self.accept_move(
+                        client, addr,
+                        player_state.position,
+                        player_state.velocity,
+                        player_state.acceleration
+                    )
+                if player_state.has_look:
+                    client.angle = player_state.angle
+                client.firing = player_state.firing
+
+                # A released trigger ends the burst, in case the fire stop packet was lost
+                if not client.firing and client.burst is not None:
+                    client.burst.stop()
+
+                state_packet = PacketPlayOutPlayerState(
+                    player_id=client.id,
+                    position=position,
+                    velocity=velocity,
+                    acceleration=acceleration,
+                    angle=player_state.angle,
+                    firing=player_state.firing
+                )
+                self.schedule(
+                    state_packet,
+                    IMPORTANCE_STATE,
+                    client.position,
+                    key=("state", client.id),
+                    merge=self._merge_player_state,
+                    exclude=addr
+                )
+
+            case fire_start if isinstance(fire_start, PacketPlayInFireStart):
+                client = self.clients.get(addr)
+                gun_type = self.symbols.resolve(fire_start.gun_type)
+                if not self.can_fire(client, gun_type) or not GUN_ATTRIBUTES[gun_type]["automatic"]:
+                    logging.warning(f"[Server] Rejected a burst with {gun_type!r} from {client.name}.")
+                    return
+
+                client.angle = fire_start.angle
+                client.burst = BurstReplay(gun_type, fire_start.seed, fire_start.start_tick, time.time())
+
+                fire_start_packet = PacketPlayOutFireStart(
+                    player_id=client.id,
+                    gun_type=self.relay_symbol(fire_start.gun_type),
+                    seed=fire_start.seed,
+                    start_tick=fire_start.start_tick,
+                    angle=fire_start.angle
+                )
+                self.schedule(fire_start_packet, IMPORTANCE_SHOT, client.position, exclude=addr)
+
+            case fire_stop if isinstance(fire_stop, PacketPlayInFireStop):
+                client = self.clients.get(addr)
+                if client.burst is not None and client.burst.start_tick == fire_stop.start_tick:
+                    client.burst.stop(fire_stop.shot_count)
+
+                fire_stop_packet = PacketPlayOutFireStop(
+                    player_id=client.id,
+                    start_tick=fire_stop.start_tick,
+                    shot_count=fire_stop.shot_count
+                )
+                self.schedule(fire_stop_packet, IMPORTANCE_SHOT, client.position, exclude=addr)
+
+            case reliable_ack if isinstance(reliable_ack, PacketPlayInReliableAck):
+                client = self.clients.get(addr)
+                if client and client.reliable:
+                    client.reliable.ack(reliable_ack.sequence)
+
+            case reliable if isinstance(reliable, PacketPlayInReliable):
+                client = self.clients.get(addr)
+                if client is None:
+                    return
+
+                self.send(PacketPlayOutReliableAck(reliable.sequence), addr)
+                for inner_packet in client.incoming.receive(reliable.sequence, reliable.packet):
+                    self.on_packet_received(inner_packet, addr)
+
+            case map_request if isinstance(map_request, PacketPlayInMapRequest):
+                map_data = self.maps.get(map_request.digest)
+                if map_data is None:
+                    logging.warning(f"[Server] Client {addr[0]}:{addr[1]} requested an unknown map.")
+                    return
+
+                # A request repeated after a stall must not queue the chunks still being resent a second time
+                client = self.clients.get(addr)
+                in_flight = {
+                    packet.offset for packet in client.reliable.unacknowledged
+                    if isinstance(packet, PacketPlayOutMapChunk)
+                } if client.reliable else set()
+
+                for offset in range(map_request.offset, len(map_data), CHUNK_SIZE):
+                    if offset in in_flight:
+                        continue
+
+                    chunk_packet = PacketPlayOutMapChunk(offset, map_data[offset:offset + CHUNK_SIZE])
+                    self.send_reliable(chunk_packet, addr)
 
-                die_packet = PacketPlayOutPlayerDie(player_id=client.id)
-                self.broadcast(die_packet, exclude=addr)
             case _:
                 logging.warning(f"[Server] Unhandled packet type: {type(packet).__name__}")
 
@@ -315,23 +715,267 @@ class Server(BaseUDPServer):
             raise RuntimeError("Server is not running.")
 
         logging.info(f"[Server] Broadcasting packet: {packet}")
-        data = packet.to_bytes()
-        for client in self.clients:
+        data = None
+        for client in list(self.clients):
             if exclude and client == exclude:
                 continue
+
+            if client == LOOPBACK_ADDRESS:
+                self.loopback.send_to_client(packet)
+                continue
+
+            # Serialized once, and only if a client is on the network
+            if data is None:
+                data = packet.to_bytes()
             self.sock.sendto(data, client)
 
+    def schedule(
+        self,
+        packet: Packet,
+        importance: float,
+        position: Vector2 | None = None,
+        key: tuple | None = None,
+        merge: Callable[[Packet, Packet], Packet] | None = None,
+        exclude: tuple[str, int] = None
+    ) -> None:
+        """Queues an update for every client, to be sent within their bandwidth budget.
+
+        Unlike `broadcast`, nothing is sent right away: each client's scheduler
+        picks the update up on one of the next ticks, depending on its priority.
+        See `UpdateScheduler.queue` for the arguments.
+        """
+
+        for client_addr, client in list(self.clients.items()):
+            if exclude and client_addr == exclude:
+                continue
+            client.updates.queue(packet, importance, position, key, merge)
+
+    @staticmethod
+    def _merge_player_state(pending: PacketPlayOutPlayerState, newer: PacketPlayOutPlayerState) -> PacketPlayOutPlayerState:
+        """Keeps the movement and look of a pending state the newer one does not carry."""
+
+        moved = newer if newer.has_move else pending
+        looked = newer if newer.has_look else pending
+
+        return PacketPlayOutPlayerState(
+            player_id=newer.player_id,
+            position=moved.position,
+            velocity=moved.velocity,
+            acceleration=moved.acceleration,
+            angle=looked.angle,
+            firing=newer.firing
+        )
+
     def send(self, packet: Packet, addr: tuple[str, int]) -> None:
         if not self.running:
             raise RuntimeError("Server is not running.")
 
+        if addr == LOOPBACK_ADDRESS:
+            self.loopback.send_to_client(packet)
+            return
+
         super().send(packet, addr)
 
+    def intern(self, symbol: str) -> int | str:
+        """Gives a string a symbol id, defining it for every client if it is new.
+
+        Args:
+            symbol (str): The string to intern.
+
+        Returns:
+            int | str: The symbol id, or the string itself if the table is full.
+        """
+
+        symbol_id, added = self.symbols.intern(symbol)
+        if symbol_id is None:
+            return symbol
+
+        if added:
+            define_packet = PacketPlayOutDefineSymbol(symbol_id, symbol)
+            for client_addr in list(self.clients):
+                self.send_reliable(define_packet, client_addr)
+
+        return symbol_id
+
+    def relay_symbol(self, value: int | str) -> int | str:
+        """Prepares a symbol received from a client to be relayed to the others.
+
+        Ids are passed through untouched, without being looked up. A literal is
+        interned for next time, but relayed as a literal while the define symbol
+        packet is still on its way.
+        """
+
+        if isinstance(value, str):
+            known = isinstance(self.symbols.encode(value), int)
+            symbol = self.intern(value)
+            return symbol if known else value
+
+        return value
+
+    def send_reliable(self, packet: Packet, addr: tuple[str, int]) -> None:
+        """Sends a packet that is resent until the client acknowledges it."""
+
+        client = self.clients.get(addr)
+        if not client or not client.reliable:
+            raise RuntimeError(f"Client {addr[0]}:{addr[1]} is not connected.")
+
+        # The loopback never loses or reorders a packet, there is nothing to acknowledge
+        if addr == LOOPBACK_ADDRESS:
+            self.send(packet, addr)
+            return
+
+        client.reliable.send(packet)
+
+    def world_state(self) -> WorldState:
+        """Captures the roster, the player states and the items on the ground."""
+
+        state = WorldState(
+            players=[
+                WorldPlayer(
+                    player_id=client.id,
+                    name=self.symbols.encode(client.name),
+                    character_index=client.character_index,
+                    alive=client.alive,
+                    gun_type=self.symbols.encode(client.gun_type) if client.gun_type else None,
+                    position=client.position,
+                    angle=client.angle
+                )
+                for client in list(self.clients.values())
+            ],
+            items=[
+                WorldItem(item.id, self.symbols.encode(item.gun_type), item.position)
+                for item in self.items.items
+            ]
+        )
+
+        if self.map_name is not None:
+            state.map_name = self.symbols.encode(self.map_name)
+            state.map_digest = self.map_digest
+            state.map_size = len(self.maps[self.map_digest])
+
+        return state
+
+    def send_world_state(self, addr: tuple[str, int]) -> None:
+        """Sends the whole world state to a client in one reliable burst."""
+
+        for fragment in PacketPlayOutWorldState.split(self.world_state()):
+            self.send_reliable(fragment, addr)
+
+    def accept_move(
+        self,
+        client: ClientData,
+        addr: tuple[str, int],
+        position: Vector2,
+        velocity: Vector2,
+        acceleration: Vector2
+    ) -> tuple[Vector2, Vector2, Vector2]:
+        """Checks a movement a client reported against the server's physics.
+
+        Returns:
+            tuple[Vector2, Vector2, Vector2]: The position, velocity and acceleration to relay. That is the
+                reported movement if it was plausible, or else the server's own state, which is also sent
+                back to the client to correct it.
+        """
+
+        if not client.alive or self.physics.report(client.id, position, velocity, acceleration):
+            client.position = position
+            client.velocity = velocity
+            return position, velocity, acceleration
+
+        client.position, client.velocity = self.physics.state(client.id)
+        correction = PacketPlayOutPlayerState(
+            player_id=client.id,
+            position=client.position,
+            velocity=client.velocity,
+            acceleration=Vector2(0, 0)
+        )
+        self.send(correction, addr)
+        logging.warning(f"[Server] Corrected implausible movement from {client.name} to {client.position}.")
+
+        return client.position, client.velocity, Vector2(0, 0)
+
+    def can_fire(self, client: ClientData, gun_type: str) -> bool:
+        """Checks that a living player fires the gun it holds no faster than the gun allows, and notes the shot.
+
+        Args:
+            client (ClientData): The player firing.
+            gun_type (str): The gun the player says it fired.
+
+        Returns:
+            bool: True if the shot counts.
+        """
+
+        if not client.alive or gun_type is None or gun_type != client.gun_type:
+            return False
+
+        now = time.time()
+        if now - client.last_shot < GUN_ATTRIBUTES[gun_type]["fire_rate"] * (1 - FIRE_RATE_SLACK):
+            return False
+
+        client.last_shot = now
+        return True
+
+    def apply_hit(self, hit: Hit) -> None:
+        """Takes the damage of a hit off the player's health and tells everyone, killing the player at zero."""
+
+        client = next((c for c in list(self.clients.values()) if c.id == hit.player_id), None)
+        if client is None or not client.alive:
+            return
+
+        client.health = max(0, client.health - hit.damage)
+        self.broadcast(PacketPlayOutPlayerHit(hit.player_id, hit.shooter_id, client.health, hit.angle))
+
+        if client.health == 0:
+            client.alive = False
+            client.burst = None
+            client.gun_type = None
+            self.physics.remove_player(client.id)
+            self.broadcast_reliable(PacketPlayOutPlayerDie(player_id=client.id))
+            logging.info(f"[Server] Player {client.name} was killed by {hit.shooter_id}.")
+
+    def broadcast_reliable(self, packet: Packet, exclude: tuple[str, int] = None) -> None:
+        """Sends a packet to every client through their reliable channels."""
+
+        for client_addr in list(self.clients):
+            if exclude and client_addr == exclude:
+                continue
+            self.send_reliable(packet, client_addr)
+
+    def add_spectator(self, name: str, addr: tuple[str, int]) -> None:
+        """Subscribes an address to the snapshot stream, or renews its subscription.
+
+        New spectators get a welcome packet and the current roster. They never
+        get a `ClientData`, so they take no player slot and none of the player
+        packet handling applies to them.
+        """
+
+        if addr in self.spectators:
+            self.spectators[addr].last_active = time.time()
+            return
+
+        self.spectators[addr] = SpectatorData(name=name, ip=addr[0], port=addr[1], last_active=time.time())
+        logging.info(f"[Server] Spectator {addr[0]}:{addr[1]} joined with name: {name}")
+
+        self.send(PacketPlayOutWelcome(True, 0, "Spectating."), addr)
+        for client in list(self.clients.values()):
+            self.send(PacketPlayOutPlayerJoin(player_id=client.id, name=client.name), addr)
+
+    def send_to_spectators(self, data: bytes) -> None:
+        """Sends already encoded packet bytes to every spectator."""
+
+        for addr in list(self.spectators):
+            try:
+                self.sock.sendto(data, addr)
+            except OSError as e:
+                logging.warning(f"[Server] Could not send to spectator {addr[0]}:{addr[1]}: {e}")
+
     def remove_client(self, addr: tuple[str, int]) -> None:
         if addr in self.clients:
             client = self.clients.pop(addr)
+            self.physics.remove_player(client.id)
             leave_packet = PacketPlayOutPlayerLeave(player_id=client.id)
             self.broadcast(leave_packet, exclude=addr)
+            self.send_to_spectators(leave_packet.to_bytes())
             logging.info(f"[Server] Client {addr[0]}:{addr[1]} disconnected.")
         else:
             logging.warning(f"[Server] Client {addr[0]}:{addr[1]} is not connected.")
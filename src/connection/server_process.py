@@ -0,0 +1,166 @@
+import time
+import ctypes
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+
+from connection.server import Server
+
+
+STATS_INTERVAL = 0.5  # seconds between two updates of the shared stats
+START_TIMEOUT = 10  # seconds the child process has to bind its sockets
+STOP_TIMEOUT = 3  # seconds the child process has to shut down before it is killed
+
+
+class ServerStats(ctypes.Structure):
+    """The server's live numbers, in memory shared by the child process and the host."""
+
+    _fields_ = [
+        ("clients", ctypes.c_int),
+        ("spectators", ctypes.c_int),
+        ("items", ctypes.c_int),
+        ("bullets", ctypes.c_int),
+        ("in_game", ctypes.c_bool),
+        ("uptime", ctypes.c_double),
+    ]
+
+    def __repr__(self) -> str:
+        return (
+            f"<ServerStats clients={self.clients} spectators={self.spectators} items={self.items} "
+            f"bullets={self.bullets} in_game={self.in_game} uptime={self.uptime:.1f}>"
+        )
+
+
+class ServerProcess:
+    """Runs a `Server` in a child process instead of the host's game process.
+
+    The server's threads then never compete with the host's game loop for
+    the interpreter lock. The host keeps two ways in: a pipe that carries
+    the commands to the child, and a `ServerStats` in shared memory that
+    the child refreshes and the host reads without asking. The host's own
+    client connects over UDP like any other, since the loopback transport
+    cannot cross processes.
+    """
+
+    name: str
+    port: int
+    stats: ServerStats
+
+    _process: multiprocessing.Process | None
+    _control: Connection | None
+
+    def __init__(self, name: str, port: int) -> None:
+        """Initializes the server process without starting it.
+
+        Args:
+            name (str): The name of the room.
+            port (int): The port the server listens on.
+        """
+
+        self.name = name
+        self.port = port
+
+        # Spawned rather than forked, so the child does not inherit the host's display
+        self._context = multiprocessing.get_context("spawn")
+        self.stats = self._context.Value(ServerStats, lock=False)
+
+        self._process = None
+        self._control = None
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Starts the child process and waits until its server is listening.
+
+        Raises:
+            RuntimeError: If the server could not start in the child process.
+        """
+
+        if self.running:
+            return
+
+        self._control, child_control = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_serve,
+            args=(self.name, self.port, child_control, self.stats, logging.getLogger().level),
+            name=f"Server {self.name}",
+            daemon=True
+        )
+        self._process.start()
+        child_control.close()
+
+        if not self._control.poll(START_TIMEOUT):
+            self.stop()
+            raise RuntimeError("Server process did not start in time.")
+
+        try:
+            status, message = self._control.recv()
+        except (EOFError, OSError):
+            status, message = "error", "it exited before it was ready"
+
+        if status != "started":
+            self.stop()
+            raise RuntimeError(f"Server process could not start: {message}")
+
+        logging.info(f"[ServerProcess] Server '{self.name}' running in process {self._process.pid}.")
+
+    def stop(self) -> None:
+        """Asks the child process to stop its server, killing it if it does not."""
+
+        if self._process is None:
+            return
+
+        try:
+            self._control.send("stop")
+        except (OSError, ValueError):
+            pass
+
+        self._process.join(STOP_TIMEOUT)
+        if self._process.is_alive():
+            logging.warning("[ServerProcess] Server process did not stop, terminating it.")
+            self._process.terminate()
+            self._process.join()
+
+        self._control.close()
+        self._process = None
+        self._control = None
+        logging.info("[ServerProcess] Stopped.")
+
+    def __repr__(self) -> str:
+        pid = self._process.pid if self._process else None
+        return f"<ServerProcess name='{self.name}' port={self.port} pid={pid} running={self.running}>"
+
+
+def _serve(name: str, port: int, control: Connection, stats: ServerStats, log_level: int) -> None:
+    """The child process: runs the server until the host says stop or goes away."""
+
+    logging.basicConfig(level=log_level, format="%(asctime)s - [%(levelname)s] - [server process] %(message)s")
+
+    server = Server(name=name, port=port)
+    try:
+        server.start()
+    except OSError as e:
+        control.send(("error", str(e)))
+        return
+
+    control.send(("started", None))
+
+    started = time.time()
+    while server.running:
+        try:
+            if control.poll(STATS_INTERVAL) and control.recv() == "stop":
+                break
+        except (EOFError, OSError):
+            # The host closed its end of the pipe, nobody is left to stop us
+            break
+
+        stats.clients = len(server.clients)
+        stats.spectators = len(server.spectators)
+        stats.items = len(server.items)
+        stats.bullets = len(server.projectiles)
+        stats.in_game = server.map_name is not None
+        stats.uptime = time.time() - started
+
+    server.stop()
@@ -0,0 +1,117 @@
+import threading
+
+from connection.util import SYMBOL_LITERAL
+
+
+class UnknownSymbolError(KeyError):
+    """Raised when a packet refers to a symbol id that has not been defined yet."""
+
+
+class SymbolTable:
+    """Session dictionary of strings that packets refer to by a 1-byte id.
+
+    The server owns the table: it sends every symbol, those defined before a
+    client joined and those added later, in a reliable define symbol packet.
+    Strings that are not in the table yet are still sent as literals, so the
+    table is only a way to shrink packets, never a requirement.
+    """
+
+    capacity: int = SYMBOL_LITERAL  # ids 0..254, 255 marks a literal
+
+    _symbols: list[str | None]
+    _ids: dict[str, int]
+    _lock: threading.Lock
+
+    def __init__(self, symbols: list[str] | None = None) -> None:
+        """Initializes the table.
+
+        Args:
+            symbols (list[str] | None): The initial symbols, given ids in order.
+        """
+
+        self._symbols = []
+        self._ids = {}
+        self._lock = threading.Lock()
+
+        for symbol in symbols or []:
+            self.intern(symbol)
+
+    @property
+    def symbols(self) -> list[str]:
+        """The symbols in id order."""
+
+        with self._lock:
+            return [symbol for symbol in self._symbols if symbol is not None]
+
+    @property
+    def definitions(self) -> list[tuple[int, str]]:
+        """The ids and symbols in id order."""
+
+        with self._lock:
+            return [(symbol_id, symbol) for symbol_id, symbol in enumerate(self._symbols) if symbol is not None]
+
+    def intern(self, symbol: str) -> tuple[int | None, bool]:
+        """Gives a symbol an id, if it does not have one already.
+
+        Args:
+            symbol (str): The string to add.
+
+        Returns:
+            tuple[int | None, bool]: The id of the symbol, or None if the table is full, and
+                whether the symbol was added by this call.
+        """
+
+        with self._lock:
+            if symbol in self._ids:
+                return self._ids[symbol], False
+
+            if len(self._symbols) >= self.capacity or len(symbol.encode()) > 0xFF:
+                return None, False
+
+            symbol_id = len(self._symbols)
+            self._symbols.append(symbol)
+            self._ids[symbol] = symbol_id
+            return symbol_id, True
+
+    def define(self, symbol_id: int, symbol: str) -> None:
+        """Stores a symbol with the id the server gave it.
+
+        Args:
+            symbol_id (int): The id of the symbol.
+            symbol (str): The symbol.
+        """
+
+        with self._lock:
+            while len(self._symbols) <= symbol_id:
+                self._symbols.append(None)
+
+            self._symbols[symbol_id] = symbol
+            self._ids[symbol] = symbol_id
+
+    def encode(self, symbol: str) -> int | str:
+        """Returns the id of a symbol, or the symbol itself if it has no id."""
+
+        with self._lock:
+            return self._ids.get(symbol, symbol)
+
+    def resolve(self, value: int | str) -> str:
+        """Returns the string a symbol id stands for, passing literals through.
+
+        Raises:
+            UnknownSymbolError: If the id has not been defined.
+        """
+
+        if isinstance(value, str):
+            return value
+
+        with self._lock:
+            if value < len(self._symbols) and self._symbols[value] is not None:
+                return self._symbols[value]
+
+        raise UnknownSymbolError(value)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __repr__(self) -> str:
+        return f"<SymbolTable size={len(self)}>"
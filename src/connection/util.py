@@ -42,4 +42,76 @@ def from_float(data: bytes) -> float:
     if len(data) != 4:
         raise ValueError("Data must be exactly 4 bytes long.")
 
-    return struct.unpack('>f', data)[0]
\ No newline at end of file
+    return struct.unpack('>f', data)[0]
+
+def to_uint16(value: int) -> bytes:
+    """Convert an integer to a 2-byte unsigned integer."""
+
+    if not (0 <= value <= 0xFFFF):
+        raise ValueError("Value must be between 0 and 65535.")
+
+    return struct.pack('>H', value)
+
+def from_uint16(data: bytes) -> int:
+    """Convert a 2-byte unsigned integer to an integer."""
+
+    if len(data) != 2:
+        raise ValueError("Data must be exactly 2 bytes long.")
+
+    return struct.unpack('>H', data)[0]
+
+def to_int16(value: int) -> bytes:
+    """Convert an integer to a 2-byte signed integer, clamping it to the int16 range."""
+
+    return struct.pack('>h', max(-0x8000, min(0x7FFF, int(value))))
+
+def from_int16(data: bytes) -> int:
+    """Convert a 2-byte signed integer to an integer."""
+
+    if len(data) != 2:
+        raise ValueError("Data must be exactly 2 bytes long.")
+
+    return struct.unpack('>h', data)[0]
+
+SYMBOL_LITERAL = 0xFF  # marks a symbol sent as a string because it has no id yet
+
+def to_symbol(value: int | str) -> bytes:
+    """Convert a symbol id or a literal string to bytes.
+
+    Ids take a single byte. Strings without an id are sent as the `SYMBOL_LITERAL`
+    marker followed by a 1-byte length and the UTF-8 bytes.
+    """
+
+    if isinstance(value, int):
+        if not (0 <= value < SYMBOL_LITERAL):
+            raise ValueError(f"Symbol id must be between 0 and {SYMBOL_LITERAL - 1}.")
+
+        return struct.pack('>B', value)
+
+    encoded = value.encode()
+    if len(encoded) > 0xFF:
+        raise ValueError("Symbol literal must be at most 255 bytes.")
+
+    return struct.pack('>BB', SYMBOL_LITERAL, len(encoded)) + encoded
+
+def from_symbol(data: bytes) -> tuple[int | str, int]:
+    """Convert the start of `data` to a symbol id or a literal string.
+
+    Returns:
+        tuple[int | str, int]: The symbol and the number of bytes it took.
+    """
+
+    if len(data) < 1:
+        raise ValueError("Data must contain at least one byte.")
+
+    if data[0] != SYMBOL_LITERAL:
+        return data[0], 1
+
+    if len(data) < 2:
+        raise ValueError("Symbol literal is missing its length.")
+
+    length = data[1]
+    if len(data) < 2 + length:
+        raise ValueError("Symbol literal is shorter than its length.")
+
+    return bytes(data[2:2 + length]).decode(), 2 + length
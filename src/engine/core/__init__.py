@@ -1,10 +1,12 @@
 from .game import Game
 from .scene import Scene
 from .game_object import GameObject
+from .spatial_hash import SpatialHash, StaticBox, RaycastHit
 from .components.tilemap import Tilemap
 from .components.box_collider import BoxCollider
 from .components.component import Component
 from .components.rigid_body import RigidBody
 from .components.sprite_renderer import SpriteRenderer
 from .components.transform import Transform
-from .components.canvas import Canvas
\ No newline at end of file
+from .components.canvas import Canvas
+from .components.projectile_pool import ProjectilePool
\ No newline at end of file
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import numpy as np
+from typing import Type, TYPE_CHECKING
+
+from .components.component import Component
+from .components.rigid_body import RigidBody, GRAVITY
+if TYPE_CHECKING:
+    from .game_object import GameObject
+
+
+INITIAL_CAPACITY = 64  # bodies the arrays hold before they are first grown
+
+
+class BodyStorage:
+    """The state of every rigid body in a scene, in contiguous arrays.
+
+    A body's row holds the position of its `Transform` and the velocity,
+    acceleration, mass, drag and gravity of its `RigidBody`; both components
+    read and write their row instead of vectors of their own while the body
+    is in the storage. Gravity, drag and the integration of every body then
+    run in `integrate` as a handful of array operations, which also move the
+    triggers, like bullets, since nothing stops them. Each `RigidBody.fixed_update`
+    is left with moving a solid body and resolving its collisions, or sweeping
+    a continuous one.
+
+    The positions every body had before and after the last fixed step are
+    kept as well, for `Transform.render_position` to draw between them.
+
+    Rows of removed bodies are reused, so a row is not a stable id.
+    """
+
+    position: np.ndarray
+    previous: np.ndarray
+    stepped: np.ndarray
+    velocity: np.ndarray
+    acceleration: np.ndarray
+    mass: np.ndarray
+    drag: np.ndarray
+    gravity: np.ndarray
+
+    _bodies: list[RigidBody | None]
+    _slots: dict[GameObject, int]
+    _free: list[int]
+    _size: int
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        """Initialize empty storage.
+
+        Args:
+            capacity (int, optional): The bodies to make room for up front. Defaults to 64.
+        """
+
+        self.position = np.zeros((capacity, 2))
+        self.previous = np.zeros((capacity, 2))
+        self.stepped = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.acceleration = np.zeros((capacity, 2))
+        self.mass = np.zeros(capacity)
+        self.drag = np.zeros(capacity)
+        self.gravity = np.zeros(capacity)
+
+        self._bodies = [None] * capacity
+        self._slots = {}
+        self._free = []
+        self._size = 0
+
+    def add(self, body: RigidBody) -> int:
+        """Move a started body and its Transform into the storage.
+
+        Args:
+            body (RigidBody): The body, with its Transform cached by `RigidBody.start`.
+
+        Returns:
+            int: The row of the body.
+        """
+
+        game_object = body.parent
+        if (slot := self._slots.get(game_object)) is not None:
+            return slot
+
+        # Still in the storage of a scene it was not removed from
+        if body._storage is not None:
+            body._storage.remove(game_object)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == len(self._bodies):
+                self._grow()
+            slot = self._size
+            self._size += 1
+
+        self._bodies[slot] = body
+        self._slots[game_object] = slot
+        self.stepped[slot] = np.nan  # Not stepped yet, so drawn where it is
+        body._transform._attach(self, slot)
+        body._attach(self, slot)
+        return slot
+
+    def remove(self, game_object: GameObject) -> None:
+        """Give a body its own vectors back and free its row. Does nothing for other objects.
+
+        Args:
+            game_object (GameObject): The GameObject leaving the storage.
+        """
+
+        slot = self._slots.pop(game_object, None)
+        if slot is None:
+            return
+
+        body = self._bodies[slot]
+        body._detach()
+        body._transform._detach()
+
+        self._bodies[slot] = None
+        self.acceleration[slot] = 0
+        self._free.append(slot)
+
+    def component_removed(self, game_object: GameObject, ctype: Type[Component]) -> None:
+        """Remove a body whose RigidBody or Transform was taken off its GameObject."""
+
+        slot = self._slots.get(game_object)
+        if slot is None:
+            return
+
+        body = self._bodies[slot]
+        if ctype is type(body) or ctype is type(body._transform):
+            self.remove(game_object)
+
+    def integrate(self, dt: float) -> None:
+        """Start a fixed step: apply gravity, drag and the accumulated forces to every simulated body, and move the triggers.
+
+        Moving the solid bodies and resolving their collisions is left to `RigidBody.fixed_update`.
+
+        Args:
+            dt (float): The length of the step in seconds.
+        """
+
+        n = self._size
+        if n == 0:
+            return
+
+        self.previous[:n] = self.position[:n]
+
+        # The same bodies RigidBody.fixed_update would simulate one by one
+        simulated = np.fromiter(
+            (body is not None and body.is_kinematic and body.parent.active for body in self._bodies[:n]),
+            dtype=bool,
+            count=n
+        )
+        if not simulated.any():
+            return
+
+        acceleration = self.acceleration[:n][simulated]
+        velocity = self.velocity[:n][simulated]
+
+        acceleration[:, 1] += GRAVITY * self.gravity[:n][simulated]
+        velocity[:, 0] *= 1 - self.drag[:n][simulated] * dt * 50
+        velocity += acceleration * dt
+
+        self.velocity[:n][simulated] = velocity
+        self.acceleration[:n][simulated] = 0
+
+        # A continuous trigger is swept by its RigidBody instead, to stop at what it runs into
+        triggers = np.fromiter(
+            (body is not None and body.is_trigger and not body.continuous for body in self._bodies[:n]),
+            dtype=bool,
+            count=n
+        )
+        moving = simulated & triggers
+        self.position[:n][moving] += self.velocity[:n][moving] * dt
+
+        for index in np.flatnonzero(moving):
+            game_object = self._bodies[index].parent
+            game_object.scene._object_moved(game_object)
+
+    def finish_step(self) -> None:
+        """End a fixed step, keeping where it left every body."""
+
+        n = self._size
+        self.stepped[:n] = self.position[:n]
+
+    def _grow(self) -> None:
+        """Double the capacity of every array."""
+
+        capacity = len(self._bodies) * 2
+        for name in ("position", "previous", "stepped", "velocity", "acceleration", "mass", "drag", "gravity"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]))
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+        self._bodies.extend([None] * (capacity - len(self._bodies)))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, game_object: GameObject) -> bool:
+        return game_object in self._slots
+
+    def __repr__(self) -> str:
+        return f"<BodyStorage bodies={len(self._slots)} capacity={len(self._bodies)}>"
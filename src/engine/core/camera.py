@@ -61,13 +61,16 @@ class Camera:
         if not target_transform:
             return
 
+        # Follow the target where it is drawn, so it does not shake between fixed steps
+        target_position = target_transform.render_position
+
         if self.smooth:
             # Smooth follow with interpolation
-            direction = target_transform.position - self.position + self.offset
+            direction = target_position - self.position + self.offset
             self.position += direction * (self.smooth_speed * dt)
         else:
             # Direct follow
-            self.position = Vector2(target_transform.position) + self.offset
+            self.position = target_position + self.offset
 
     def world_to_screen(self, world_pos: Vector2) -> Vector2:
         """Convert world coordinates to screen coordinates.
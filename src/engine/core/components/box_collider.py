@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import pygame as pg
-from typing import override
+from typing import override, TYPE_CHECKING
 from pygame.math import Vector2
 
 from ...constants import DEBUG_MODE
 from .component import Component
 from .transform import Transform
 from .sprite_renderer import SpriteRenderer
+if TYPE_CHECKING:
+    from ..spatial_hash import StaticBox
 
 
 class BoxCollider(Component):
@@ -79,6 +81,9 @@ class BoxCollider(Component):
         else:
             self.offset = Vector2(self.offset)
 
+        if self.parent.scene is not None:
+            self.parent.scene.spatial_hash.insert(self)
+
     @override
     def draw(self, surface) -> None:
         """Draw the collider's rectangle on the surface for debugging purposes."""
@@ -130,15 +135,11 @@ class BoxCollider(Component):
             pos1.y + self.height > pos2.y
         )
 
-    def is_colliding(self) -> BoxCollider | None:
-        """Check if this collider is colliding with any other BoxCollider in the scene."""
+    def is_colliding(self) -> BoxCollider | StaticBox | None:
+        """Check if this collider is colliding with any other BoxCollider, or a wall of the map, in the scene."""
 
-        for game_object in self.parent.scene._game_objects.values():
-            if game_object is self.parent:
-                continue
-            
-            collider = game_object.get_component(BoxCollider)
-            if collider and self.collides_with(collider):
+        for collider in self.parent.scene.spatial_hash.overlapping(self):
+            if collider.parent is not self.parent:
                 return collider
         
         return None
@@ -20,6 +20,10 @@ class Component:
         """Called every frame; dt is seconds since last frame."""
         pass
 
+    def fixed_update(self, dt: float) -> None:
+        """Called every fixed physics step, before the frame's update; dt is the length of the step."""
+        pass
+
     def draw(self, surface: pg.Surface) -> None:
         """Called every frame after update, to render visuals."""
         pass
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import os
+import math
+import logging
+import numpy as np
+import pygame as pg
+from typing import Callable, override, TYPE_CHECKING
+from pygame.math import Vector2
+
+from .component import Component
+from .transform import Transform
+from ..spatial_hash import RaycastHit, segment_box_times
+if TYPE_CHECKING:
+    from ..game_object import GameObject
+
+
+INITIAL_CAPACITY = 256  # projectiles the arrays hold before they are first grown
+ROTATIONS = 360  # rotated copies of the sprite, one per degree
+
+
+class ProjectilePool(Component):
+    """Every projectile of a scene, like bullets, in contiguous arrays instead of one GameObject each.
+
+    A projectile is a row holding its position, velocity, age and lifetime,
+    and the GameObject that fired it, which it goes through. Every fixed step
+    moves them all at once and sweeps each one along its whole path against
+    the solid colliders in the spatial hash, so it stops at the first one it
+    reaches, however fast it is. It is removed when it hits something or its
+    lifetime is over.
+
+    They all share one sprite, loaded once and rotated once per degree up
+    front, and are drawn with a single `blits` call, skipping those off screen.
+    Nothing is loaded or allocated per projectile, unless the arrays are full
+    and grow.
+
+    The box of a projectile hangs from its top left corner at its position,
+    while its sprite is centered there, as for a GameObject with both. Its
+    size is in world space; the sprite is scaled by the owner's Transform,
+    whose z-index places the projectiles among the other objects.
+
+    Rows are reused as projectiles go away, so a row is not a stable id.
+    """
+
+    size: tuple[float, float]
+    on_spawn: Callable[[Vector2, Vector2], None] | None
+    on_despawn: Callable[[Vector2], None] | None
+    on_hit: Callable[[RaycastHit], None] | None
+
+    position: np.ndarray
+    previous: np.ndarray
+    velocity: np.ndarray
+    age: np.ndarray
+    lifetime: np.ndarray
+    owner: np.ndarray
+    rotation: np.ndarray
+
+    _path: str
+    _count: int
+    _frames: list[pg.Surface]
+    _centers: np.ndarray
+
+    def __init__(
+        self,
+        path: str,
+        size: tuple[float, float],
+        capacity: int = INITIAL_CAPACITY,
+        on_spawn: Callable[[Vector2, Vector2], None] | None = None,
+        on_despawn: Callable[[Vector2], None] | None = None,
+        on_hit: Callable[[RaycastHit], None] | None = None
+    ) -> None:
+        """Initialize the ProjectilePool component.
+
+        Args:
+            path (str): Path to the image every projectile is drawn with, pointing right.
+            size (tuple[float, float]): The width and height of a projectile's box.
+            capacity (int, optional): The projectiles to make room for up front. Defaults to 256.
+            on_spawn (Callable[[Vector2, Vector2], None] | None, optional): Called with the position and
+                velocity of every projectile spawned. Defaults to None.
+            on_despawn (Callable[[Vector2], None] | None, optional): Called with the last position of every
+                projectile removed, by a hit or by age, after the step that removed it. Defaults to None.
+            on_hit (Callable[[RaycastHit], None] | None, optional): Called with what a projectile hit, where
+                its top left was and how far it got in the step, before it is despawned. Defaults to None.
+
+        Raises:
+            ValueError: If the image path is empty.
+            FileNotFoundError: If the image file does not exist at the specified path.
+        """
+
+        super().__init__()
+
+        if not path:
+            raise ValueError("Image path cannot be empty")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Image file not found at {path}")
+        self._path = path
+
+        self.size = size
+        self.on_spawn = on_spawn
+        self.on_despawn = on_despawn
+        self.on_hit = on_hit
+
+        self.position = np.zeros((capacity, 2))
+        self.previous = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.owner = np.zeros(capacity, dtype=np.int64)
+        self.rotation = np.zeros(capacity, dtype=np.intp)
+
+        self._count = 0
+        self._frames = []
+        self._centers = np.zeros((0, 2))
+
+    @override
+    def start(self) -> None:
+        """Load the sprite and rotate it once per degree.
+
+        Raises:
+            RuntimeError: If the ProjectilePool requires a Transform component on the owner.
+            RuntimeError: If the image cannot be loaded from the specified path.
+        """
+
+        transform = self.parent.get_component(Transform)
+        if transform is None:
+            raise RuntimeError("ProjectilePool requires a Transform component on the owner.")
+
+        try:
+            logging.info(f"[Game] Loading image from {self._path}")
+            sprite = pg.image.load(self._path).convert_alpha()
+        except pg.error as e:
+            raise RuntimeError(f"Failed to load image at {self._path}: {e}")
+
+        sprite = pg.transform.scale(sprite, (
+            int(sprite.get_width() * transform.scale.x),
+            int(sprite.get_height() * transform.scale.y)
+        ))
+
+        # Rotated like SpriteRenderer does, so a projectile looks the same as a GameObject with the sprite
+        self._frames = [pg.transform.rotate(sprite, -angle * 360 / ROTATIONS) for angle in range(ROTATIONS)]
+        self._centers = np.array([frame.get_size() for frame in self._frames], dtype=np.float64) / 2
+
+    def spawn(
+        self,
+        position: Vector2 | tuple[float, float],
+        velocity: Vector2 | tuple[float, float],
+        lifetime: float,
+        owner: GameObject | None = None
+    ) -> None:
+        """Add a projectile.
+
+        Args:
+            position (Vector2 | tuple[float, float]): Where it starts, in world space.
+            velocity (Vector2 | tuple[float, float]): Its velocity in pixels per second, which it keeps.
+            lifetime (float): How long it flies before it is removed, in seconds.
+            owner (GameObject | None, optional): Who fired it, whose collider it goes through. Defaults to None.
+        """
+
+        if self._count == len(self.position):
+            self._grow()
+
+        x, y = position
+        vx, vy = velocity
+
+        index = self._count
+        self._count += 1
+
+        self.position[index] = x, y
+        self.previous[index] = x, y
+        self.velocity[index] = vx, vy
+        self.age[index] = 0
+        self.lifetime[index] = lifetime
+        self.owner[index] = owner.id if owner is not None else -1
+        self.rotation[index] = round(math.degrees(math.atan2(vy, vx)) * ROTATIONS / 360) % ROTATIONS
+
+        if self.on_spawn:
+            self.on_spawn(Vector2(x, y), Vector2(vx, vy))
+
+    def clear(self) -> None:
+        """Remove every projectile, without calling `on_despawn`."""
+
+        self._count = 0
+
+    @override
+    def fixed_update(self, dt: float) -> None:
+        """Move every projectile, stopping it at the first collider it reaches, and remove those that hit or expired.
+
+        Args:
+            dt (float): The length of the step in seconds.
+        """
+
+        n = self._count
+        if n == 0:
+            return
+
+        position = self.position[:n]
+        self.previous[:n] = position
+        delta = self.velocity[:n] * dt
+        self.age[:n] += dt
+
+        time, colliders, blocker = self._sweep(position, delta)
+        hit = time <= 1
+
+        position += delta * np.where(hit, time, 1)[:, None]
+        gone = hit | (self.age[:n] >= self.lifetime[:n])
+        if not gone.any():
+            return
+
+        # Kept for the callbacks, which run once the rows are packed and can spawn again
+        hits = [
+            RaycastHit(colliders[blocker[index]], Vector2(*position[index]), float(time[index] * np.hypot(*delta[index])))
+            for index in np.flatnonzero(hit)
+        ] if self.on_hit else []
+        ends = position[gone].tolist() if self.on_despawn else []
+
+        keep = ~gone
+        count = int(keep.sum())
+        for array in (self.position, self.previous, self.velocity, self.age, self.lifetime, self.owner, self.rotation):
+            array[:count] = array[:n][keep]
+        self._count = count
+
+        for raycast_hit in hits:
+            self.on_hit(raycast_hit)
+        for end in ends:
+            self.on_despawn(Vector2(end))
+
+    def _sweep(self, position: np.ndarray, delta: np.ndarray) -> tuple[np.ndarray, list, np.ndarray]:
+        """Find the first solid collider each projectile runs into along its motion, but its owner's.
+
+        Returns:
+            tuple[np.ndarray, list, np.ndarray]: The fraction of the motion after which each projectile
+            reaches its collider, `inf` if none, the colliders and the index of each one's collider.
+        """
+
+        n = len(position)
+        scene = self.parent.scene
+        if scene is None:
+            return np.full(n, np.inf), [], np.zeros(n, dtype=np.intp)
+
+        width, height = self.size
+        end = position + delta
+        left, top = np.minimum(position, end).min(axis=0)
+        right, bottom = np.maximum(position, end).max(axis=0)
+
+        colliders, boxes = scene.spatial_hash.query_boxes(
+            (left, top, right - left + width, bottom - top + height),
+            lambda collider: not collider.is_trigger
+        )
+        if not colliders:
+            return np.full(n, np.inf), colliders, np.zeros(n, dtype=np.intp)
+
+        # The box hangs from the projectile's position, so each collider grows up and left by its size
+        boxes[:, 0] -= width
+        boxes[:, 1] -= height
+
+        times = segment_box_times(position, delta, boxes)
+
+        # A projectile without an owner is -1, like a collider without a GameObject, so it only goes through a real one
+        owner = self.owner[:n, None]
+        owners = np.array([collider.parent.id if collider.parent is not None else -1 for collider in colliders])
+        times[(owner == owners[None, :]) & (owner >= 0)] = np.inf
+
+        blocker = times.argmin(axis=1)
+        return times[np.arange(n), blocker], colliders, blocker
+
+    def _grow(self) -> None:
+        """Double the capacity of the arrays, keeping the projectiles."""
+
+        for name in ("position", "previous", "velocity", "age", "lifetime", "owner", "rotation"):
+            array = getattr(self, name)
+            grown = np.zeros((len(array) * 2, *array.shape[1:]), dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    @override
+    def draw(self, surface: pg.Surface) -> None:
+        """Draw every projectile on screen, between where it was and where it is after the last fixed step.
+
+        Args:
+            surface (pg.Surface): The surface to draw on.
+        """
+
+        n = self._count
+        if n == 0 or not self._frames:
+            return
+
+        scene = self.parent.scene
+        previous = self.previous[:n]
+        position = previous + (self.position[:n] - previous) * scene.interpolation
+
+        rotation = self.rotation[:n]
+        centers = self._centers[rotation]
+        top_left = position + tuple(scene.camera.world_to_screen(Vector2(0, 0))) - centers
+
+        width, height = surface.get_size()
+        visible = (
+            (top_left[:, 0] < width) & (top_left[:, 0] + 2 * centers[:, 0] > 0) &
+            (top_left[:, 1] < height) & (top_left[:, 1] + 2 * centers[:, 1] > 0)
+        )
+
+        frames = self._frames
+        surface.blits(
+            [(frames[r], (x, y)) for r, (x, y) in zip(rotation[visible].tolist(), top_left[visible].tolist())],
+            doreturn=False
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"<{super().__repr__()} path={self._path}, projectiles={self._count}, capacity={len(self.position)}>"
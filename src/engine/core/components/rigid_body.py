@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pygame as pg
-from typing import override
+from typing import override, TYPE_CHECKING
 from pygame.math import Vector2
 
 from .component import Component
@@ -9,6 +9,12 @@ from .transform import Transform
 from .box_collider import BoxCollider
 from ..game_object import GameObject
 from ...constants import DEBUG_MODE
+if TYPE_CHECKING:
+    from ..body_storage import BodyStorage
+    from ..spatial_hash import StaticBox
+
+
+GRAVITY = 110  # downward acceleration, in pixels per second squared, at a gravity scale of 1
 
 
 class RigidBody(Component):
@@ -22,12 +28,17 @@ class RigidBody(Component):
     velocity: Vector2
 
     is_kinematic: bool
+    continuous: bool
+    contact: BoxCollider | StaticBox | None
 
     _transform: Transform | None
     _collider: BoxCollider | None
 
     _exceptions: list[type[GameObject]] | None = None
 
+    _storage: BodyStorage | None
+    _slot: int
+
     def __init__(
         self, 
         mass: float = 1, 
@@ -35,7 +46,8 @@ class RigidBody(Component):
         gravity: float = 10,
         is_kinematic: bool = True,
         is_trigger: bool = False,
-        exceptions: list[type[GameObject]] | None = None
+        exceptions: list[type[GameObject]] | None = None,
+        continuous: bool = False
     ) -> None:
         """Initialize the RigidBody component.
 
@@ -44,9 +56,21 @@ class RigidBody(Component):
             drag (float, optional): The drag force to be applied in the X axis. Defaults to 0.05.
             gravity (float, optional): The gravity scale to be applied in the Y axis. Defaults to 10.0.
             is_kinematic (bool, optional): If False, the RigidBody will not be affected by forces and will only move when explicitly set. Defaults to True.
+            continuous (bool, optional): If True, the body is swept along its whole motion every step, so it stops
+                at the first obstacle in the way however fast it goes, instead of only checking where it ends up.
+                A continuous trigger stops there too. Defaults to False.
+
+        Note:
+            - `contact` is the obstacle that stopped the body in its last step, or None. A trigger only has
+              one if it is continuous, and keeps it until it moves again.
+            - In a scene with a `BodyStorage`, the values live in the body's row from `start` on and
+              reading `velocity` or `acceleration` gives a copy: assign to them to change them.
         """
         
         super().__init__()
+
+        self._storage = None
+        self._slot = -1
         
         self.mass = mass
         self.drag = drag
@@ -63,6 +87,75 @@ class RigidBody(Component):
         self.is_grounded = False
         self.is_kinematic = is_kinematic
         self.is_trigger = is_trigger
+        self.continuous = continuous
+        self.contact = None
+
+    @property
+    def mass(self) -> float:
+        if self._storage is not None:
+            return self._storage.mass.item(self._slot)
+        return self._mass
+
+    @mass.setter
+    def mass(self, value: float) -> None:
+        if self._storage is not None:
+            self._storage.mass[self._slot] = value
+        else:
+            self._mass = value
+
+    @property
+    def drag(self) -> float:
+        if self._storage is not None:
+            return self._storage.drag.item(self._slot)
+        return self._drag
+
+    @drag.setter
+    def drag(self, value: float) -> None:
+        if self._storage is not None:
+            self._storage.drag[self._slot] = value
+        else:
+            self._drag = value
+
+    @property
+    def gravity(self) -> float:
+        if self._storage is not None:
+            return self._storage.gravity.item(self._slot)
+        return self._gravity
+
+    @gravity.setter
+    def gravity(self, value: float) -> None:
+        if self._storage is not None:
+            self._storage.gravity[self._slot] = value
+        else:
+            self._gravity = value
+
+    @property
+    def velocity(self) -> Vector2:
+        if self._storage is not None:
+            return Vector2(self._storage.velocity.item(self._slot, 0), self._storage.velocity.item(self._slot, 1))
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value: Vector2) -> None:
+        if self._storage is not None:
+            self._storage.velocity[self._slot, 0] = value[0]
+            self._storage.velocity[self._slot, 1] = value[1]
+        else:
+            self._velocity = value
+
+    @property
+    def acceleration(self) -> Vector2:
+        if self._storage is not None:
+            return Vector2(self._storage.acceleration.item(self._slot, 0), self._storage.acceleration.item(self._slot, 1))
+        return self._acceleration
+
+    @acceleration.setter
+    def acceleration(self, value: Vector2) -> None:
+        if self._storage is not None:
+            self._storage.acceleration[self._slot, 0] = value[0]
+            self._storage.acceleration[self._slot, 1] = value[1]
+        else:
+            self._acceleration = value
 
     @override
     def start(self) -> None:
@@ -85,66 +178,147 @@ class RigidBody(Component):
         if not self._collider:
             raise RuntimeError("RigidBody requires a BoxCollider component on the owner.")
 
+        scene = self.parent.scene
+        if scene is not None and scene.body_storage is not None:
+            scene.body_storage.add(self)
+
     @override
-    def update(self, dt: float) -> None:
-        """Update the RigidBody component.
+    def fixed_update(self, dt: float) -> None:
+        """Simulate the RigidBody for one fixed step.
+
+        In a scene with a `BodyStorage`, gravity, drag and the forces were already
+        applied by `BodyStorage.integrate`, which moved a trigger as well.
 
         Args:
-            dt (float): The delta time since the last update.
+            dt (float): The length of the step in seconds.
         """
 
         if not self.parent.active:
             return
 
-        if not self.is_kinematic or not self._transform or not self._collider:
+        if not self._transform or not self._collider:
             return
 
-        # Apply gravity and drag
-        self.acceleration += Vector2(0, 110) * self.gravity  # Apply gravity in the Y axis
-        self.velocity.x *= (1 - self.drag * dt * 50)
+        if self._storage is not None:
+            self._simulate(dt)
+            return
 
-        # Integrate acceleration
-        self.velocity += self.acceleration * dt
-        self.acceleration = Vector2(0.0, 0.0)
+        # The storage keeps these for its bodies, the Transform draws between them
+        transform = self._transform
+        previous = (transform.x, transform.y)
+        self._simulate(dt)
+        transform._previous = previous
+        transform._stepped = (transform.x, transform.y)
+
+    def _simulate(self, dt: float) -> None:
+        """Apply gravity, drag and the forces, if not done by the body storage, then move the body."""
+
+        if not self.is_kinematic:
+            return
+
+        if self._storage is None:
+            # Apply gravity and drag
+            self._acceleration += Vector2(0, GRAVITY) * self._gravity  # Apply gravity in the Y axis
+            self._velocity.x *= (1 - self._drag * dt * 50)
+
+            # Integrate acceleration
+            self._velocity += self._acceleration * dt
+            self._acceleration = Vector2(0.0, 0.0)
+        elif self.is_trigger and not self.continuous:
+            self.is_grounded = False
+            return
+
+        self._move(dt)
+
+    def _move(self, dt: float) -> None:
+        """Move by the velocity, one axis at a time, stopping at the first solid collider in the way."""
+
+        x, y = self._transform.x, self._transform.y
+        velocity = self.velocity
+        vx, vy = velocity.x, velocity.y
 
         # Predict new position
-        new_pos = self._transform.world_position + self.velocity * dt
+        new_x = x + vx * dt
+        new_y = y + vy * dt
         self.is_grounded = False
 
-        # Gather other colliders
         scene = self.parent.scene
-        colliders = [
-            obj.get_component(BoxCollider)
-            for obj in scene._game_objects.values()
-            if obj is not self.parent and obj.get_component(BoxCollider)
-        ] if scene else []
-
-        # Move and resolve X collisions
-        self._transform.x = new_pos.x
-        for collider in colliders:
-            if self._collider.collides_with(collider) and not collider.is_trigger and not self.is_trigger:
-                if any(isinstance(collider.parent, exc) for exc in self._exceptions):
-                    continue
-                
-                if self.velocity.x > 0:
-                    self._transform.x = collider.get_rect().left - self._collider.width - self._collider.offset.x
-                elif self.velocity.x < 0:
-                    self._transform.x = collider.get_rect().right - self._collider.offset.x
-                self.velocity.x = 0
-
-        # Move and resolve Y collisions
-        self._transform.y = new_pos.y
-        for collider in colliders:
-            if self._collider.collides_with(collider) and not collider.is_trigger and not self.is_trigger:
-                if any(isinstance(collider.parent, exc) for exc in self._exceptions):
-                    continue
-                
-                if self.velocity.y > 0:
-                    self._transform.y = collider.get_rect().top - self._collider.height - self._collider.offset.y
+        width, height = self._collider.width, self._collider.height
+        offset_x, offset_y = self._collider.offset.x, self._collider.offset.y
+
+        if self.is_trigger:
+            # Nothing stops a trigger, but a continuous one stops at the first obstacle it runs into and keeps it
+            if self.continuous and scene is not None and (vx or vy):
+                self.contact = None
+                hit = scene.spatial_hash.sweep((x + offset_x, y + offset_y, width, height), (new_x - x, new_y - y), self._blocks)
+                if hit:
+                    new_x, new_y = hit.point.x - offset_x, hit.point.y - offset_y
+                    vx = vy = 0
+                    self.contact = hit.collider
+
+            x, y = new_x, new_y
+
+        else:
+            self.contact = None
+
+            # Move and resolve X collisions. Only the first obstacle matters, it stops the body
+            if scene is not None and (obstacle := self._obstacle(scene, x + offset_x, y + offset_y, width, height, new_x - x, 0)):
+                if vx > 0:
+                    new_x = obstacle.get_rect().left - width - offset_x
+                elif vx < 0:
+                    new_x = obstacle.get_rect().right - offset_x
+                vx = 0
+                self.contact = obstacle
+            x = new_x
+
+            # Move and resolve Y collisions
+            if scene is not None and (obstacle := self._obstacle(scene, x + offset_x, y + offset_y, width, height, 0, new_y - y)):
+                if vy > 0:
+                    new_y = obstacle.get_rect().top - height - offset_y
                     self.is_grounded = True
-                elif self.velocity.y < 0:
-                    self._transform.y = collider.get_rect().bottom - self._collider.offset.y
-                self.velocity.y = 0
+                elif vy < 0:
+                    new_y = obstacle.get_rect().bottom - offset_y
+                vy = 0
+                self.contact = obstacle
+            y = new_y
+
+        self._transform.x = x
+        self._transform.y = y
+        if self._storage is not None:
+            self.velocity = (vx, vy)
+        else:
+            self._velocity.x = vx
+            self._velocity.y = vy
+
+    def _obstacle(self, scene, left: float, top: float, width: float, height: float, dx: float, dy: float) -> BoxCollider | StaticBox | None:
+        """Find what stops a box moving by `(dx, dy)`.
+
+        That is the first obstacle it overlaps where it ends up or, for a continuous body, the first
+        one it runs into on the way, which it could otherwise skip over.
+        """
+
+        if self.continuous:
+            hit = scene.spatial_hash.sweep((left, top, width, height), (dx, dy), self._blocks)
+            if hit:
+                return hit.collider
+
+        return self._first_obstacle(scene, left + dx, top + dy, width, height)
+
+    def _first_obstacle(self, scene, left: float, top: float, width: float, height: float) -> BoxCollider | StaticBox | None:
+        """Find the first solid collider or static box, in scene order, overlapping a box."""
+
+        for collider in scene.spatial_hash.query_rect((left, top, width, height)):
+            if self._blocks(collider):
+                return collider
+
+        return None
+
+    def _blocks(self, collider: BoxCollider | StaticBox) -> bool:
+        """Check whether a collider stops this body: a solid one on another object, not an exception."""
+
+        if collider.parent is self.parent or collider.is_trigger:
+            return False
+        return not any(isinstance(collider.parent, exc) for exc in self._exceptions)
 
     @override
     def draw(self, surface) -> None:
@@ -201,13 +375,38 @@ class RigidBody(Component):
             mass=self.mass,
             drag=self.drag,
             gravity=self.gravity,
-            is_kinematic=self.is_kinematic
+            is_kinematic=self.is_kinematic,
+            continuous=self.continuous
         )
         new_rigidbody.parent = self.parent
         new_rigidbody._transform = self._transform.clone() if self._transform else None
         new_rigidbody._collider = self._collider.clone() if self._collider else None
         return new_rigidbody
 
+    def _attach(self, storage: BodyStorage, slot: int) -> None:
+        """Move the body's values into a row of a scene's body storage."""
+
+        storage.velocity[slot] = (self._velocity.x, self._velocity.y)
+        storage.acceleration[slot] = (self._acceleration.x, self._acceleration.y)
+        storage.mass[slot] = self._mass
+        storage.drag[slot] = self._drag
+        storage.gravity[slot] = self._gravity
+        self._storage = storage
+        self._slot = slot
+
+    def _detach(self) -> None:
+        """Take the body's values back out of the body storage."""
+
+        storage, slot = self._storage, self._slot
+        self._storage = None
+        self._slot = -1
+
+        self._velocity = Vector2(storage.velocity.item(slot, 0), storage.velocity.item(slot, 1))
+        self._acceleration = Vector2(storage.acceleration.item(slot, 0), storage.acceleration.item(slot, 1))
+        self._mass = storage.mass.item(slot)
+        self._drag = storage.drag.item(slot)
+        self._gravity = storage.gravity.item(slot)
+
     def __repr__(self) -> str:
         return (f"<{super().__repr__()} mass={self.mass} linear_drag={self.drag} "
                 f"gravity_scale={self.gravity} is_grounded={self.is_grounded} "
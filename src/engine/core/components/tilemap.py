@@ -5,13 +5,51 @@ import pytmx
 import pygame as pg
 from pygame.math import Vector2
 from pytmx.util_pygame import load_pygame
-from typing import override
+from typing import override, TYPE_CHECKING
 
 from .transform import Transform
 from .component import Component
 from .box_collider import BoxCollider
 from ..game_object import GameObject
 from ...util import validate_pivot
+from ...constants import DEBUG_MODE
+if TYPE_CHECKING:
+    from ..spatial_hash import StaticBox
+
+
+def merge_boxes(boxes: list[tuple[float, float, float, float]]) -> list[tuple[float, float, float, float]]:
+    """Merges boxes that share a whole edge into bigger ones, as long as any two do.
+
+    Args:
+        boxes (list[tuple[float, float, float, float]]): The boxes as `(x, y, width, height)`.
+
+    Returns:
+        list[tuple[float, float, float, float]]: Fewer or as many boxes, covering the same area.
+    """
+
+    boxes = list(boxes)
+    merged = True
+    while merged:
+        merged = False
+        for i, (ax, ay, aw, ah) in enumerate(boxes):
+            for j in range(i + 1, len(boxes)):
+                bx, by, bw, bh = boxes[j]
+                if ay == by and ah == bh and (ax + aw == bx or bx + bw == ax):
+                    boxes[i] = (min(ax, bx), ay, aw + bw, ah)
+                elif ax == bx and aw == bw and (ay + ah == by or by + bh == ay):
+                    boxes[i] = (ax, min(ay, by), aw, ah + bh)
+                else:
+                    continue
+
+                del boxes[j]
+                merged = True
+                break
+
+            if merged:
+                break
+
+    return boxes
+
 
 
 class Tile(pg.sprite.Sprite):
@@ -30,9 +68,10 @@ class Tile(pg.sprite.Sprite):
     def update(self, transform: Transform, offset: Vector2) -> None:
         """Update the tile's position based on the transform."""
 
+        screen_position = transform.screen_position
         self.rect.topleft = (
-            transform.screen_position.x + (self.position.x * transform.scale.x) - offset.x,
-            transform.screen_position.y + (self.position.y * transform.scale.y) - offset.y
+            screen_position.x + (self.position.x * transform.scale.x) - offset.x,
+            screen_position.y + (self.position.y * transform.scale.y) - offset.y
         )
         self.image = pg.transform.scale(self.original_image, (
             int(self.original_image.get_width() * transform.scale.x),
@@ -40,23 +79,35 @@ class Tile(pg.sprite.Sprite):
         ))
 
 class Tilemap(Component):
-    """Tilemap component for rendering Tiled maps in Pygame."""
+    """Tilemap component for rendering Tiled maps in Pygame.
+
+    The boxes of the `Collider` layer that are plain walls are merged and put
+    in the scene's spatial hash as `StaticBox`es, which nothing updates or
+    draws. A box with a name or a trigger, like a `CharacterSelect`, becomes a
+    GameObject with a `BoxCollider` named `"<map> (Collider <id>)"`, for the
+    scene to find and give components to.
+    """
 
     group: pg.sprite.Group
     data: pytmx.TiledMap
+    load_images: bool
 
     _colliders: list[GameObject]
+    _static: list[StaticBox]
 
     def __init__(
         self,
         path: str,
-        pivot: Vector2 | tuple[float, float] | str = (0.5, 0.5)
+        pivot: Vector2 | tuple[float, float] | str = (0.5, 0.5),
+        load_images: bool = True
     ) -> None:
         """Initialize the Tilemap component.
 
         Args:
             path (str): Path to the Tiled map file (.tmx).
             pivot (Vector2 | tuple[float, float] | str, optional): Pivot point for the tilemap. Defaults to (0.0, 0.0).
+            load_images (bool, optional): If False, only the map data is read and no tile is drawn,
+                so the colliders can be used without a display. Defaults to True.
         """
 
         super().__init__()
@@ -65,9 +116,11 @@ class Tilemap(Component):
             raise FileNotFoundError(f"Tilemap file '{path}' does not exist.")
 
         self._colliders = []
+        self._static = []
         self.group = pg.sprite.Group()
-        self.data = load_pygame(path)
+        self.data = load_pygame(path) if load_images else pytmx.TiledMap(path)
         self.pivot = validate_pivot(pivot)
+        self.load_images = load_images
 
     @property
     def width(self) -> int:
@@ -138,7 +191,7 @@ class Tilemap(Component):
         collider_layer = self.data.get_layer_by_name("Collider")
 
         for layer in self.data.visible_layers:
-            if not isinstance(layer, pytmx.TiledTileLayer):
+            if not isinstance(layer, pytmx.TiledTileLayer) or not self.load_images:
                 continue
 
             for x, y, surface in layer.tiles():
@@ -156,6 +209,7 @@ class Tilemap(Component):
         if not collider_layer:
             return
         
+        walls = []
         for obj in collider_layer:
             obj: pytmx.TiledObject
 
@@ -166,6 +220,10 @@ class Tilemap(Component):
             if not (width and height):
                 continue
 
+            if not obj.name and not is_trigger:
+                walls.append((x, y, width, height))
+                continue
+
             collider = GameObject(name=f"{self.parent.name} (Collider {obj.id})")
             collider.add_component(Transform(position=self.get_position(x, y)))
             collider.add_component(BoxCollider(width=width * transform.scale.x, height=height * transform.scale.y, is_trigger=is_trigger))
@@ -173,6 +231,13 @@ class Tilemap(Component):
 
             self._colliders.append(collider)
 
+        spatial_hash = self.parent.scene.spatial_hash
+        for x, y, width, height in merge_boxes(walls):
+            position = self.get_position(x, y)
+            self._static.append(spatial_hash.insert_static(
+                position.x, position.y, width * transform.scale.x, height * transform.scale.y
+            ))
+
     @override
     def draw(self, surface: pg.Surface) -> None:
         """Draw the tilemap on the given surface."""
@@ -185,6 +250,12 @@ class Tilemap(Component):
         group.update(transform, self.offset)
         group.draw(surface)
 
+        if DEBUG_MODE:
+            camera = self.parent.scene.camera
+            for box in self._static:
+                position = camera.world_to_screen(Vector2(box.left, box.top))
+                pg.draw.rect(surface, (0, 255, 0), pg.Rect(position.x, position.y, box.width, box.height), 1)
+
     @override
     def destroy(self):
         """Destroy the Tilemap component and its colliders."""
@@ -192,7 +263,13 @@ class Tilemap(Component):
         for collider in self._colliders:
             collider.destroy()
 
+        scene = self.parent.scene
+        if scene is not None:
+            for box in self._static:
+                scene.spatial_hash.remove_static(box)
+
         self._colliders.clear()
+        self._static.clear()
         self.group.empty()
 
         super().destroy()
@@ -201,7 +278,7 @@ class Tilemap(Component):
     def clone(self) -> Tilemap:
         """Create a copy of this Tilemap component."""
         
-        new_tilemap = Tilemap(self.data.filename, self.pivot)
+        new_tilemap = Tilemap(self.data.filename, self.pivot, self.load_images)
         new_tilemap._colliders = [collider.clone() for collider in self._colliders]
         new_tilemap.group = self.group.copy()
         new_tilemap.parent = self.parent
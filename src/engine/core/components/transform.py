@@ -2,17 +2,25 @@ from __future__ import annotations
 
 import pygame as pg
 from pygame.math import Vector2
-from typing import override
+from typing import override, TYPE_CHECKING
 
 from .component import Component
 from ...constants import DEBUG_MODE
+if TYPE_CHECKING:
+    from ..body_storage import BodyStorage
 
 
 class Transform(Component):
     position: Vector2
     rotation: float
     scale: Vector2
-    z_index: int
+
+    _z_index: int
+    _position: Vector2
+    _previous: tuple[float, float] | None
+    _stepped: tuple[float, float] | None
+    _storage: BodyStorage | None
+    _slot: int
 
     def __init__(
         self, 
@@ -34,15 +42,59 @@ class Transform(Component):
         Note:
             - If `position` is provided, it will override `x` and `y`.
             - If `scale` is provided as a single float, it will be applied equally to both axes.
+            - While the GameObject is a body in a scene's `BodyStorage`, reading `position` gives a copy
+              of its row: assign to `position`, `x` or `y` to move it.
+            - Moving the transform in place, like `position.x = ...`, is not seen by the scene's spatial hash,
+              assign to `position`, `x` or `y` instead.
         """
         
         super().__init__()
 
+        self._storage = None
+        self._slot = -1
+        self._previous = None
+        self._stepped = None
+
         self.position = Vector2(position) or Vector2(x, y)
-        self.z_index = z_index
+        self._z_index = z_index
         self.rotation = rotation
         self.scale = scale if isinstance(scale, Vector2) else Vector2(scale, scale)
 
+    @property
+    def position(self) -> Vector2:
+        """Get the position of the transform, relative to its parent."""
+
+        if self._storage is not None:
+            return Vector2(self._storage.position.item(self._slot, 0), self._storage.position.item(self._slot, 1))
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector2) -> None:
+        """Set the position of the transform, relative to its parent."""
+
+        if self._storage is not None:
+            self._storage.position[self._slot, 0] = value[0]
+            self._storage.position[self._slot, 1] = value[1]
+        else:
+            self._position = value
+        self._moved()
+
+    @property
+    def z_index(self) -> int:
+        """Get the z-index, objects with a higher one are drawn on top."""
+
+        return self._z_index
+
+    @z_index.setter
+    def z_index(self, value: int) -> None:
+        """Set the z-index, moving the object in its scene's render order."""
+
+        self._z_index = value
+
+        parent = getattr(self, "parent", None)
+        if parent is not None and parent.scene is not None:
+            parent.scene._update_render_order(parent)
+
     @property
     def world_position(self) -> Vector2:
         """Get the world position of the transform."""
@@ -52,36 +104,97 @@ class Transform(Component):
             return transform.world_position + self.position
         return self.position
 
+    @property
+    def render_position(self) -> Vector2:
+        """Get the world position the transform is drawn at.
+
+        A body is drawn between where the last two fixed steps left it, as far along as the
+        game is into the next step, so it moves smoothly whatever the frame rate. Anything
+        else, or a body moved since the last step, is drawn where it is.
+        """
+
+        position = self.position
+        if self._storage is not None:
+            storage, slot = self._storage, self._slot
+            previous = (storage.previous.item(slot, 0), storage.previous.item(slot, 1))
+            stepped = (storage.stepped.item(slot, 0), storage.stepped.item(slot, 1))
+        else:
+            previous, stepped = self._previous, self._stepped
+
+        if stepped is not None and stepped == (position.x, position.y) and self.parent.scene is not None:
+            position = Vector2(previous).lerp(position, self.parent.scene.interpolation)
+
+        parent = self.parent.parent
+        if parent and (transform := parent.get_component(Transform)):
+            return transform.render_position + position
+        return Vector2(position)
+
     @property
     def screen_position(self) -> Vector2:
-        """Get the screen position of the transform."""
+        """Get the screen position the transform is drawn at."""
         
         if self.parent:
-            return self.parent.scene.camera.world_to_screen(self.world_position)
+            return self.parent.scene.camera.world_to_screen(self.render_position)
         return self.world_position
 
     @property
     def x(self) -> float:
         """Get the x position."""
         
-        return self.position.x
+        if self._storage is not None:
+            return self._storage.position.item(self._slot, 0)
+        return self._position.x
 
     @x.setter
     def x(self, value: float) -> None:
         """Set the x position."""
         
-        self.position.x = value
+        if self._storage is not None:
+            self._storage.position[self._slot, 0] = value
+        else:
+            self._position.x = value
+        self._moved()
 
     @property
     def y(self) -> float:
         """Get the y position."""
         
-        return self.position.y
+        if self._storage is not None:
+            return self._storage.position.item(self._slot, 1)
+        return self._position.y
 
     @y.setter
     def y(self, value: float) -> None:
         """Set the y position."""
-        self.position.y = value
+        
+        if self._storage is not None:
+            self._storage.position[self._slot, 1] = value
+        else:
+            self._position.y = value
+        self._moved()
+
+    def _moved(self) -> None:
+        """Tell the scene the object moved, for its spatial hash."""
+
+        parent = getattr(self, "parent", None)
+        if parent is not None and parent.scene is not None:
+            parent.scene._object_moved(parent)
+
+    def _attach(self, storage: BodyStorage, slot: int) -> None:
+        """Move the position into a row of a scene's body storage."""
+
+        storage.position[slot] = (self._position.x, self._position.y)
+        self._storage = storage
+        self._slot = slot
+        self._previous = None
+        self._stepped = None
+
+    def _detach(self) -> None:
+        """Take the position back out of the body storage."""
+
+        self._position = Vector2(self._storage.position.item(self._slot, 0), self._storage.position.item(self._slot, 1))
+        self._storage = None
+        self._slot = -1
 
     @override
     def draw(self, surface) -> None:
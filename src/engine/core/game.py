@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from .scene import Scene
     from connection.client import Client
     from connection.server import Server
+    from connection.server_process import ServerProcess
 
 
 class Game:
@@ -17,13 +18,16 @@ class Game:
     screen: pg.Surface
     clock: pg.time.Clock
     fps: int
+    tick_rate: int
+    max_substeps: int
 
     client: Client | None
-    server: Server | None
+    server: Server | ServerProcess | None
 
     is_admin: bool
     _scenes: list['Scene']
     _running: bool
+    _physics_time: float
     _instance: Game = None
 
     def __init__(
@@ -32,7 +36,9 @@ class Game:
         width: int = 800,
         height: int = 600,
         fps: int = 60,
-        icon: str = None
+        icon: str = None,
+        tick_rate: int = 60,
+        max_substeps: int = 5
     ) -> None:
         """Initialize the Game instance.
 
@@ -42,6 +48,9 @@ class Game:
             height (int, optional): The height of the game window. Defaults to 600.
             fps (int, optional): The frames per second for the game loop. Defaults to 60.
             icon (str, optional): Path to the icon image file. Defaults to None.
+            tick_rate (int, optional): The fixed physics steps per second, whatever the frame rate. Defaults to 60.
+            max_substeps (int, optional): The most fixed steps run in one frame. A slower frame drops the
+                time past them, so the game slows down instead of falling further behind. Defaults to 5.
         Raises:
             RuntimeError: If an instance of Game already exists.
         """
@@ -53,7 +62,10 @@ class Game:
         self.width = width
         self.height = height
         self.fps = fps
+        self.tick_rate = tick_rate
+        self.max_substeps = max_substeps
         self._running = False
+        self._physics_time = 0.0
 
         pg.init()
         pg.display.set_caption(title)
@@ -152,10 +164,19 @@ class Game:
                         # give scene a chance to consume it
                         self.current_scene._handle_event(event)
                 else:
-                    # 2) Update
+                    # 2) Fixed steps, as many as fit in the time since the last one
+                    scene = self.current_scene
+                    step = 1 / self.tick_rate
+                    self._physics_time = min(self._physics_time + dt, step * self.max_substeps)
+                    while self._physics_time >= step:
+                        scene._fixed_update(step)
+                        self._physics_time -= step
+                    scene.interpolation = self._physics_time / step
+
+                    # 3) Update
                     self.current_scene._update(dt)
 
-                    # 3) Draw
+                    # 4) Draw
                     def draw_scene(scene: "Scene", surface: pg.Surface) -> None:
                         if scene.transparent and len(self._scenes) > 1:
                             draw_scene(self._scenes[-2], surface)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import itertools
 import pygame as pg
-from typing import Type, TypeVar, TYPE_CHECKING
+from typing import Iterable, Type, TypeVar, TYPE_CHECKING
 
 from .components.component import Component
 if TYPE_CHECKING:
@@ -10,8 +11,12 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound=Component)
 
+AUTO_ID_START = 1 << 32  # above every uint32 id the network hands out, so given and automatic ids never meet
+
 class GameObject:
+    id: int
     name: str
+    tags: set[str]
     active: bool  # skip update/draw if False
     visible: bool  # skip draw if False
     parent: GameObject | None
@@ -19,12 +24,24 @@ class GameObject:
     scene: "Scene" | None
     _components: dict[Type[Component], Component]
 
-    def __init__(self, name: str, parent: GameObject | None = None) -> None:
+    _ids = itertools.count(AUTO_ID_START)
+
+    def __init__(
+        self,
+        name: str,
+        parent: GameObject | None = None,
+        *,
+        id: int | None = None,
+        tags: Iterable[str] = ()
+    ) -> None:
         """Initialize a GameObject with a name and an optional parent.
 
         Args:
             name (str): The name of the GameObject.
             parent (GameObject | None): The parent GameObject, if any. Defaults to None
+            id (int | None): The entity id, for an object that mirrors something with an id of its own,
+                like a player. If None, a unique one is given. Defaults to None.
+            tags (Iterable[str]): The tags to find the GameObject by in its scene. Defaults to none.
         Raises:
             ValueError: If the name is empty or already exists.
         """
@@ -32,7 +49,9 @@ class GameObject:
         if not name:
             raise ValueError("GameObject name cannot be empty")
         
+        self.id = id if id is not None else next(GameObject._ids)
         self.name = name
+        self.tags = set(tags)
         self.active = True
         self.visible = True
         self.parent = parent
@@ -61,6 +80,10 @@ class GameObject:
 
         component.parent = self
         self._components[ctype] = component
+
+        if self.scene is not None:
+            self.scene._component_added(self, component)
+
         return component
 
     def get_component(self, ctype: Type[T]) -> T | None:
@@ -83,8 +106,42 @@ class GameObject:
             bool: True if the component was removed, False if it was not found.
         """
         
-        comp = self._component_map.pop(ctype, None)
-        return comp is not None
+        comp = self._components.pop(ctype, None)
+        if comp is None:
+            return False
+
+        if self.scene is not None:
+            self.scene._component_removed(self, ctype)
+
+        return True
+
+    def add_tag(self, tag: str) -> None:
+        """Adds a tag to the GameObject.
+
+        Args:
+            tag (str): The tag to add.
+        """
+
+        if tag in self.tags:
+            return
+
+        self.tags.add(tag)
+        if self.scene is not None:
+            self.scene._tag_added(self, tag)
+
+    def remove_tag(self, tag: str) -> None:
+        """Removes a tag from the GameObject, if it has it.
+
+        Args:
+            tag (str): The tag to remove.
+        """
+
+        if tag not in self.tags:
+            return
+
+        self.tags.discard(tag)
+        if self.scene is not None:
+            self.scene._tag_removed(self, tag)
 
     def update(self, dt: float) -> None:
         """Forward the update call to each component.
@@ -99,6 +156,19 @@ class GameObject:
         for comp in list(self._components.values()):
             comp.update(dt)
 
+    def fixed_update(self, dt: float) -> None:
+        """Forward the fixed step to each component.
+
+        Args:
+            dt (float): The length of the step in seconds.
+        """
+
+        if not self.active:
+            return
+
+        for comp in list(self._components.values()):
+            comp.fixed_update(dt)
+
     def draw(self, surface: pg.Surface) -> None:
         """Forward the draw call to each component.
 
@@ -146,7 +216,7 @@ class GameObject:
             GameObject: A new GameObject instance with the same name and components.
         """
         
-        new_object = GameObject(self.name, self.parent)
+        new_object = GameObject(self.name, self.parent, tags=self.tags)
         new_object.active = self.active
         new_object.visible = self.visible
         new_object.scene = self.scene
@@ -166,7 +236,7 @@ class GameObject:
             bool: True if the component exists, False otherwise.
         """
         
-        return ctype in self._component_map
+        return ctype in self._components
 
     def __repr__(self) -> str:
-        return f"<GameObject {self.name!r} active={self.active} visible={self.visible} components={list(self._components.keys())}>"
\ No newline at end of file
+        return f"<GameObject {self.name!r} id={self.id} active={self.active} visible={self.visible} components={list(self._components.keys())}>"
\ No newline at end of file
@@ -1,30 +1,66 @@
 import pygame as pg
 import logging
+from bisect import bisect_left, insort
+from typing import Type, TypeVar
 
 from .game import Game
 from .camera import Camera
 from .game_object import GameObject
+from .body_storage import BodyStorage
+from .spatial_hash import SpatialHash
+from .components.box_collider import BoxCollider
+from .components.component import Component
 from .components.transform import Transform
 
 
+T = TypeVar("T", bound=Component)
+
+
 class Scene:
     camera: Camera
     transparent: bool
     background_color: pg.Color
+    interpolation: float
+    body_storage: BodyStorage | None
+    spatial_hash: SpatialHash
 
     _game: Game
     _game_objects: dict[str, GameObject]
+    _by_id: dict[int, GameObject]
+    _by_tag: dict[str, dict[GameObject, None]]
+    _by_component: dict[Type[Component], dict[GameObject, Component]]
+    _render_order: list[tuple[int, int, GameObject]]
+    _render_entries: dict[GameObject, tuple[int, int, GameObject]]
+    _render_sequence: int
     
-    def __init__(self) -> None:
-        """Initialize the Scene."""
+    def __init__(self, *, body_storage: bool = False) -> None:
+        """Initialize the Scene.
+
+        Args:
+            body_storage (bool, optional): Whether the rigid bodies of the scene keep their state in
+                a `BodyStorage` and are integrated all at once every fixed step. Defaults to False.
+        """
         
         self.camera = Camera()
         self.transparent = False
         self.background_color = None
+        self.interpolation = 1.0  # how far the game is from the last fixed step to the next, set by Game.run
+        self.body_storage = BodyStorage() if body_storage else None
+        self.spatial_hash = SpatialHash()
 
         self._game = None
         self._game_objects = {}
 
+        # Indexes kept up to date on every change, so a lookup costs only what it returns
+        self._by_id = {}
+        self._by_tag = {}
+        self._by_component = {}
+
+        # Kept sorted by z-index, then by the order objects were added in, so drawing never sorts
+        self._render_order = []
+        self._render_entries = {}
+        self._render_sequence = 0
+
     def find(self, name: str) -> GameObject | None:
         """Find a GameObject by name in the scene.
 
@@ -37,6 +73,44 @@ class Scene:
         
         return self._game_objects.get(name, None)
 
+    def get(self, entity_id: int) -> GameObject | None:
+        """Find a GameObject by its entity id in the scene.
+
+        Args:
+            entity_id (int): The id of the GameObject to find.
+
+        Returns:
+            GameObject | None: The found GameObject or None if not found.
+        """
+
+        return self._by_id.get(entity_id, None)
+
+    def by_tag(self, tag: str) -> list[GameObject]:
+        """Find every GameObject with a tag in the scene, in the order they were tagged.
+
+        Args:
+            tag (str): The tag to look for.
+
+        Returns:
+            list[GameObject]: The GameObjects with the tag.
+        """
+
+        return list(self._by_tag.get(tag, ()))
+
+    def query(self, ctype: Type[T]) -> list[T]:
+        """Find every component of a type in the scene.
+
+        Like `GameObject.get_component`, only components of exactly that type are found.
+
+        Args:
+            ctype (Type[Component]): The type of the components to find.
+
+        Returns:
+            list[T]: The components, one per GameObject that has one.
+        """
+
+        return list(self._by_component.get(ctype, {}).values())
+
     def remove(self, game_object: GameObject) -> None:
         """Remove a GameObject from the scene.
 
@@ -50,7 +124,19 @@ class Scene:
         if game_object.name not in self._game_objects:
             raise ValueError(f"GameObject with name '{game_object.name}' not found in the scene")
 
-        del self._game_objects[game_object.name]
+        game_object = self._game_objects.pop(game_object.name)
+        del self._by_id[game_object.id]
+        for tag in game_object.tags:
+            self._tag_removed(game_object, tag)
+        for ctype in game_object._components:
+            self._by_component.get(ctype, {}).pop(game_object, None)
+        if self.body_storage is not None:
+            self.body_storage.remove(game_object)
+        self.spatial_hash.remove(game_object)
+
+        entry = self._render_entries.pop(game_object, None)
+        if entry is not None:
+            del self._render_order[bisect_left(self._render_order, entry)]
 
     def add(self, game_object: GameObject) -> None:
         """Add a GameObject to the scene.
@@ -67,12 +153,91 @@ class Scene:
         if game_object.name in self._game_objects:
             raise ValueError(f"GameObject with name '{game_object.name}' already exists in the scene")
 
+        if game_object.id in self._by_id:
+            raise ValueError(f"GameObject with id {game_object.id} already exists in the scene")
+
         self._game_objects[game_object.name] = game_object
+        self._by_id[game_object.id] = game_object
         game_object.scene = self
 
+        for tag in game_object.tags:
+            self._tag_added(game_object, tag)
+        for ctype, component in game_object._components.items():
+            self._by_component.setdefault(ctype, {})[game_object] = component
+
+        entry = (self._get_z_index(game_object), self._render_sequence, game_object)
+        self._render_sequence += 1
+        insort(self._render_order, entry)
+        self._render_entries[game_object] = entry
+
         for component in game_object._components.values():
             component.start()
 
+    def _component_added(self, game_object: GameObject, component: Component) -> None:
+        """Index a component added to a GameObject already in the scene."""
+
+        if self._by_id.get(game_object.id) is not game_object:
+            return
+
+        self._by_component.setdefault(type(component), {})[game_object] = component
+
+        # A Transform may change where the object is drawn
+        self._update_render_order(game_object)
+
+    def _component_removed(self, game_object: GameObject, ctype: Type[Component]) -> None:
+        """Drop a component removed from a GameObject in the scene from the index."""
+
+        if self._by_id.get(game_object.id) is not game_object:
+            return
+
+        self._by_component.get(ctype, {}).pop(game_object, None)
+        if self.body_storage is not None:
+            self.body_storage.component_removed(game_object, ctype)
+        if ctype is BoxCollider:
+            self.spatial_hash.remove(game_object)
+        self._update_render_order(game_object)
+
+    def _tag_added(self, game_object: GameObject, tag: str) -> None:
+        if self._by_id.get(game_object.id) is game_object:
+            self._by_tag.setdefault(tag, {})[game_object] = None
+
+    def _tag_removed(self, game_object: GameObject, tag: str) -> None:
+        tagged = self._by_tag.get(tag)
+        if tagged is not None:
+            tagged.pop(game_object, None)
+            if not tagged:
+                del self._by_tag[tag]
+
+    def _object_moved(self, game_object: GameObject) -> None:
+        """Note that a GameObject in the scene moved, so its collider is placed again in the spatial hash."""
+
+        self.spatial_hash.moved(game_object)
+
+    def _update_render_order(self, game_object: GameObject) -> None:
+        """Move a GameObject to its place in the render order after its z-index changed.
+
+        Args:
+            game_object (GameObject): The GameObject whose z-index may have changed.
+        """
+
+        entry = self._render_entries.get(game_object)
+        if entry is None:
+            return
+
+        z_index = self._get_z_index(game_object)
+        if z_index == entry[0]:
+            return
+
+        del self._render_order[bisect_left(self._render_order, entry)]
+        entry = (z_index, entry[1], game_object)
+        insort(self._render_order, entry)
+        self._render_entries[game_object] = entry
+
+    @staticmethod
+    def _get_z_index(game_object: GameObject) -> int:
+        transform = game_object.get_component(Transform)
+        return transform.z_index if transform else 0
+
     def start(self) -> None:
         """Called once when the scene is pushed."""
         pass
@@ -111,6 +276,22 @@ class Scene:
 
         self.handle_event(event)
 
+    def _fixed_update(self, dt: float) -> None:
+        """Advance the physics of the scene by one fixed step.
+
+        Args:
+            dt (float): The length of the step in seconds.
+        """
+
+        if self.body_storage is not None:
+            self.body_storage.integrate(dt)
+
+        for game_object in list(self._game_objects.values()):
+            game_object.fixed_update(dt)
+
+        if self.body_storage is not None:
+            self.body_storage.finish_step()
+
     def _update(self, dt: float) -> None:
         """Forward the update call to all game objects.
 
@@ -140,10 +321,5 @@ class Scene:
             else:
                 surface.fill(self.background_color)
 
-        def get_z_index(game_object: GameObject) -> int:
-            transform = game_object.get_component(Transform)
-            return transform.z_index if transform else 0
-
-        game_objects = sorted(list(self._game_objects.values()), key=get_z_index)
-        for game_object in game_objects:
+        for _, _, game_object in list(self._render_order):
             game_object.draw(surface)
@@ -0,0 +1,559 @@
+from __future__ import annotations
+
+import math
+import numpy as np
+import pygame as pg
+from dataclasses import dataclass
+from typing import Callable, Iterator, Sequence, TYPE_CHECKING
+from pygame.math import Vector2
+
+from .components.box_collider import BoxCollider
+if TYPE_CHECKING:
+    from .game_object import GameObject
+
+
+CELL_SIZE = 128  # pixels per side of a grid cell, about two players
+
+
+def segment_box_times(start: np.ndarray, delta: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Finds when each segment first enters each box, with the slab method.
+
+    Args:
+        start (np.ndarray): `(N, 2)` segment start points.
+        delta (np.ndarray): `(N, 2)` segment displacements.
+        boxes (np.ndarray): `(M, 4)` boxes as `(min x, min y, max x, max y)`.
+
+    Returns:
+        np.ndarray: `(N, M)` entry times as a fraction of the segment, `inf` where it misses.
+    """
+
+    s = start[:, None, :]
+    d = delta[:, None, :]
+    low = boxes[None, :, :2]
+    high = boxes[None, :, 2:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near = (low - s) / d
+        far = (high - s) / d
+
+    enter = np.minimum(near, far)
+    leave = np.maximum(near, far)
+
+    # A segment parallel to a slab is either inside it the whole time or never
+    parallel = d == 0
+    inside = (s >= low) & (s <= high)
+    enter = np.where(parallel, np.where(inside, -np.inf, np.inf), enter)
+    leave = np.where(parallel, np.where(inside, np.inf, -np.inf), leave)
+
+    entry = enter.max(axis=2)
+    exit_ = leave.min(axis=2)
+
+    hit = (entry <= exit_) & (entry <= 1) & (exit_ >= 0)
+    return np.where(hit, np.maximum(entry, 0), np.inf)
+
+
+@dataclass(eq=False)
+class StaticBox:
+    """A solid box that never moves, like a wall of a map, kept in the spatial hash without a GameObject.
+
+    It answers what the physics asks of a `BoxCollider` it runs into.
+    """
+
+    left: float
+    top: float
+    width: float
+    height: float
+
+    is_trigger = False
+    parent = None
+
+    def get_rect(self) -> pg.Rect:
+        """Get the box's rectangle in world space."""
+
+        return pg.Rect(self.left, self.top, self.width, self.height)
+
+
+@dataclass
+class RaycastHit:
+    """What a ray, or a box swept along a line, reached first."""
+
+    collider: BoxCollider | StaticBox
+    point: Vector2
+    distance: float
+
+
+class SpatialHash:
+    """A uniform grid of the colliders in a scene, to find them by where they are.
+
+    Every started `BoxCollider` is kept in the cells its world-space box
+    covers, and the box is cached. A collider is only placed again after
+    its object moved, which the scene is told by `Transform`, and then
+    lazily, on the next query. Queries return colliders in the order they
+    were added, like `Scene.query`, so the first one found is the same.
+
+    The grid also holds `StaticBox`es, which queries return among the
+    colliders in the order they were added too.
+
+    Boxes are `(left, top, width, height)`, and two boxes overlap when they
+    share some area: touching edges is not enough, as in `BoxCollider.collides_with`.
+    """
+
+    cell_size: float
+
+    _cells: dict[tuple[int, int], set[BoxCollider | StaticBox]]
+    _rects: dict[BoxCollider | StaticBox, tuple[float, float, float, float]]
+    _spans: dict[BoxCollider | StaticBox, tuple[int, int, int, int]]
+    _order: dict[BoxCollider | StaticBox, int]
+    _objects: dict[GameObject, BoxCollider]
+    _dirty: set[BoxCollider]
+    _nested: set[BoxCollider]
+    _sequence: int
+
+    def __init__(self, cell_size: float = CELL_SIZE) -> None:
+        """Initialize an empty grid.
+
+        Args:
+            cell_size (float, optional): The side of a cell in pixels. Defaults to 128.
+        """
+
+        self.cell_size = cell_size
+
+        self._cells = {}
+        self._rects = {}
+        self._spans = {}
+        self._order = {}
+        self._objects = {}
+        self._dirty = set()
+        # Colliders on child objects move with their ancestors, which tell nobody, so they are placed on every query
+        self._nested = set()
+        self._sequence = 0
+
+    def insert(self, collider: BoxCollider) -> None:
+        """Add a started collider, or place it again if it is in already.
+
+        Args:
+            collider (BoxCollider): The collider, whose GameObject is in the scene.
+        """
+
+        game_object = collider.parent
+        previous = self._objects.get(game_object)
+        if previous is not None and previous is not collider:
+            self.remove(game_object)
+
+        if collider not in self._order:
+            self._order[collider] = self._sequence
+            self._sequence += 1
+            self._objects[game_object] = collider
+            if game_object.parent is not None:
+                self._nested.add(collider)
+
+        self._place(collider)
+
+    def remove(self, game_object: GameObject) -> None:
+        """Remove the collider of a GameObject. Does nothing if it has none in the grid.
+
+        Args:
+            game_object (GameObject): The GameObject whose collider to remove.
+        """
+
+        collider = self._objects.pop(game_object, None)
+        if collider is None:
+            return
+
+        self._unbin(collider)
+        self._dirty.discard(collider)
+        self._nested.discard(collider)
+
+    def insert_static(self, left: float, top: float, width: float, height: float) -> StaticBox:
+        """Add a solid box that never moves.
+
+        Returns:
+            StaticBox: The box, to remove it with later.
+        """
+
+        box = StaticBox(left, top, width, height)
+        self._order[box] = self._sequence
+        self._sequence += 1
+
+        rect = (left, top, left + width, top + height)
+        self._rects[box] = rect
+        self._bin(box, self._span(*rect))
+        return box
+
+    def remove_static(self, box: StaticBox) -> None:
+        """Remove a box added with `insert_static`. Does nothing if it is not in the grid."""
+
+        if box in self._order:
+            self._unbin(box)
+
+    def moved(self, game_object: GameObject) -> None:
+        """Note that a GameObject moved, so its collider is placed again before the next query."""
+
+        collider = self._objects.get(game_object)
+        if collider is not None:
+            self._dirty.add(collider)
+
+    def update(self, collider: BoxCollider) -> None:
+        """Place a collider again after its size or offset changed."""
+
+        if collider in self._order:
+            self._dirty.add(collider)
+
+    def rect(self, collider: BoxCollider) -> tuple[float, float, float, float] | None:
+        """Get the cached world-space box of a collider, or None if it is not in the grid."""
+
+        self._flush()
+        rect = self._rects.get(collider)
+        if rect is None:
+            return None
+
+        return rect[0], rect[1], collider.width, collider.height
+
+    def overlaps(self, collider: BoxCollider, other: BoxCollider) -> bool:
+        """Check whether the cached boxes of two colliders overlap. False if either is not in the grid."""
+
+        self._flush()
+        a = self._rects.get(collider)
+        b = self._rects.get(other)
+        if a is None or b is None:
+            return False
+
+        return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+    def query_rect(self, rect: Sequence[float]) -> list[BoxCollider | StaticBox]:
+        """Find every collider whose box overlaps a box.
+
+        Args:
+            rect (Sequence[float]): The box as `(left, top, width, height)`, a `pg.Rect` works too.
+
+        Returns:
+            list[BoxCollider | StaticBox]: The colliders, in the order they were added.
+        """
+
+        self._flush()
+
+        left, top, width, height = rect
+        return self._query(left, top, left + width, top + height)
+
+    def query_boxes(
+        self,
+        rect: Sequence[float],
+        accept: Callable[[BoxCollider | StaticBox], bool] | None = None
+    ) -> tuple[list[BoxCollider | StaticBox], np.ndarray]:
+        """Find every collider whose box overlaps a box, with the boxes as an array for batched tests.
+
+        Args:
+            rect (Sequence[float]): The box as `(left, top, width, height)`, a `pg.Rect` works too.
+            accept (Callable[[BoxCollider | StaticBox], bool], optional): Which colliders to keep. Defaults to all.
+
+        Returns:
+            tuple[list[BoxCollider | StaticBox], np.ndarray]: The colliders, in the order they were added,
+            and one `(left, top, right, bottom)` row per collider.
+        """
+
+        colliders = self.query_rect(rect)
+        if accept is not None:
+            colliders = [collider for collider in colliders if accept(collider)]
+
+        boxes = np.array([self._rects[collider] for collider in colliders], dtype=np.float64).reshape(-1, 4)
+        return colliders, boxes
+
+    def _query(self, left: float, top: float, right: float, bottom: float) -> list[BoxCollider | StaticBox]:
+        found = set()
+        x0, y0, x1, y1 = span = self._span(left, top, right, bottom)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            # A box over more cells than are in use, like one around every bullet, only looks at those in use
+            for (cx, cy), members in self._cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.update(members)
+        else:
+            for cell in self._cells_of(span):
+                members = self._cells.get(cell)
+                if members:
+                    found.update(members)
+
+        rects = self._rects
+        hits = [
+            collider for collider in found
+            if (r := rects[collider])[0] < right and r[2] > left and r[1] < bottom and r[3] > top
+        ]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def query_point(self, point: Vector2 | tuple[float, float]) -> list[BoxCollider | StaticBox]:
+        """Find every collider whose box contains a point, its left and top edges included.
+
+        Args:
+            point (Vector2 | tuple[float, float]): The point in world space.
+
+        Returns:
+            list[BoxCollider | StaticBox]: The colliders, in the order they were added.
+        """
+
+        self._flush()
+
+        x, y = point
+        members = self._cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)), ())
+
+        rects = self._rects
+        hits = [
+            collider for collider in members
+            if (r := rects[collider])[0] <= x < r[2] and r[1] <= y < r[3]
+        ]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def overlapping(self, collider: BoxCollider) -> list[BoxCollider | StaticBox]:
+        """Find every other collider whose box overlaps the box of a collider.
+
+        Returns:
+            list[BoxCollider | StaticBox]: The colliders, in the order they were added, empty if the collider is not in the grid.
+        """
+
+        self._flush()
+        rect = self._rects.get(collider)
+        if rect is None:
+            return []
+
+        return [other for other in self._query(*rect) if other is not collider]
+
+    def raycast(
+        self,
+        origin: Vector2 | tuple[float, float],
+        direction: Vector2 | tuple[float, float],
+        max_distance: float,
+        accept: Callable[[BoxCollider | StaticBox], bool] | None = None
+    ) -> RaycastHit | None:
+        """Find the first collider a ray reaches, walking the grid cell by cell from its origin.
+
+        Args:
+            origin (Vector2 | tuple[float, float]): Where the ray starts, in world space.
+            direction (Vector2 | tuple[float, float]): Where the ray goes, of any length but zero.
+            max_distance (float): How far the ray reaches, in pixels. Must be finite.
+            accept (Callable[[BoxCollider | StaticBox], bool], optional): Which colliders can stop the ray. Defaults to all.
+
+        Returns:
+            RaycastHit | None: The collider reached first, where and how far, or None if nothing is in reach.
+            A collider the origin is inside of is reached at distance 0.
+
+        Raises:
+            ValueError: If the direction is zero or the distance is not finite.
+        """
+
+        if not math.isfinite(max_distance):
+            raise ValueError("The distance of a ray must be finite.")
+
+        self._flush()
+
+        x, y = origin
+        dx, dy = direction
+        length = math.hypot(dx, dy)
+        if length == 0:
+            raise ValueError("The direction of a ray cannot be zero.")
+        dx, dy = dx / length, dy / length
+
+        # Walk the cells the ray crosses in order (Amanatides & Woo), as long as one could hold a closer hit
+        size = self.cell_size
+        cx, cy = math.floor(x / size), math.floor(y / size)
+        step_x, step_y = (1 if dx > 0 else -1), (1 if dy > 0 else -1)
+        next_x = ((cx + (dx > 0)) * size - x) / dx if dx else math.inf
+        next_y = ((cy + (dy > 0)) * size - y) / dy if dy else math.inf
+        delta_x = size / abs(dx) if dx else math.inf
+        delta_y = size / abs(dy) if dy else math.inf
+
+        best = None
+        best_key = (max_distance, math.inf)
+        tested = set()
+        distance = 0.0
+        while distance <= best_key[0]:
+            for collider in self._cells.get((cx, cy), ()):
+                if collider in tested:
+                    continue
+                tested.add(collider)
+
+                if accept is not None and not accept(collider):
+                    continue
+
+                hit = self._ray_box(x, y, dx, dy, self._rects[collider])
+                if hit is not None and (key := (hit, self._order[collider])) <= best_key:
+                    best, best_key = collider, key
+
+            if next_x < next_y:
+                distance = next_x
+                next_x += delta_x
+                cx += step_x
+            else:
+                distance = next_y
+                next_y += delta_y
+                cy += step_y
+
+        if best is None:
+            return None
+
+        return RaycastHit(best, Vector2(x + dx * best_key[0], y + dy * best_key[0]), best_key[0])
+
+    def sweep(
+        self,
+        rect: Sequence[float],
+        motion: Vector2 | tuple[float, float],
+        accept: Callable[[BoxCollider | StaticBox], bool] | None = None
+    ) -> RaycastHit | None:
+        """Find the first collider a box moving in a straight line runs into, however far it moves.
+
+        Args:
+            rect (Sequence[float]): The box where it starts, as `(left, top, width, height)`.
+            motion (Vector2 | tuple[float, float]): How far the box moves.
+            accept (Callable[[BoxCollider | StaticBox], bool], optional): Which colliders can stop the box. Defaults to all.
+
+        Returns:
+            RaycastHit | None: The collider run into first, where the box's top left is when it does and
+            how far the box got, or None if the way is clear. A collider the box already overlaps is not
+            in the way, so a box can leave one it is stuck in, and one it only touches is run into at
+            distance 0 if the box moves toward it.
+        """
+
+        self._flush()
+
+        left, top, width, height = rect
+        right, bottom = left + width, top + height
+        dx, dy = motion
+
+        # Only the colliders in the box covering the whole motion can be in the way
+        candidates = self._query(
+            min(left, left + dx), min(top, top + dy),
+            max(right, right + dx), max(bottom, bottom + dy)
+        )
+
+        best = None
+        best_time = math.inf
+        for collider in candidates:
+            if accept is not None and not accept(collider):
+                continue
+
+            time = self._sweep_box(left, top, right, bottom, dx, dy, self._rects[collider])
+            if time is not None and time < best_time:
+                best, best_time = collider, time
+
+        if best is None:
+            return None
+
+        return RaycastHit(best, Vector2(left + dx * best_time, top + dy * best_time), math.hypot(dx, dy) * best_time)
+
+    @staticmethod
+    def _sweep_box(
+        left: float, top: float, right: float, bottom: float,
+        dx: float, dy: float,
+        rect: tuple[float, float, float, float]
+    ) -> float | None:
+        """The fraction of a box's motion after which it enters another box it does not overlap yet, with the slab method."""
+
+        enter, leave = -math.inf, math.inf
+        for low, high, other_low, other_high, delta in ((left, right, rect[0], rect[2], dx), (top, bottom, rect[1], rect[3], dy)):
+            if delta == 0:
+                if not (low < other_high and high > other_low):
+                    return None
+                continue
+
+            near, far = (other_low - high) / delta, (other_high - low) / delta
+            if near > far:
+                near, far = far, near
+            enter, leave = max(enter, near), min(leave, far)
+
+        if enter < 0 or enter >= leave or enter > 1:
+            return None
+
+        return enter
+
+    @staticmethod
+    def _ray_box(x: float, y: float, dx: float, dy: float, rect: tuple[float, float, float, float]) -> float | None:
+        """The distance along a ray of unit direction to where it enters a box, with the slab method."""
+
+        enter, leave = 0.0, math.inf
+        for origin, direction, low, high in ((x, dx, rect[0], rect[2]), (y, dy, rect[1], rect[3])):
+            if direction == 0:
+                if not low <= origin <= high:
+                    return None
+                continue
+
+            near, far = (low - origin) / direction, (high - origin) / direction
+            if near > far:
+                near, far = far, near
+            enter, leave = max(enter, near), min(leave, far)
+            if enter > leave:
+                return None
+
+        return enter
+
+    def _flush(self) -> None:
+        """Place every collider that moved since the last query."""
+
+        if self._nested:
+            self._dirty.update(self._nested)
+
+        if self._dirty:
+            for collider in self._dirty:
+                self._place(collider)
+            self._dirty.clear()
+
+    def _place(self, collider: BoxCollider) -> None:
+        """Cache the world-space box of a collider and move it to the cells it covers now."""
+
+        game_object = collider.parent
+        transform = collider._transform
+        if game_object.parent is None:
+            x, y = transform.x, transform.y
+        else:
+            position = transform.world_position
+            x, y = position.x, position.y
+
+        left = x + collider.offset.x
+        top = y + collider.offset.y
+        right = left + collider.width
+        bottom = top + collider.height
+        self._rects[collider] = (left, top, right, bottom)
+
+        size = self.cell_size
+        span = (math.floor(left / size), math.floor(top / size), math.floor(right / size), math.floor(bottom / size))
+        previous = self._spans.get(collider)
+        if span == previous:
+            return
+
+        if previous is not None:
+            self._unbin_cells(collider, previous)
+        self._bin(collider, span)
+
+    def _bin(self, item: BoxCollider | StaticBox, span: tuple[int, int, int, int]) -> None:
+        for cell in self._cells_of(span):
+            self._cells.setdefault(cell, set()).add(item)
+        self._spans[item] = span
+
+    def _unbin(self, item: BoxCollider | StaticBox) -> None:
+        """Take an item out of the grid entirely."""
+
+        self._unbin_cells(item, self._spans.pop(item))
+        del self._rects[item]
+        del self._order[item]
+
+    def _unbin_cells(self, item: BoxCollider | StaticBox, span: tuple[int, int, int, int]) -> None:
+        for cell in self._cells_of(span):
+            members = self._cells[cell]
+            members.discard(item)
+            if not members:
+                del self._cells[cell]
+
+    def _span(self, left: float, top: float, right: float, bottom: float) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return math.floor(left / size), math.floor(top / size), math.floor(right / size), math.floor(bottom / size)
+
+    @staticmethod
+    def _cells_of(span: tuple[int, int, int, int]) -> Iterator[tuple[int, int]]:
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __repr__(self) -> str:
+        return f"<SpatialHash colliders={len(self._order)} cells={len(self._cells)} cell_size={self.cell_size}>"
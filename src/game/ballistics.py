@@ -0,0 +1,31 @@
+import math
+import random
+
+from pygame.math import Vector2
+
+
+def muzzle_position(x: float, y: float, angle: float) -> Vector2:
+    """Returns where a bullet fired at `angle` leaves the gun held by a player standing at (x, y)."""
+
+    offset = Vector2(40, -60)
+
+    return Vector2(
+        x + offset.x * math.cos(math.radians(-angle)),
+        (y - 30) + offset.y * math.sin(math.radians(-angle))
+    )
+
+
+def burst_spread(rng: random.Random, spread: float) -> float:
+    """Returns the spread offset of the next shot of a burst.
+
+    Every client draws from a `random.Random` seeded with the burst seed, so
+    the sequence is the same for the shooter and for everyone replaying it.
+    """
+
+    return spread * rng.uniform(-1, 1)
+
+
+def hitscan_range(attributes: dict) -> float:
+    """Returns how far a shot of a hitscan gun reaches: as far as its bullet would fly in its lifetime."""
+
+    return attributes["bullet_speed"] * attributes["bullet_lifetime"]
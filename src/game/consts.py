@@ -8,7 +8,8 @@ GUN_ATTRIBUTES = {
         "damage": 5,
         "bullet_speed": 1000,
         "bullet_lifetime": 2,
-        "max_ammo": 60
+        "max_ammo": 60,
+        "hitscan": False
     },
     "pistol": {
         "automatic": False,
@@ -19,7 +20,8 @@ GUN_ATTRIBUTES = {
         "damage": 10,
         "bullet_speed": 1000,
         "bullet_lifetime": 2,
-        "max_ammo": 20
+        "max_ammo": 20,
+        "hitscan": False
     },
     "awm": {
         "automatic": False,
@@ -30,6 +32,15 @@ GUN_ATTRIBUTES = {
         "damage": 90,
         "bullet_speed": 1500,
         "bullet_lifetime": 3,
-        "max_ammo": 5
+        "max_ammo": 5,
+        "hitscan": True  # hits along a ray at once, as far as its bullet would fly, instead of firing a bullet
     }
-}
\ No newline at end of file
+}
+
+MAP_SCALE = 2.5  # how much the game maps are scaled up from their Tiled size
+PLAYER_SIZE = (30, 40)  # width and height of the player collider, anchored at its bottom center
+BULLET_SIZE = 10  # width and height of the bullet collider, anchored at its top left
+MAX_HEALTH = 100
+PLAYER_DRAG = 0.07  # drag of the player rigid body
+PLAYER_GRAVITY = 15  # gravity scale of the player rigid body
+FALL_LIMIT = 500  # a player whose y passes this has fallen off the map and goes back to a spawn point
\ No newline at end of file
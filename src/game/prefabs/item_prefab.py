@@ -6,16 +6,16 @@ from .player import PlayerPrefab
 
 
 class ItemPrefab(GameObject):
-    item_id: int = 0
+    object_id: int
 
-    def __init__(self, player: GameObject, item_type: str, x: int, y: int) -> None:
-        super().__init__(f"Gun ({item_type}) - {ItemPrefab.item_id}")
+    def __init__(self, player: GameObject, item_type: str, x: int, y: int, object_id: int) -> None:
+        # The ID comes from the server, so every client names the item the same way
+        self.object_id = object_id
+        super().__init__(f"Gun ({item_type}) - {object_id}")
 
         # Add components for the item
         self.add_component(Transform(x=x, y=y, scale=2, z_index=2))
         self.add_component(SpriteRenderer(f"assets/img/guns/{item_type}.png"))
         self.add_component(RigidBody(mass=1.0, drag=0.5, exceptions=[PlayerPrefab]))
         self.add_component(BoxCollider(is_trigger=True))
-        self.add_component(ItemController(item_type))
-
-        ItemPrefab.item_id += 1
\ No newline at end of file
+        self.add_component(ItemController(item_type, object_id))
\ No newline at end of file
@@ -7,6 +7,7 @@ from engine import (
     RigidBody,
     Canvas
 )
+from ..consts import PLAYER_SIZE, PLAYER_DRAG, PLAYER_GRAVITY
 
 
 class PlayerPrefab(GameObject):
@@ -32,7 +33,12 @@ class PlayerPrefab(GameObject):
             is_local (bool): Whether this player is the local player.
         """
 
-        super().__init__("Local Player" if is_local else f"Player ({id})")
+        # The local player keeps an id of its own, so looking up a player id only ever finds remote players
+        super().__init__(
+            "Local Player" if is_local else f"Player ({id})",
+            id=None if is_local else id,
+            tags=("player", "local_player") if is_local else ("player",)
+        )
 
         self.add_component(Transform(x=x, y=y, z_index=1, scale=5))
         self.add_component(SpriteRenderer(
@@ -41,8 +47,8 @@ class PlayerPrefab(GameObject):
             grid_size=(8, 8),
             sprite_index=character_index if character_index else (0, 0),
         ))
-        self.add_component(BoxCollider(width=30))
-        self.add_component(RigidBody(drag=0.07, gravity=15, is_kinematic=is_local))
+        self.add_component(BoxCollider(width=PLAYER_SIZE[0]))
+        self.add_component(RigidBody(drag=PLAYER_DRAG, gravity=PLAYER_GRAVITY, is_kinematic=is_local))
         
         # Add a text component for the player's name
         self.add_component(Canvas()).add(Text(
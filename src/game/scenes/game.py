@@ -1,16 +1,15 @@
 import math
 import logging
-import pygame as pg
 from typing import override
 
 from pygame.math import Vector2
 
 from engine.ui import Image, Text
-from engine import GameObject, Tilemap, Scene, Transform, Canvas, RigidBody, BoxCollider, SpriteRenderer, Game
+from engine import GameObject, Tilemap, Scene, Transform, Canvas, RigidBody, ProjectilePool, Game
 from game.prefabs import PlayerPrefab, GunPrefab, ItemPrefab
 
-from ..scripts import PlayerController, PlayerAnimation, GunController, GameLogic, VisualGunController, BulletController
-from ..consts import GUN_ATTRIBUTES
+from ..scripts import PlayerController, PlayerAnimation, GunController, GameLogic, VisualGunController, BurstController
+from ..consts import GUN_ATTRIBUTES, MAP_SCALE, BULLET_SIZE
 
 
 class GameScene(Scene):
@@ -25,7 +24,8 @@ class GameScene(Scene):
         name: str, 
         character_index: tuple[int, int],
         players: dict[int, GameObject],
-        map_name: str
+        map_name: str,
+        map_path: str = None
     ) -> None:
         super().__init__()
 
@@ -34,19 +34,27 @@ class GameScene(Scene):
         self.character_index = character_index
         self.players = players.copy()
         self.map_name = map_name
+        self.map_path = map_path or f"assets/maps/{map_name}.tmx"
 
         self.local_player: GameObject | None = None
         self.ammo_counter: Text | None = None
-        self.items: list[GameObject] = []
+        self.items: dict[int, ItemPrefab] = {}
+        self.projectiles: ProjectilePool | None = None
 
     @override
     def start(self) -> None:
         map_object = GameObject("Map")
         map_object.add_component(GameLogic())
-        map_object.add_component(Transform(x=0, y=0, scale=2.5))
-        tilemap = map_object.add_component(Tilemap(f"assets/maps/{self.map_name}.tmx", pivot="center"))
+        map_object.add_component(Transform(x=0, y=0, scale=MAP_SCALE))
+        tilemap = map_object.add_component(Tilemap(self.map_path, pivot="center"))
         self.add(map_object)
 
+        # Every bullet of every player, fired by GunController and shoot
+        bullets = GameObject("Bullets")
+        bullets.add_component(Transform(scale=2, z_index=2))
+        self.projectiles = bullets.add_component(ProjectilePool("assets/img/bullet.png", size=(BULLET_SIZE, BULLET_SIZE)))
+        self.add(bullets)
+
         ui = GameObject("UI")
         canvas = ui.add_component(Canvas())
         canvas.add(Image(
@@ -121,55 +129,83 @@ class GameScene(Scene):
             position (Vector2): The position from where the shot is fired.
         """
 
-        bullet = GameObject(f"Bullet_{player_id} {pg.time.get_ticks()}")
-        bullet.add_component(Transform(
-            x=position.x, y=position.y,
-            scale=2,
-            rotation=angle,
-            z_index=2
-        ))
-        bullet.add_component(BoxCollider(width=10, height=10, is_trigger=True))
-        bullet_rigid_body = bullet.add_component(RigidBody(gravity=0, drag=0, is_trigger=True))
-        bullet.add_component(SpriteRenderer("assets/img/bullet.png"))
-        bullet.add_component(BulletController(
-            GUN_ATTRIBUTES[gun_type]["bullet_lifetime"],
-            GUN_ATTRIBUTES[gun_type]["damage"]
-        ))
-        self.add(bullet)
+        if GUN_ATTRIBUTES[gun_type]["hitscan"]:
+            if shooter := self.get(player_id):
+                GunController.fire_hitscan(self, shooter, gun_type, angle, position)
+            return
+
+        attributes = GUN_ATTRIBUTES[gun_type]
+        velocity = Vector2(attributes["bullet_speed"], 0).rotate(angle)
+        self.projectiles.spawn(position, velocity, attributes["bullet_lifetime"], self.get(player_id))
+
+    def fire_start(self, player_id: int, gun_type: str, seed: int, start_tick: int, angle: float) -> None:
+        """Starts replaying an automatic burst fired by another player.
+
+        Args:
+            player_id (int): The unique ID of the player.
+            gun_type (str): The type of gun being used.
+            seed (int): The seed of the burst spread.
+            start_tick (int): The shooter's tick identifying the burst.
+            angle (float): The angle at which the burst started.
+        """
+
+        gun = self.find(f"Player ({player_id})'s Gun")
+        if not gun:
+            self.give_item(gun_type, player_id)
+            gun = self.find(f"Player ({player_id})'s Gun")
 
-        bullet_speed = GUN_ATTRIBUTES[gun_type]["bullet_speed"]
+        burst_controller = gun.get_component(BurstController) if gun else None
+        if not burst_controller:
+            logging.warning(f"[Game] Player {player_id} has no automatic gun to fire.")
+            return
 
-        velocity = Vector2(bullet_speed, 0).rotate(angle)
-        bullet_rigid_body.add_impulse(velocity)
+        burst_controller.start_burst(seed, start_tick, angle)
 
-    def add_gun_item(self, gun_type: str, x: int = 0, y: int = 0) -> None:
-        """Adds a gun item to the local player.
+    def fire_stop(self, player_id: int, start_tick: int, shot_count: int) -> None:
+        """Stops replaying an automatic burst fired by another player.
+
+        Args:
+            player_id (int): The unique ID of the player.
+            start_tick (int): The shooter's tick identifying the burst.
+            shot_count (int): The number of shots the shooter fired.
+        """
+
+        gun = self.find(f"Player ({player_id})'s Gun")
+        if gun and (burst_controller := gun.get_component(BurstController)):
+            burst_controller.stop_burst(start_tick, shot_count)
+
+    def add_gun_item(self, gun_type: str, object_id: int, x: int = 0, y: int = 0) -> None:
+        """Adds a gun item spawned by the server.
 
         Args:
             gun_type (str): The type of gun to add.
+            object_id (int): The ID the server gave the item.
         """
 
         if gun_type not in GUN_ATTRIBUTES:
             logging.warning(f"[Game] Gun '{gun_type}' not found.")
             return
 
-        item = ItemPrefab(self.local_player, gun_type, x=x, y=y)
-        self.items.append(item)
+        if object_id in self.items:
+            return
+
+        item = ItemPrefab(self.local_player, gun_type, x=x, y=y, object_id=object_id)
+        self.items[object_id] = item
         self.add(item)
 
     def pickup_item(self, player_id: int, gun_type: str, object_id: int) -> None:
-        """Removes an item from the scene.
+        """Removes an item from the scene and gives its gun to the player the server awarded it to.
 
         Args:
-            gun_type (str): The type of gun to remove.
+            player_id (int): The unique ID of the player who picked the item up.
+            gun_type (str): The type of gun to give.
             object_id (int): The unique identifier of the item to remove.
         """
 
-        item_name = f"Gun ({gun_type}) - {object_id}"
-        if item := self.find(item_name):
-            self.remove(item)
+        if item := self.items.pop(object_id, None):
+            item.destroy()
 
-        self.give_item(gun_type, player_id)
+        self.give_item(gun_type, None if player_id == self.player_id else player_id)
 
     def give_item(self, gun_type: str, player_id: int = None) -> None:
         """Sets the gun for the local player.
@@ -195,13 +231,15 @@ class GameScene(Scene):
                 logging.warning(f"[Game] Player {player_id} already has a gun.")
                 return
             
-            player = self.find(f"Player ({player_id})")
+            player = self.get(player_id)
             if not player:
                 logging.warning(f"[Game] Player with ID {player_id} not found.")
                 return
 
             gun = GunPrefab(player, gun_type)
             gun.add_component(VisualGunController(player))
+            if GUN_ATTRIBUTES[gun_type]["automatic"]:
+                gun.add_component(BurstController(player_id, player, gun_type))
             
         self.add(gun)
     
@@ -212,7 +250,7 @@ class GameScene(Scene):
             player_id (int): The unique ID of the player.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.get(player_id)
         if not player:
             logging.warning(f"[Game] Player with ID {player_id} not found.")
             return
@@ -224,6 +262,23 @@ class GameScene(Scene):
 
         gun.destroy()
 
+    def add_player(self, player_id: int, name: str) -> None:
+        """Adds a player that joined while the game was in progress.
+
+        Args:
+            player_id (int): The unique ID of the player.
+            name (str): The name of the player.
+        """
+
+        if player_id in self.players:
+            return
+
+        player = PlayerPrefab(player_id, name)
+        player.add_component(PlayerAnimation())
+        self.add(player)
+
+        self.players[player_id] = player
+
     def remove_player(self, player_id: int) -> None:
         """Removes a player from the lobby scene.
 
@@ -231,7 +286,7 @@ class GameScene(Scene):
             player_id (int): The unique ID of the player to remove.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.get(player_id)
         if player:
             self.remove(player)
             logging.info(f"[Game] Player with ID {player_id} removed.")
@@ -248,14 +303,21 @@ class GameScene(Scene):
             velocity (Vector2): The velocity vector of the player.
         """
 
-        player = self.find(f"Player ({player_id})")
+        # The server only sends the local player's own movement back to correct it
+        if player_id == self.player_id:
+            self.local_player.get_component(Transform).position = Vector2(position)
+            self.local_player.get_component(RigidBody).velocity = Vector2(velocity)
+            self.local_player.get_component(PlayerController).force_position_update()
+            return
+
+        player = self.get(player_id)
         if player:
             player_animation = player.get_component(PlayerAnimation)
-            player_animation.desired_position = position
+            player_animation.set_remote_state(position, velocity)
 
             rigid_body = player.get_component(RigidBody)
-            rigid_body.acceleration = acceleration
-            rigid_body.velocity = velocity
+            rigid_body.acceleration = Vector2(acceleration)
+            rigid_body.velocity = Vector2(velocity)
         else:
             logging.warning(f"[Game] Player with ID {player_id} not found.")
 
@@ -267,13 +329,56 @@ class GameScene(Scene):
             angle (float): The angle to look at.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.get(player_id)
         if player:
             player_animation = player.get_component(PlayerAnimation)
             player_animation.look_angle = angle
         else:
             logging.warning(f"[Game] Player with ID {player_id} not found.")
 
+    def player_firing(self, player_id: int, firing: bool) -> None:
+        """Updates whether a player is holding the trigger.
+
+        Args:
+            player_id (int): The unique ID of the player.
+            firing (bool): Whether the trigger is held.
+        """
+
+        player = self.get(player_id)
+        if player:
+            player_animation = player.get_component(PlayerAnimation)
+
+            # A released trigger also ends the burst, in case the fire stop packet was lost
+            gun = self.find(f"{player.name}'s Gun")
+            burst_controller = gun.get_component(BurstController) if gun else None
+            if player_animation.firing and not firing and burst_controller:
+                burst_controller.stop_burst()
+
+            player_animation.firing = firing
+
+    def player_hit(self, player_id: int, health: int, angle: float) -> None:
+        """Handles a player being hit by a bullet, as decided by the server.
+
+        Args:
+            player_id (int): The unique ID of the player hit.
+            health (int): The health the player has left.
+            angle (float): The direction the bullet was travelling, in degrees.
+        """
+
+        if player_id == self.player_id:
+            player = self.local_player
+            player.get_component(PlayerController).set_health(health)
+
+            knockback_force = 300
+            player.get_component(RigidBody).add_impulse(Vector2(knockback_force, 0).rotate(angle))
+        else:
+            player = self.get(player_id)
+            if not player:
+                logging.warning(f"[Game] Player with ID {player_id} not found.")
+                return
+
+        player.get_component(PlayerAnimation).play_hit_animation()
+
     def player_die(self, player_id: int) -> None:
         """Handles the death of a player.
 
@@ -281,5 +386,18 @@ class GameScene(Scene):
             player_id (int): The unique ID of the player.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.local_player if player_id == self.player_id else self.get(player_id)
+        if not player:
+            logging.warning(f"[Game] Player with ID {player_id} not found.")
+            return
+
+        # The server takes the gun away from a dead player, so they pick up a new one like everyone else
+        if gun := self.find(f"{player.name}'s Gun"):
+            gun.destroy()
+
+        if player_id == self.player_id:
+            if player.active:
+                player.get_component(PlayerController).die()
+            return
+
         player.active = False
\ No newline at end of file
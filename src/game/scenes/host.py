@@ -1,15 +1,28 @@
+import logging
 import pygame as pg
 from typing import override
 
 from connection.client import Client
 from connection.server import Server
+from connection.server_process import ServerProcess
 from engine import Scene, GameObject, Canvas, Game
 from engine.ui import Text, Button, InputField
 
 
+SERVER_MODE_LABELS = {
+    False: "SERVIDOR: MESMO PROCESSO",
+    True: "SERVIDOR: PROCESSO SEPARADO",
+}
+
+
 class HostMenu(Scene):
+    separate_process: bool
+    error_text: Text
+
     @override
     def start(self) -> None:
+        self.separate_process = False
+
         self.transparent = True
         self.background_color = pg.Color(0, 0, 0, 160)
 
@@ -48,6 +61,16 @@ class HostMenu(Scene):
             allowed_type=int,
         ))
 
+        # Sized for the longest label, so the button keeps its place when toggled
+        mode_button = canvas.add(Button(
+            max(SERVER_MODE_LABELS.values(), key=len),
+            x="50%", y="70%",
+            pivot="center",
+            font_size=32,
+            on_click=lambda: self.toggle_server_mode()
+        ))
+        mode_button.text = SERVER_MODE_LABELS[self.separate_process]
+
         canvas.add(Button(
             "CRIAR >",
             x="96%", y="90%",
@@ -56,6 +79,14 @@ class HostMenu(Scene):
             on_click=lambda: self.open_server()
         ))
 
+        self.error_text = canvas.add(Text(
+            "",
+            x="50%", y="80%",
+            pivot="center",
+            font_size=24,
+            color=(255, 80, 80),
+        ))
+
         canvas.add(Button(
             "< VOLTAR",
             x="5%", y="-10%",
@@ -71,6 +102,14 @@ class HostMenu(Scene):
         if event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE:
             Game.instance().pop_scene()
 
+    def toggle_server_mode(self) -> None:
+        """Switch between running the server in this process or in a child process."""
+        self.separate_process = not self.separate_process
+
+        for button in self.find("UI").get_component(Canvas).get(Button):
+            if button.text in SERVER_MODE_LABELS.values():
+                button.text = SERVER_MODE_LABELS[self.separate_process]
+
     def open_server(self) -> None:
         """Handle the server operation logic."""
         Game.instance().is_admin = True
@@ -81,8 +120,30 @@ class HostMenu(Scene):
         room_name = parent_canvas.get(InputField)[1].text
         port = parent_canvas.get(InputField)[2].value
 
+        if self.separate_process:
+            # The server keeps its own interpreter, the host's client reaches it over UDP
+            server = ServerProcess(name=room_name, port=port)
+            try:
+                server.start()
+            except RuntimeError as e:
+                logging.error(f"[HostMenu] {e}")
+                self.error_text.text = f"ERRO: {e}"
+                Game.instance().is_admin = False
+                return
+
+            Game.instance().server = server
+            Game.instance().client = Client(name=name, server_ip="localhost", server_port=port)
+            Game.instance().client.start()
+            return
+
         Game.instance().server = Server(name=room_name, port=port)
         Game.instance().server.start()
 
-        Game.instance().client = Client(name=name, server_ip="localhost", server_port=port)
+        # The host's own client skips the network and talks to the server in memory
+        Game.instance().client = Client(
+            name=name,
+            server_ip="localhost",
+            server_port=port,
+            loopback=Game.instance().server.attach_loopback()
+        )
         Game.instance().client.start()
\ No newline at end of file
@@ -6,11 +6,12 @@ import logging
 
 from game.prefabs import PlayerPrefab
 from engine import GameObject, Tilemap, Scene, Transform, Canvas, RigidBody, SpriteRenderer, Game
-from engine.ui import Image, Button
+from engine.ui import Image, Button, Text
+from connection.server_process import ServerProcess
 
 from .menu import MainMenu
 from .game import GameScene
-from ..scripts import PlayerAnimation, CharacterSelector, PlayerController
+from ..scripts import PlayerAnimation, CharacterSelector, PlayerController, ServerStatsDisplay
 
 
 class LobbyScene(Scene):
@@ -63,6 +64,17 @@ class LobbyScene(Scene):
                 on_click=self.start_game
             ))
 
+        server = Game.instance().server
+        if isinstance(server, ServerProcess):
+            stats_label = canvas.add(Text(
+                "",
+                x="96%", y="5%",
+                font_size=28,
+                color=(255, 255, 255),
+                pivot="topright",
+            ))
+            ui.add_component(ServerStatsDisplay(server.stats, stats_label))
+
         self.add(ui)
 
         self.add_character_selector(tilemap)
@@ -70,8 +82,13 @@ class LobbyScene(Scene):
         self.background_color = tilemap.background_color
         self.camera.set_target(self.local_player, smooth=True, smooth_speed=10, offset=(0, -100))
 
-    def start_game(self, map_name: str = None) -> None:
-        """Starts the game by transitioning to the GameScene."""
+    def start_game(self, map_name: str = None, map_path: str = None) -> None:
+        """Starts the game by transitioning to the GameScene.
+
+        Args:
+            map_name (str): The name of the map to play on. A random map is picked if None.
+            map_path (str): Where the map file is, if it is not one of the shipped maps.
+        """
 
         # if (len(self.players) + 1) < 2:
         #     logging.info("[Game] Not enough players to start the game.")
@@ -90,7 +107,8 @@ class LobbyScene(Scene):
             name=self.player_name, 
             character_index=character_index,
             players=self.players,
-            map_name=map_name
+            map_name=map_name,
+            map_path=map_path
         ))
 
     def add_character_selector(self, tilemap: Tilemap) -> None:
@@ -138,7 +156,7 @@ class LobbyScene(Scene):
             character_index (int): The index of the character to change to.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.get(player_id)
         if not player:
             logging.warning(f"[Game] Player with ID {player_id} not found.")
             return
@@ -173,7 +191,7 @@ class LobbyScene(Scene):
             player_id (int): The unique ID of the player to remove.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.get(player_id)
         if player:
             self.remove(player)
             logging.info(f"[LobbyScene] Player with ID {player_id} removed.")
@@ -190,14 +208,14 @@ class LobbyScene(Scene):
             velocity (Vector2): The velocity vector of the player.
         """
 
-        player = self.find(f"Player ({player_id})")
+        player = self.get(player_id)
         if player:
             player_animation = player.get_component(PlayerAnimation)
-            player_animation.desired_position = position
+            player_animation.set_remote_state(position, velocity)
 
             rigid_body = player.get_component(RigidBody)
-            rigid_body.acceleration = acceleration
-            rigid_body.velocity = velocity
+            rigid_body.acceleration = Vector2(acceleration)
+            rigid_body.velocity = Vector2(velocity)
         else:
             logging.warning(f"[LobbyScene] Player with ID {player_id} not found.")
 
@@ -5,4 +5,6 @@ from .gun_controller import GunController
 from .item_controller import ItemController
 from .game_logic import GameLogic
 from .visual_gun_controller import VisualGunController
-from .bullet_controller import BulletController
\ No newline at end of file
+from .tracer import Tracer
+from .burst_controller import BurstController
+from .server_stats_display import ServerStatsDisplay
\ No newline at end of file
@@ -0,0 +1,117 @@
+import random
+import pygame as pg
+from typing import override
+
+from engine import Component, GameObject, Transform
+
+from .player_animation import PlayerAnimation
+from .gun_controller import GunController
+from ..consts import GUN_ATTRIBUTES
+
+class BurstController(Component):
+    """Replays the automatic bursts of a remote player's gun.
+
+    The shooter only sends when the burst starts and stops, so the bullets are
+    spawned here at the gun's fire rate, aimed with the player's latest look
+    angle and spread with the same seeded sequence the shooter used.
+    """
+
+    player_id: int
+    player: GameObject
+    gun_type: str
+    fire_rate: float
+    spread: float
+
+    _rng: random.Random | None
+    _start_tick: int
+    _start_time: float
+    _shots: int
+    _shot_limit: int | None
+
+    def __init__(self, player_id: int, player: GameObject, gun_type: str) -> None:
+        super().__init__()
+
+        self.player_id = player_id
+        self.player = player
+        self.gun_type = gun_type
+        self.fire_rate = GUN_ATTRIBUTES[gun_type]["fire_rate"]
+        self.spread = GUN_ATTRIBUTES[gun_type]["spread"]
+
+        self._rng = None
+        self._start_tick = 0
+        self._start_time = 0.0
+        self._shots = 0
+        self._shot_limit = None
+
+    @property
+    def bursting(self) -> bool:
+        return self._rng is not None
+
+    def start_burst(self, seed: int, start_tick: int, angle: float) -> None:
+        """Starts replaying a burst.
+
+        Args:
+            seed (int): The seed the shooter drew the burst spread from.
+            start_tick (int): The shooter's tick identifying the burst.
+            angle (float): The shooter's look angle when the burst started.
+        """
+
+        self._rng = random.Random(seed)
+        self._start_tick = start_tick
+        self._start_time = pg.time.get_ticks() / 1000.0
+        self._shots = 0
+        self._shot_limit = None
+
+        self.player.get_component(PlayerAnimation).look_angle = angle
+
+    def stop_burst(self, start_tick: int | None = None, shot_count: int | None = None) -> None:
+        """Stops replaying a burst.
+
+        With a shot count any shots still missing are fired right away, so the
+        replay ends with exactly as many bullets as the shooter fired. Without
+        one the burst ends immediately.
+
+        Args:
+            start_tick (int | None): The tick of the burst to stop, ignored if it is not the current one.
+            shot_count (int | None): The number of shots the shooter fired.
+        """
+
+        if not self.bursting or (start_tick is not None and start_tick != self._start_tick):
+            return
+
+        if shot_count is None:
+            self._rng = None
+            return
+
+        self._shot_limit = shot_count
+        self._fire_due()
+
+    @override
+    def update(self, dt: float) -> None:
+        """Fire every shot of the burst that is due by now."""
+
+        if self.bursting:
+            self._fire_due()
+
+    def _fire_due(self) -> None:
+        elapsed = pg.time.get_ticks() / 1000.0 - self._start_time
+        due = int(elapsed / self.fire_rate) + 1
+
+        if self._shot_limit is not None:
+            due = self._shot_limit
+
+        while self._shots < due:
+            self._fire()
+
+        if self._shot_limit is not None:
+            self._rng = None
+
+    def _fire(self) -> None:
+        transform = self.player.get_component(Transform)
+        look_angle = self.player.get_component(PlayerAnimation).look_angle
+
+        angle = look_angle + GunController.burst_spread(self._rng, self.spread)
+        position = GunController.muzzle_position(transform, angle)
+
+        self.parent.scene.shoot(self.player_id, self.gun_type, angle, position)
+        self._shots += 1
@@ -25,7 +25,7 @@ class CharacterSelector(Component):
         player_collider = local_player.get_component(BoxCollider)
         box_collider = self.parent.get_component(BoxCollider)
 
-        self.hint.active = player_collider.collides_with(box_collider)
+        self.hint.active = self.parent.scene.spatial_hash.overlaps(player_collider, box_collider)
 
     @override
     def handle_event(self, event: pg.event.Event) -> None:
@@ -47,12 +47,8 @@ class GameLogic(Component):
         x, y = random.choice(spawn_points)
         position = tilemap.get_position(x, y)
         gun_type= random.choice(list(GUN_ATTRIBUTES.keys()))
-        self.parent.scene.add_gun_item(
-            gun_type= gun_type,
-            x=position[0],
-            y=position[1]
-        )
 
+        # The item shows up once the server gives it an id and sends it back
         Game.instance().client.spawn_item(
             gun_type=gun_type,
             x=position[0],
@@ -1,15 +1,15 @@
 import time
-import math
 import random
 import pygame as pg
 from typing import override
 from pygame.math import Vector2
 
-from engine import Component, GameObject, Transform, SpriteRenderer, RigidBody, BoxCollider, Game
+from engine import Component, GameObject, Scene, Transform, RigidBody, Game, RaycastHit
 from engine.ui import Text
 
 from .player_animation import PlayerAnimation
-from .bullet_controller import BulletController
+from .tracer import Tracer
+from .. import ballistics
 from ..consts import GUN_ATTRIBUTES
 
 class GunController(Component):
@@ -26,10 +26,14 @@ class GunController(Component):
     bullet_speed: float
     bullet_lifetime: float
     bullet_size: tuple[int, int]
+    hitscan: bool
     ammo_count: int
     max_ammo: int
 
     _gun_type: str
+    _burst_rng: random.Random | None
+    _burst_start_tick: int
+    _burst_shots: int
 
     def __init__(self, player_id: int, player: GameObject, ammo_counter: Text, gun_type: str) -> None:
         self._gun_type = gun_type
@@ -47,10 +51,59 @@ class GunController(Component):
         self.bullet_speed = GUN_ATTRIBUTES[gun_type]["bullet_speed"]
         self.bullet_lifetime = GUN_ATTRIBUTES[gun_type]["bullet_lifetime"]
         self.max_ammo = GUN_ATTRIBUTES[gun_type]["max_ammo"]
+        self.hitscan = GUN_ATTRIBUTES[gun_type]["hitscan"]
         self.ammo_count = self.max_ammo
 
         self._last_fire_time = 0.0
 
+        self._burst_rng = None
+        self._burst_start_tick = 0
+        self._burst_shots = 0
+
+    @staticmethod
+    def muzzle_position(transform: Transform, angle: float) -> Vector2:
+        """Returns where a bullet fired at `angle` leaves the gun held by the player at `transform`."""
+
+        return ballistics.muzzle_position(transform.x, transform.y, angle)
+
+    @staticmethod
+    def burst_spread(rng: random.Random, spread: float) -> float:
+        """Returns the spread offset of the next shot of a burst, see `ballistics.burst_spread`."""
+
+        return ballistics.burst_spread(rng, spread)
+
+    @staticmethod
+    def fire_hitscan(scene: Scene, shooter: GameObject, gun_type: str, angle: float, position: Vector2) -> RaycastHit | None:
+        """Casts the ray of a hitscan shot and leaves a tracer along it.
+
+        The ray stops at the first wall or player other than the shooter, and reaches as far as
+        `ballistics.hitscan_range`. Like a bullet it is only visual, the server decides who is hit.
+
+        Args:
+            scene (Scene): The scene the shot is fired in.
+            shooter (GameObject): The player who fired, whom the ray goes through.
+            gun_type (str): The gun the shot was fired with.
+            angle (float): The direction of the shot in degrees.
+            position (Vector2): Where the shot leaves the gun.
+
+        Returns:
+            RaycastHit | None: What the shot hit, or None if it hit nothing in reach.
+        """
+
+        reach = ballistics.hitscan_range(GUN_ATTRIBUTES[gun_type])
+        direction = Vector2(1, 0).rotate(angle)
+        hit = scene.spatial_hash.raycast(
+            position, direction, reach,
+            lambda collider: not collider.is_trigger and collider.parent is not shooter
+        )
+
+        tracer = GameObject(f"Tracer_{shooter.name} {pg.time.get_ticks()}")
+        tracer.add_component(Transform(position=Vector2(position), z_index=2))
+        tracer.add_component(Tracer(hit.point if hit else position + direction * reach))
+        scene.add(tracer)
+
+        return hit
+
     @override
     def handle_event(self, event: pg.event.Event) -> None:
         """Handle input events for firing the gun."""
@@ -79,15 +132,44 @@ class GunController(Component):
 
     def handle_automatic_fire(self, dt: float) -> None:
         """Handle automatic firing logic based on the fire rate."""
-        
-        if self.automatic and pg.mouse.get_pressed()[0]:
+
+        if not self.automatic:
+            return
+
+        pressed = pg.mouse.get_pressed()[0]
+        Game.instance().client.set_firing(pressed)
+
+        if pressed and self._burst_rng is None:
+            self.start_burst()
+        elif not pressed and self._burst_rng is not None:
+            self.stop_burst()
+
+        if self._burst_rng is not None:
             current_time = pg.time.get_ticks() / 1000.0
             if current_time - self._last_fire_time >= self.fire_rate:
                 self.fire()
-                self._last_fire_time = current_time
+
+    def start_burst(self) -> None:
+        """Starts an automatic burst and announces it to the other players."""
+
+        self._burst_rng = random.Random(seed := random.getrandbits(32))
+        self._burst_start_tick = pg.time.get_ticks()
+        self._burst_shots = 0
+
+        look_angle = self.player.get_component(PlayerAnimation).look_angle
+        Game.instance().client.fire_start(self._gun_type, seed, self._burst_start_tick, look_angle)
+
+    def stop_burst(self) -> None:
+        """Ends the current burst, telling the other players how many shots it had."""
+
+        if self._burst_rng is None:
+            return
+
+        self._burst_rng = None
+        Game.instance().client.fire_stop(self._burst_start_tick, self._burst_shots)
 
     def fire(self) -> None:
-        """Fires a bullet from the gun."""
+        """Fires a bullet from the gun, or casts a ray for a hitscan gun."""
 
         # check for cooldown
         current_time = pg.time.get_ticks() / 1000.0
@@ -101,32 +183,21 @@ class GunController(Component):
 
         transform = self.player.get_component(Transform)
 
-        window_size = pg.display.get_window_size()
-
         look_angle = self.player.get_component(PlayerAnimation).look_angle
-        spread_angle = look_angle + (self.spread * (pg.mouse.get_pos()[0] - window_size[0] // 2) / (window_size[0] // 2))
-        
-        offset = Vector2(40, -60)
-        
-        x = transform.x + offset.x * math.cos(math.radians(-spread_angle))
-        y = (transform.y - 30) + offset.y * math.sin(math.radians(-spread_angle))
-        
-        # Create a bullet GameObject
-        bullet = GameObject(f"Bullet_{self.player_id} {pg.time.get_ticks()}")
-        bullet.add_component(Transform(
-            x=x, y=y,
-            scale=2,
-            rotation=spread_angle,
-            z_index=2
-        ))
-        bullet.add_component(BoxCollider(width=10, height=10, is_trigger=True))
-        bullet_rigid_body = bullet.add_component(RigidBody(gravity=0, drag=0, is_trigger=True))
-        bullet.add_component(SpriteRenderer("assets/img/bullet.png"))
-        bullet.add_component(BulletController(self.bullet_lifetime, self.damage))
-        self.parent.scene.add(bullet)
+        if self._burst_rng is not None:
+            spread_angle = look_angle + self.burst_spread(self._burst_rng, self.spread)
+        else:
+            window_size = pg.display.get_window_size()
+            spread_angle = look_angle + (self.spread * (pg.mouse.get_pos()[0] - window_size[0] // 2) / (window_size[0] // 2))
 
+        x, y = self.muzzle_position(transform, spread_angle)
         velocity = Vector2(self.bullet_speed, 0).rotate(spread_angle)
-        bullet_rigid_body.add_impulse(velocity)
+
+        if self.hitscan:
+            # One ray instead of a bullet to simulate
+            self.fire_hitscan(self.parent.scene, self.player, self._gun_type, spread_angle, Vector2(x, y))
+        else:
+            self.parent.scene.projectiles.spawn(Vector2(x, y), velocity, self.bullet_lifetime, self.player)
 
         # Apply recoil
         rigid_body = self.player.get_component(RigidBody)
@@ -139,11 +210,15 @@ class GunController(Component):
             -random.random() * self.camera_shake
         )
 
-        Game.instance().client.shoot(
-            self._gun_type,
-            spread_angle,
-            Vector2(x, y)
-        )
+        # Shots of a burst are replayed by the other clients from the burst seed
+        if self._burst_rng is not None:
+            self._burst_shots += 1
+        else:
+            Game.instance().client.shoot(
+                self._gun_type,
+                spread_angle,
+                Vector2(x, y)
+            )
 
         # Update the last fire time
         self._last_fire_time = current_time
@@ -155,5 +230,7 @@ class GunController(Component):
     def drop(self) -> None:
         """Drops the gun item."""
         
+        self.stop_burst()
+        Game.instance().client.set_firing(False)
         self.parent.destroy()
         Game.instance().client.drop_item()
@@ -1,3 +1,4 @@
+import time
 from typing import override
 
 import pygame as pg
@@ -6,21 +7,28 @@ from engine import Component, GameObject, Transform, SpriteRenderer, Game
 from engine.core.components.box_collider import BoxCollider
 
 
+CLAIM_TIMEOUT = 2  # seconds before a claim the server did not confirm can be made again
+
 class ItemController(Component):
     """Controls the item pickup and usage logic."""
 
     item_type: str
+    object_id: int
 
     hint : GameObject
+    catched: bool
+    claimed_at: float
 
-    def __init__(self, item_type: str) -> None:
+    def __init__(self, item_type: str, object_id: int) -> None:
         """Initialize the ItemController with item type and position."""
 
         super().__init__()
 
         self.item_type = item_type
+        self.object_id = object_id
         self.hint = None
         self.catched = False
+        self.claimed_at = 0.0
 
     def start(self) -> None:
         """Initialize the item controller, setting the position of the item."""
@@ -42,6 +50,10 @@ class ItemController(Component):
     def update(self, dt: float) -> None:
         """Update the item state, checking for player interaction."""
 
+        # The item is still here, so the server turned the claim down
+        if self.catched and time.time() - self.claimed_at > CLAIM_TIMEOUT:
+            self.catched = False
+
         local_player = self.parent.scene.find("Local Player")
         if not local_player:
             return
@@ -52,7 +64,7 @@ class ItemController(Component):
         if self.hint is None or not player_collider or not box_collider:
             return
 
-        self.hint.active = player_collider.collides_with(box_collider)
+        self.hint.active = self.parent.scene.spatial_hash.overlaps(player_collider, box_collider)
 
     @override
     def handle_event(self, event: pg.event.Event) -> None:
@@ -63,21 +75,18 @@ class ItemController(Component):
             if not local_player:
                 return
 
-            if self.parent.scene.find(f"{local_player.name}'s Gun"):
+            if self.catched or self.parent.scene.find(f"{local_player.name}'s Gun"):
                 return
-        
-            # Add the item to the player's inventory
-            self.parent.scene.give_item(self.item_type)
-            self.gotten = True
-            print(f"[ItemController] {self.parent.name} picked up by {local_player.name}")
-
-            gun_type = self.item_type
-            object_id = self.parent.name.split(" - ")[-1]
-            Game.instance().client.pickup_item(
-                gun_type=gun_type,
-                object_id=int(object_id)
-            )
-
-            # Optionally, destroy the item GameObject after pickup
-            self.parent.destroy()
-            self.hint.destroy()
\ No newline at end of file
+
+            # The server decides who gets the item, the gun is given once it confirms the pickup
+            self.catched = True
+            self.claimed_at = time.time()
+            Game.instance().client.pickup_item(self.object_id)
+
+    @override
+    def destroy(self) -> None:
+        """Remove the hint along with the item."""
+
+        if self.hint is not None and self.hint.scene is not None:
+            self.hint.destroy()
+        self.hint = None
\ No newline at end of file
@@ -17,18 +17,57 @@ from engine import (
 class PlayerAnimation(Component):
     flip_x: bool
     desired_position: Vector2 | None
+    desired_velocity: Vector2
     look_angle: float
+    firing: bool
+
+    max_extrapolation: float = 0.5  # seconds a remote state is projected forward
 
     _hit_time: float
+    _desired_time: float
 
     def __init__(self) -> None:
         super().__init__()
 
         self.flip_x = False
         self.desired_position = None
+        self.desired_velocity = Vector2(0, 0)
         self.look_angle = 0.0
+        self.firing = False
 
         self._hit_time = 0
+        self._desired_time = 0.0
+
+    @staticmethod
+    def predict_position(position: Vector2, velocity: Vector2, elapsed: float) -> Vector2:
+        """Dead-reckon a position forward in time.
+
+        This is the model receivers use to place remote players between updates, so the
+        sender runs it too to know how far off the receivers' guess has drifted.
+
+        Args:
+            position (Vector2): The last known position.
+            velocity (Vector2): The last known velocity.
+            elapsed (float): Seconds since that state was sampled.
+
+        Returns:
+            Vector2: The extrapolated position.
+        """
+
+        elapsed = min(max(elapsed, 0.0), PlayerAnimation.max_extrapolation)
+        return position + velocity * elapsed
+
+    def set_remote_state(self, position: Vector2, velocity: Vector2) -> None:
+        """Store the last state received from the network for this player.
+
+        Args:
+            position (Vector2): The reported position.
+            velocity (Vector2): The reported velocity.
+        """
+
+        self.desired_position = Vector2(position)
+        self.desired_velocity = Vector2(velocity)
+        self._desired_time = pg.time.get_ticks() / 1000
 
     @override
     def update(self, dt: float) -> None:
@@ -72,12 +111,13 @@ class PlayerAnimation(Component):
         sprite_renderer.flip_x = self.flip_x
 
     def handle_desired_position(self, transform: Transform) -> None:
-        """Interpolate from the current position to the desired position."""
+        """Interpolate from the current position to the extrapolated desired position."""
         
         if self.desired_position is not None:
-            transform.position = transform.position.lerp(self.desired_position, 0.3)
-            transform.position.x = int(transform.position.x)
-            transform.position.y = int(transform.position.y)
+            elapsed = pg.time.get_ticks() / 1000 - self._desired_time
+            target = self.predict_position(self.desired_position, self.desired_velocity, elapsed)
+            position = transform.position.lerp(target, 0.3)
+            transform.position = Vector2(int(position.x), int(position.y))
 
     def handle_look_angle(self) -> None:
         """Rotate the player to face the look angle."""
@@ -111,4 +151,6 @@ class PlayerAnimation(Component):
         new_animation = PlayerAnimation()
         new_animation.flip_x = self.flip_x
         new_animation.desired_position = self.desired_position
+        new_animation.desired_velocity = self.desired_velocity.copy()
+        new_animation._desired_time = self._desired_time
         return new_animation
\ No newline at end of file
@@ -8,6 +8,7 @@ from typing import override
 
 from engine import Game, Tilemap, Transform, Component, RigidBody
 from engine.ui import Text
+from game.consts import FALL_LIMIT
 from .player_animation import PlayerAnimation
 
 class PlayerController(Component):
@@ -17,15 +18,35 @@ class PlayerController(Component):
     move_speed: float
     boost: bool
 
+    position_error_threshold: float
+    position_heartbeat: float
+
     _last_boost_time: float
     _last_position_update: Vector2
+    _last_velocity_update: Vector2
+    _last_acceleration_update: Vector2
     _last_position_update_time: float
+    _force_position_update: bool
 
     _health_text: Text
     _you_died: Text
 
     def __init__(self, health_text: Text = None, you_died: Text = None,
-                 jump_force: float = 700, move_speed: float = 1700) -> None:
+                 jump_force: float = 700, move_speed: float = 1700,
+                 position_error_threshold: float = 8, position_heartbeat: float = 1.0) -> None:
+        """Initialize the PlayerController component.
+
+        Args:
+            health_text (Text, optional): The HUD text showing the player's health. Defaults to None.
+            you_died (Text, optional): The HUD text shown when the player dies. Defaults to None.
+            jump_force (float, optional): The impulse applied when jumping. Defaults to 700.
+            move_speed (float, optional): The force applied when walking. Defaults to 1700.
+            position_error_threshold (float, optional): How far, in pixels, the receivers' dead-reckoned
+                position may drift from the real one before an update is sent. Defaults to 8.
+            position_heartbeat (float, optional): Maximum seconds between two updates, so a lost
+                packet is eventually corrected. Defaults to 1.0.
+        """
+
         super().__init__()
 
         self._health_text = health_text
@@ -35,10 +56,16 @@ class PlayerController(Component):
         self.jump_force = jump_force
         self.move_speed = move_speed
         self.boost = True
+
+        self.position_error_threshold = position_error_threshold
+        self.position_heartbeat = position_heartbeat
         
         self._last_boost_time = 0
         self._last_position_update = Vector2(0, 0)
+        self._last_velocity_update = Vector2(0, 0)
+        self._last_acceleration_update = Vector2(0, 0)
         self._last_position_update_time = 0  # Track last forced update time
+        self._force_position_update = True
 
     @override
     def start(self) -> None:
@@ -58,12 +85,19 @@ class PlayerController(Component):
         rigid_body = self.parent.get_component(RigidBody)
 
         self.handle_update_health()
-        self.handle_movement(keys, rigid_body)
-        self.handle_jump(keys, rigid_body)
         self.handle_boost(keys, rigid_body)
         self.reset_if_fallen(transform, rigid_body)
         self.handle_position_packet(transform, rigid_body)
 
+    @override
+    def fixed_update(self, dt: float) -> None:
+        # Walking is a force applied every step, and a jump must see the ground of the last step
+        keys = pg.key.get_pressed()
+        rigid_body = self.parent.get_component(RigidBody)
+
+        self.handle_movement(keys, rigid_body)
+        self.handle_jump(keys, rigid_body)
+
     def handle_update_health(self) -> None:
         """Update the health text display."""
 
@@ -79,6 +113,7 @@ class PlayerController(Component):
     def handle_jump(self, keys: pg.key.ScancodeWrapper, rigid_body: RigidBody) -> None:
         if (keys[pg.K_SPACE] or keys[pg.K_w]) and rigid_body.is_grounded:
             rigid_body.add_impulse((0, -self.jump_force))
+            self._force_position_update = True
 
     def handle_boost(self, keys: pg.key.ScancodeWrapper, rigid_body: RigidBody) -> None:
         current_time = pg.time.get_ticks() / 1000
@@ -88,15 +123,17 @@ class PlayerController(Component):
             rigid_body.add_impulse(impulse_direction * self.move_speed / 2)
             self.boost = False
             self._last_boost_time = current_time
+            self._force_position_update = True
 
         if not self.boost and rigid_body.is_grounded:
             self.boost = True
 
     def reset_if_fallen(self, transform: Transform, rigid_body: RigidBody) -> None:
-        if transform.y > 500:
+        if transform.y > FALL_LIMIT:
             self.set_random_pos()
             rigid_body.velocity = Vector2(0, 0)
             rigid_body.acceleration = Vector2(0, 0)
+            self._force_position_update = True
 
     def set_random_pos(self) -> None:
         """Initialize the PlayerController component."""
@@ -119,14 +156,32 @@ class PlayerController(Component):
         transform.position = tilemap.get_position(x, y)
 
     def handle_position_packet(self, transform: Transform, rigid_body: RigidBody) -> None:
-        """Send a position update packet if the player has moved significantly or every 0.5 seconds."""
+        """Send a position update packet when the receivers' prediction drifts too far.
+
+        Receivers extrapolate the last update with `PlayerAnimation.predict_position`. The same
+        model is run here, and a packet is only sent when the prediction is off by more than
+        `position_error_threshold`, when the input direction changes, after a discrete event
+        (jump, boost, respawn) or when `position_heartbeat` has elapsed.
+        """
 
         current_time = pg.time.get_ticks() / 1000  # seconds
-            
-        if self._last_position_update.distance_to(transform.position) > 5 or \
-            current_time - self._last_position_update_time >= 0.5:
+        elapsed = current_time - self._last_position_update_time
+
+        predicted = PlayerAnimation.predict_position(
+            self._last_position_update,
+            self._last_velocity_update,
+            elapsed
+        )
 
+        if self._force_position_update or \
+            predicted.distance_to(transform.position) > self.position_error_threshold or \
+            self._input_changed(rigid_body.acceleration) or \
+            elapsed >= self.position_heartbeat:
+
+            self._force_position_update = False
             self._last_position_update = transform.position.copy()
+            self._last_velocity_update = rigid_body.velocity.copy()
+            self._last_acceleration_update = rigid_body.acceleration.copy()
             self._last_position_update_time = current_time
 
             Game.instance().client.move(
@@ -135,29 +190,54 @@ class PlayerController(Component):
                 velocity=rigid_body.velocity
             )
 
-    def take_damage(self, damage: int) -> None:
-        """Handle damage taken by the player."""
-        
-        self.health -= damage
-        if self.health <= 0:
-            self.health = 0
-            Game.instance().client.kill_player()
+    def force_position_update(self) -> None:
+        """Send the player's position with the next update, whatever the prediction error."""
+
+        self._force_position_update = True
+
+    def _input_changed(self, acceleration: Vector2) -> bool:
+        """Check if the walking direction differs from the last one sent."""
+
+        def sign(value: float) -> int:
+            return (value > 0) - (value < 0)
+
+        return sign(acceleration.x) != sign(self._last_acceleration_update.x)
+
+    def set_health(self, health: int) -> None:
+        """Set the player's health to the value the server says it has."""
+
+        self.health = health
+
+    def die(self) -> None:
+        """Handle the death of the player, once the server has declared it."""
+
+        self.health = 0
 
-            scene = self.parent.scene
-            active_players = [p for p in scene.players.values() if p.active]
+        scene = self.parent.scene
+        active_players = [p for p in scene.players.values() if p.active]
 
-            self.parent.active = False
-            scene.camera.target = random.choice(active_players) if active_players else None
+        self.parent.active = False
+        scene.camera.target = random.choice(active_players) if active_players else None
 
+        if self._you_died:
             self._you_died.active = True
 
     @override
     def clone(self) -> PlayerController:
         """Create a copy of this PlayerController component."""
         
-        new_controller = PlayerController(self.jump_force, self.move_speed)
+        new_controller = PlayerController(
+            self._health_text,
+            self._you_died,
+            self.jump_force,
+            self.move_speed,
+            self.position_error_threshold,
+            self.position_heartbeat
+        )
         new_controller.boost = self.boost
         new_controller._last_boost_time = self._last_boost_time
         new_controller._last_position_update = self._last_position_update.copy()
+        new_controller._last_velocity_update = self._last_velocity_update.copy()
+        new_controller._last_acceleration_update = self._last_acceleration_update.copy()
         new_controller._last_position_update_time = self._last_position_update_time
         return new_controller
\ No newline at end of file
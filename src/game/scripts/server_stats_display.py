@@ -0,0 +1,24 @@
+from typing import override
+
+from engine import Component
+from engine.ui import Text
+from connection.server_process import ServerStats
+
+
+class ServerStatsDisplay(Component):
+    """Shows the numbers a server in a separate process shares with the host."""
+
+    stats: ServerStats
+    label: Text
+
+    def __init__(self, stats: ServerStats, label: Text) -> None:
+        super().__init__()
+        self.stats = stats
+        self.label = label
+
+    @override
+    def update(self, dt: float) -> None:
+        # Read straight from shared memory, the server process is never asked
+        text = f"JOGADORES: {self.stats.clients}  ESPECTADORES: {self.stats.spectators}"
+        if self.label.text != text:
+            self.label.text = text
@@ -0,0 +1,58 @@
+import time
+import pygame as pg
+from typing import override
+from pygame.math import Vector2
+
+from engine import Component, Transform
+
+
+class Tracer(Component):
+    """Draws the streak of a hitscan shot, from where its GameObject is to where the shot ended.
+
+    It thins out over its lifetime and then removes its GameObject, there is
+    nothing to simulate: the shot already hit when the tracer was made.
+    """
+
+    end: Vector2
+    lifetime: float
+    color: tuple[int, int, int]
+    width: int
+
+    def __init__(self, end: Vector2, lifetime: float = 0.15, color: tuple[int, int, int] = (255, 236, 170), width: int = 4) -> None:
+        """Initialize the Tracer component.
+
+        Args:
+            end (Vector2): Where the shot ended, in world space.
+            lifetime (float, optional): How long the tracer is shown, in seconds. Defaults to 0.15.
+            color (tuple[int, int, int], optional): The color of the streak. Defaults to a pale yellow.
+            width (int, optional): The width of the streak when it appears. Defaults to 4.
+        """
+
+        super().__init__()
+
+        self.end = Vector2(end)
+        self.lifetime = lifetime
+        self.color = color
+        self.width = width
+
+        self.start_time = time.time()
+
+    @override
+    def update(self, dt: float) -> None:
+        """Remove the tracer once its lifetime is over."""
+
+        if time.time() - self.start_time > self.lifetime:
+            self.parent.destroy()
+
+    @override
+    def draw(self, surface: pg.Surface) -> None:
+        transform = self.parent.get_component(Transform)
+        if not transform:
+            return
+
+        remaining = 1 - (time.time() - self.start_time) / self.lifetime
+        width = max(1, round(self.width * remaining))
+
+        start = transform.screen_position
+        end = self.parent.scene.camera.world_to_screen(self.end)
+        pg.draw.line(surface, self.color, start, end, width)
@@ -0,0 +1,457 @@
+"""A UDP proxy that makes localhost behave like a real network, for testing the netcode.
+
+It sits between the clients and a server and delays, drops, duplicates,
+reorders and throttles the datagrams going each way. Run it from the src
+directory and point the clients at the proxy's port instead of the server's:
+
+    python -m tools.network_proxy 5001 127.0.0.1 5000 --latency 60 --jitter 15 --loss 0.02
+
+The conditions can change during the run, either from a script:
+
+    [
+        {"at": 0, "latency": 40},
+        {"at": 10, "loss": 0.2, "direction": "down"},
+        {"at": 20, "bandwidth": 8000, "queue": 0.5}
+    ]
+
+or at random every few seconds with --randomize, bounded by the conditions
+given on the command line.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import heapq
+import random
+import socket
+import logging
+import argparse
+import threading
+from dataclasses import dataclass, field, fields, replace
+
+from connection.server import BUFFER_SIZE
+
+
+SESSION_TIMEOUT = 30  # seconds without traffic before a client's session is closed
+SWEEP_INTERVAL = 2  # seconds between two checks for idle sessions
+REORDER_HOLD = 0.03  # seconds a reordered datagram is held back, letting the next ones overtake it
+UP, DOWN = "up", "down"  # client to server, server to client
+
+
+@dataclass
+class LinkConditions:
+    latency: float = 0.0  # seconds, one way
+    jitter: float = 0.0  # seconds, added to the latency at random, up to this much
+    loss: float = 0.0  # chance a datagram is dropped
+    duplicate: float = 0.0  # chance a datagram is delivered twice
+    reorder: float = 0.0  # chance a datagram is held back and overtaken
+    bandwidth: float = 0.0  # bytes per second, 0 for no cap
+    queue: float = 1.0  # seconds of data a capped link queues before it drops
+
+    def randomized(self, rng: random.Random) -> LinkConditions:
+        """Returns conditions picked at random, each between zero and its value here."""
+
+        return LinkConditions(
+            latency=rng.uniform(0, self.latency),
+            jitter=rng.uniform(0, self.jitter),
+            loss=rng.uniform(0, self.loss),
+            duplicate=rng.uniform(0, self.duplicate),
+            reorder=rng.uniform(0, self.reorder),
+            bandwidth=rng.uniform(self.bandwidth / 4, self.bandwidth) if self.bandwidth else 0.0,
+            queue=self.queue
+        )
+
+
+@dataclass
+class LinkStats:
+    received: int = 0
+    delivered: int = 0
+    lost: int = 0
+    overflowed: int = 0
+    duplicated: int = 0
+    reordered: int = 0
+    bytes: int = 0
+    total_delay: float = 0.0
+
+    def __str__(self) -> str:
+        delay = self.total_delay / self.delivered * 1000 if self.delivered else 0.0
+        return (
+            f"received={self.received} delivered={self.delivered} lost={self.lost} "
+            f"overflowed={self.overflowed} duplicated={self.duplicated} reordered={self.reordered} "
+            f"bytes={self.bytes} delay={delay:.1f}ms"
+        )
+
+
+@dataclass(order=True)
+class Delivery:
+    time: float
+    sequence: int
+    sent: float = field(compare=False)
+    data: bytes = field(compare=False)
+    sock: socket.socket = field(compare=False)
+    addr: tuple[str, int] = field(compare=False)
+    direction: str = field(compare=False)
+
+
+class Link:
+    """One direction of the proxy, deciding when each datagram arrives, if at all."""
+
+    name: str
+    conditions: LinkConditions
+    stats: LinkStats
+
+    _rng: random.Random
+    _free_at: float
+    _last_arrival: float
+
+    def __init__(self, name: str, conditions: LinkConditions, rng: random.Random) -> None:
+        self.name = name
+        self.conditions = conditions
+        self.stats = LinkStats()
+
+        self._rng = rng
+        self._free_at = 0.0
+        self._last_arrival = 0.0
+
+    def arrivals(self, size: int, now: float) -> list[float]:
+        """Returns the times a datagram of `size` bytes sent now arrives, none if it is dropped."""
+
+        conditions = self.conditions
+        self.stats.received += 1
+
+        if self._rng.random() < conditions.loss:
+            self.stats.lost += 1
+            return []
+
+        # A capped link sends one datagram after another, and drops what would wait too long
+        departure = now
+        if conditions.bandwidth > 0:
+            start = max(self._free_at, now)
+            if start - now > conditions.queue:
+                self.stats.overflowed += 1
+                return []
+
+            self._free_at = start + size / conditions.bandwidth
+            departure = self._free_at
+
+        copies = 2 if self._rng.random() < conditions.duplicate else 1
+        if copies == 2:
+            self.stats.duplicated += 1
+
+        arrivals = []
+        for _ in range(copies):
+            arrival = departure + conditions.latency + self._rng.uniform(0, conditions.jitter)
+
+            # Jitter alone keeps the order, only a reordered datagram is overtaken
+            if self._rng.random() < conditions.reorder:
+                arrival = max(arrival, self._last_arrival) + REORDER_HOLD
+                self.stats.reordered += 1
+            else:
+                arrival = max(arrival, self._last_arrival)
+                self._last_arrival = arrival
+
+            arrivals.append(arrival)
+
+        return arrivals
+
+    def __repr__(self) -> str:
+        return f"<Link {self.name} {self.conditions}>"
+
+
+@dataclass
+class Session:
+    addr: tuple[str, int]
+    upstream: socket.socket
+    last_active: float
+
+
+class NetworkProxy:
+    """Forwards datagrams between clients and a server through two simulated links.
+
+    Every client gets its own upstream socket, so the server still sees one
+    address per client. Datagrams are never decoded: each one is given its
+    arrival times by the link of its direction and handed to a single
+    delivery thread, which sends it when the time comes.
+    """
+
+    port: int
+    upstream: tuple[str, int]
+    buffer_size: int
+    links: dict[str, Link]
+    sessions: dict[tuple[str, int], Session]
+    running: bool
+
+    sock: socket.socket
+
+    _rng: random.Random
+    _lock: threading.Lock
+    _condition: threading.Condition
+    _deliveries: list[Delivery]
+    _sequence: int
+
+    def __init__(
+        self,
+        port: int,
+        upstream_ip: str,
+        upstream_port: int,
+        up: LinkConditions | None = None,
+        down: LinkConditions | None = None,
+        seed: int | None = None,
+        buffer_size: int = BUFFER_SIZE
+    ) -> None:
+        """Initializes the proxy.
+
+        Args:
+            port (int): The port clients connect to.
+            upstream_ip (str): The IP address of the server.
+            upstream_port (int): The port of the server.
+            up (LinkConditions | None): The conditions from the clients to the server. None for a perfect link.
+            down (LinkConditions | None): The conditions from the server to the clients. None for a perfect link.
+            seed (int | None): Seeds the random decisions, so a run can be repeated.
+            buffer_size (int): The size of the buffer for receiving data.
+        """
+
+        self.port = port
+        self.upstream = (upstream_ip, upstream_port)
+        self.buffer_size = buffer_size
+        self.sessions = {}
+        self.running = False
+
+        self._rng = random.Random(seed)
+        self.links = {
+            UP: Link(UP, up or LinkConditions(), self._rng),
+            DOWN: Link(DOWN, down or LinkConditions(), self._rng)
+        }
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.settimeout(2)
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._deliveries = []
+        self._sequence = 0
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self.sock.bind(("", self.port))
+        self.running = True
+
+        threading.Thread(target=self._listen_downstream_loop, daemon=True).start()
+        threading.Thread(target=self._deliver_loop, daemon=True).start()
+        threading.Thread(target=self._close_idle_sessions_loop, daemon=True).start()
+        logging.info(f"[NetworkProxy] Forwarding port {self.port} to {self.upstream[0]}:{self.upstream[1]}.")
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+
+        self.running = False
+        with self._condition:
+            self._condition.notify()
+
+        self.sock.close()
+        for session in list(self.sessions.values()):
+            session.upstream.close()
+
+        logging.info("[NetworkProxy] Stopped.")
+        self.log_stats()
+
+    def set_conditions(self, direction: str | None = None, **changes: float) -> None:
+        """Changes some conditions of one direction, or of both if None."""
+
+        with self._lock:
+            for name in (UP, DOWN) if direction is None else (direction,):
+                link = self.links[name]
+                link.conditions = replace(link.conditions, **changes)
+                logging.info(f"[NetworkProxy] {name} is now {link.conditions}")
+
+    def log_stats(self) -> None:
+        """Logs the statistics of both directions."""
+
+        with self._lock:
+            for name, link in self.links.items():
+                logging.info(f"[NetworkProxy] {name}: {link.stats}")
+
+    def run_script(self, phases: list[dict]) -> None:
+        """Applies the phases of a script at their times, blocking until the last one.
+
+        Args:
+            phases (list[dict]): Each phase has an `at` time in seconds from now, an optional
+                `direction` (`up` or `down`, both if missing) and the conditions to change.
+        """
+
+        start = time.time()
+        for phase in sorted(phases, key=lambda phase: phase.get("at", 0)):
+            phase = dict(phase)
+            delay = start + phase.pop("at", 0) - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            if not self.running:
+                return
+
+            direction = phase.pop("direction", None)
+            self.set_conditions(direction, **{key: _to_seconds(key, value) for key, value in phase.items()})
+
+    def run_randomized(self, interval: float) -> None:
+        """Picks new random conditions for both directions every `interval` seconds, until stopped."""
+
+        limits = {name: link.conditions for name, link in self.links.items()}
+        while self.running:
+            for name, limit in limits.items():
+                with self._lock:
+                    conditions = limit.randomized(self._rng)
+                self.set_conditions(name, **{f.name: getattr(conditions, f.name) for f in fields(conditions)})
+
+            time.sleep(interval)
+
+    def _listen_downstream_loop(self) -> None:
+        while self.running:
+            try:
+                data, addr = self.sock.recvfrom(self.buffer_size)
+            except socket.timeout:
+                continue
+            except OSError:
+                if not self.running:
+                    break
+                continue
+
+            session = self.sessions.get(addr)
+            if session is None:
+                session = self._open_session(addr)
+
+            session.last_active = time.time()
+            self._queue(UP, data, session.upstream, self.upstream)
+
+    def _listen_upstream_loop(self, session: Session) -> None:
+        while self.running and self.sessions.get(session.addr) is session:
+            try:
+                data, addr = session.upstream.recvfrom(self.buffer_size)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            if addr == self.upstream:
+                self._queue(DOWN, data, self.sock, session.addr)
+
+    def _open_session(self, addr: tuple[str, int]) -> Session:
+        upstream = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        upstream.settimeout(2)
+        upstream.bind(("", 0))
+
+        session = Session(addr=addr, upstream=upstream, last_active=time.time())
+        self.sessions[addr] = session
+        threading.Thread(target=self._listen_upstream_loop, args=(session,), daemon=True).start()
+
+        logging.info(f"[NetworkProxy] Client {addr[0]}:{addr[1]} connected through port {upstream.getsockname()[1]}.")
+        return session
+
+    def _close_idle_sessions_loop(self) -> None:
+        # On its own thread, since a client that keeps sending would never let the listener time out
+        while self.running:
+            time.sleep(SWEEP_INTERVAL)
+            self._close_idle_sessions()
+
+    def _close_idle_sessions(self) -> None:
+        now = time.time()
+        for addr, session in list(self.sessions.items()):
+            if now - session.last_active > SESSION_TIMEOUT:
+                self.sessions.pop(addr, None)
+                session.upstream.close()
+                logging.info(f"[NetworkProxy] Client {addr[0]}:{addr[1]} timed out.")
+
+    def _queue(self, direction: str, data: bytes, sock: socket.socket, addr: tuple[str, int]) -> None:
+        now = time.time()
+        with self._condition:
+            for arrival in self.links[direction].arrivals(len(data), now):
+                heapq.heappush(self._deliveries, Delivery(arrival, self._sequence, now, data, sock, addr, direction))
+                self._sequence += 1
+
+            self._condition.notify()
+
+    def _deliver_loop(self) -> None:
+        while self.running:
+            with self._condition:
+                while self.running and (not self._deliveries or self._deliveries[0].time > time.time()):
+                    timeout = self._deliveries[0].time - time.time() if self._deliveries else None
+                    self._condition.wait(timeout)
+
+                if not self.running:
+                    break
+
+                delivery = heapq.heappop(self._deliveries)
+                stats = self.links[delivery.direction].stats
+                stats.delivered += 1
+                stats.bytes += len(delivery.data)
+                stats.total_delay += time.time() - delivery.sent
+
+            try:
+                delivery.sock.sendto(delivery.data, delivery.addr)
+            except OSError as e:
+                logging.warning(f"[NetworkProxy] Could not deliver to {delivery.addr[0]}:{delivery.addr[1]}: {e}")
+
+    def __repr__(self) -> str:
+        return f"<NetworkProxy port={self.port} upstream={self.upstream} sessions={len(self.sessions)} running={self.running}>"
+
+
+def _to_seconds(key: str, value: float) -> float:
+    """Scripts and the command line give times in milliseconds, the links use seconds."""
+
+    return value / 1000 if key in ("latency", "jitter") else value
+
+
+def main() -> None:
+    """Runs the proxy from the command line: python -m tools.network_proxy <port> <server ip> <server port> [options]"""
+
+    parser = argparse.ArgumentParser(description="UDP proxy that simulates network conditions.")
+    parser.add_argument("port", type=int, help="the port clients connect to")
+    parser.add_argument("server_ip", help="the IP address of the server")
+    parser.add_argument("server_port", type=int, help="the port of the server")
+    parser.add_argument("--latency", type=float, default=0, help="one way latency, in milliseconds")
+    parser.add_argument("--jitter", type=float, default=0, help="random extra latency, up to this many milliseconds")
+    parser.add_argument("--loss", type=float, default=0, help="chance a datagram is dropped")
+    parser.add_argument("--duplicate", type=float, default=0, help="chance a datagram is delivered twice")
+    parser.add_argument("--reorder", type=float, default=0, help="chance a datagram is overtaken by the next ones")
+    parser.add_argument("--bandwidth", type=float, default=0, help="bytes per second each way, 0 for no cap")
+    parser.add_argument("--queue", type=float, default=1.0, help="seconds of data a capped link queues before dropping")
+    parser.add_argument("--script", help="a JSON file with the phases to apply over time")
+    parser.add_argument("--randomize", type=float, help="pick random conditions, up to the ones given, every this many seconds")
+    parser.add_argument("--seed", type=int, help="seeds the random decisions, to repeat a run")
+    parser.add_argument("--report", type=float, default=5, help="seconds between statistics logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    conditions = LinkConditions(
+        latency=_to_seconds("latency", args.latency),
+        jitter=_to_seconds("jitter", args.jitter),
+        loss=args.loss,
+        duplicate=args.duplicate,
+        reorder=args.reorder,
+        bandwidth=args.bandwidth,
+        queue=args.queue
+    )
+
+    proxy = NetworkProxy(args.port, args.server_ip, args.server_port, conditions, replace(conditions), args.seed)
+    proxy.start()
+
+    if args.script:
+        with open(args.script) as f:
+            phases = json.load(f)
+        threading.Thread(target=proxy.run_script, args=(phases,), daemon=True).start()
+    elif args.randomize:
+        threading.Thread(target=proxy.run_randomized, args=(args.randomize,), daemon=True).start()
+
+    try:
+        while proxy.running:
+            time.sleep(args.report)
+            proxy.log_stats()
+    except KeyboardInterrupt:
+        proxy.stop()
+
+
+if __name__ == "__main__":
+    main()